@@ -0,0 +1,145 @@
+# Benchmark pytkdocs.
+#
+# Usage: python scripts/benchmark.py BENCHMARK [OPTIONS]
+# Run with `--help` to see the available benchmarks.
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable
+
+TRIVIAL_REQUEST = json.dumps({"objects": [{"path": "pytkdocs.properties"}]})
+
+
+def _report(name: str, timings: list[float]) -> None:
+    print(
+        f"{name:<32} min {min(timings) * 1000:8.2f}ms"
+        f"  median {statistics.median(timings) * 1000:8.2f}ms"
+        f"  max {max(timings) * 1000:8.2f}ms",
+    )
+
+
+def _measure(function: Callable[[], object], repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _run(command: list[str], stdin: str = "") -> None:
+    subprocess.run(command, input=stdin, text=True, check=True, capture_output=True)  # noqa: S603
+
+
+def startup(repeat: int) -> None:
+    """Measure the time it takes to run the command for trivial tasks, in new processes."""
+    command = [sys.executable, "-m", "pytkdocs"]
+    _report("python -c pass", _measure(lambda: _run([sys.executable, "-c", "pass"]), repeat))
+    _report("pytkdocs --version", _measure(lambda: _run([*command, "--version"]), repeat))
+    _report("pytkdocs (trivial request)", _measure(lambda: _run(command, TRIVIAL_REQUEST), repeat))
+
+
+class _WalkingNode:
+    # The object nodes before they were slotted: the dotted path, root and file path
+    # were computed again at each access, by walking up the parents.
+    def __init__(self, obj: object, name: str, parent: _WalkingNode | None = None) -> None:
+        self.obj = obj
+        self.name = name
+        self.parent = parent
+
+    @property
+    def dotted_path(self) -> str:
+        parts = [self.name]
+        current = self.parent
+        while current:
+            parts.append(current.name)
+            current = current.parent
+        return ".".join(reversed(parts))
+
+    @property
+    def file_path(self) -> str:
+        import inspect  # noqa: PLC0415
+
+        return inspect.getabsfile(self.root.obj)  # type: ignore[arg-type]
+
+    @property
+    def root(self) -> _WalkingNode:
+        if self.parent is not None:
+            return self.parent.root
+        return self
+
+
+def nodes(repeat: int) -> None:
+    """Measure the time it takes to create and use the nodes of classes with thousands of members."""
+    import pytkdocs.loader  # noqa: PLC0415
+    from pytkdocs.loader import Loader, ObjectNode  # noqa: PLC0415
+
+    for node_class in (_WalkingNode, ObjectNode):
+        parent = node_class(Loader, "Loader", parent=node_class(pytkdocs.loader, "pytkdocs.loader"))
+        for members in (1000, 10000):
+            names = [f"member_{index}" for index in range(members)]
+
+            def create_and_use(
+                names: list[str] = names,
+                node_class: type = node_class,
+                parent: object = parent,
+            ) -> None:
+                for name in names:
+                    # The loader reads the path and the file path of each member several times.
+                    node = node_class(name, name, parent=parent)
+                    for _ in range(3):
+                        _ = node.dotted_path, node.file_path, node.root
+
+            label = "walking" if node_class is _WalkingNode else "slotted"
+            _report(f"{label} nodes of {members} members", _measure(create_and_use, repeat))
+
+
+def classify(repeat: int) -> None:
+    """Measure the time it takes to classify the members of a class with 5000 members."""
+    from pytkdocs.loader import ObjectNode, get_object_tree  # noqa: PLC0415
+
+    def function(self: object) -> None: ...
+
+    kinds = (function, staticmethod(function), classmethod(function), property(function), 0)
+    attributes = {f"member_{index}": kinds[index % len(kinds)] for index in range(5000)}
+    class_ = type("Large", (), attributes)
+    parent = ObjectNode(class_, "Large", parent=get_object_tree("pytkdocs.loader"))
+    nodes = [ObjectNode(getattr(class_, name), name, parent=parent) for name in attributes]
+
+    def chained_checks() -> None:
+        for node in nodes:
+            _ = (
+                node.is_class()
+                or node.is_classmethod()
+                or node.is_staticmethod()
+                or node.is_method()
+                or node.is_property()
+            )
+
+    def single_pass() -> None:
+        for node in nodes:
+            node.kind()
+
+    _report("chained is_* checks", _measure(chained_checks, repeat))
+    _report("single-pass kind", _measure(single_pass, repeat))
+
+
+BENCHMARKS = {"classify": classify, "nodes": nodes, "startup": startup}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="benchmark")
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS), help="The benchmark to run.")
+    parser.add_argument("-r", "--repeat", type=int, default=20, help="How many times to repeat each measure.")
+    options = parser.parse_args()
+    BENCHMARKS[options.benchmark](options.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""This module keeps track of the caches used while loading documentation.
+
+Long-running processes (see the `--line-by-line` option and the `serve` command)
+use it to measure and clear every cache at once.
+"""
+
+from __future__ import annotations
+
+import linecache
+from typing import Callable, TypeVar
+
+_Function = TypeVar("_Function", bound=Callable)
+
+_registry: list[tuple[Callable[[], int], Callable[[], None]]] = [
+    (lambda: len(linecache.cache), linecache.clearcache),
+]
+
+
+def register(size: Callable[[], int], clear: Callable[[], None]) -> None:
+    """Register a cache.
+
+    Arguments:
+        size: A function returning the number of entries in the cache.
+        clear: A function clearing the cache.
+    """
+    _registry.append((size, clear))
+
+
+def register_lru_cache(function: _Function) -> _Function:
+    """Register a function decorated with `functools.lru_cache` or `functools.cache`.
+
+    This function can be used as a decorator.
+
+    Arguments:
+        function: The decorated function.
+
+    Returns:
+        The same function.
+    """
+    register(lambda: function.cache_info().currsize, function.cache_clear)  # type: ignore[attr-defined]
+    return function
+
+
+def size() -> int:
+    """Return the total number of entries in the registered caches.
+
+    Returns:
+        The number of entries.
+    """
+    return sum(cache_size() for cache_size, _ in _registry)
+
+
+def clear() -> None:
+    """Clear all the registered caches."""
+    for _, clear_cache in _registry:
+        clear_cache()
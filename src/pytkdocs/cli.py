@@ -13,22 +13,28 @@
 
 from __future__ import annotations
 
+# Most imports are deferred to the functions using them,
+# to keep the startup time of the command as low as possible.
+# See the `test_startup_imports` test.
 import argparse
 import json
+import os
 import sys
+import threading
 import traceback
-from contextlib import contextmanager
-from io import StringIO
-from typing import TYPE_CHECKING, Any
-
-from pytkdocs import debug
-from pytkdocs.loader import Loader
-from pytkdocs.serializer import serialize_object
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import IO, TYPE_CHECKING, Any, TypeVar
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterable, Iterator
 
+    from pytkdocs.incremental import ModuleTracker
     from pytkdocs.objects import Object
+    from pytkdocs.recycling import Recycler
+    from pytkdocs.result_cache import ResultCache
+    from pytkdocs.timings import Timings
+
+_T = TypeVar("_T")
 
 
 class _DebugInfo(argparse.Action):
@@ -36,10 +42,24 @@ class _DebugInfo(argparse.Action):
         super().__init__(nargs=nargs, **kwargs)
 
     def __call__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ARG002
+        from pytkdocs import debug  # noqa: PLC0415
+
         debug.print_debug_info()
         sys.exit(0)
 
 
+class _Version(argparse.Action):
+    # Getting the version requires reading the package metadata: only do it when asked.
+    def __init__(self, nargs: int | str | None = 0, **kwargs: Any) -> None:
+        super().__init__(nargs=nargs, **kwargs)
+
+    def __call__(self, parser: argparse.ArgumentParser, *args: Any, **kwargs: Any) -> None:  # noqa: ARG002
+        from pytkdocs import debug  # noqa: PLC0415
+
+        print(f"{parser.prog} {debug.get_version()}")
+        sys.exit(0)
+
+
 def process_config(config: dict) -> dict:
     """Process a loading configuration.
 
@@ -50,7 +70,34 @@ def process_config(config: dict) -> dict:
         "objects": [
             {"path": "python.dotted.path.to.the.object1"},
             {"path": "python.dotted.path.to.the.object2"},
-        ]
+        ],
+        "workers": 4,  # optional
+        "timings": True,  # optional
+    }
+    ```
+
+    When `workers` is greater than one, the objects are documented in parallel
+    by a pool of worker processes. Results are still returned in the original order.
+
+    When `timings` is true, the result also contains a `timings` key, with the time (in seconds)
+    spent in each phase of the process, in total and for each object
+    (see [`pytkdocs.timings`][pytkdocs.timings]):
+
+    ```python
+    {
+        "total": 0.5,
+        "phases": {
+            "import": 0.2,
+            "source": 0.1,
+            "attributes": 0.1,
+            "docstrings": 0.05,
+            "serialize": 0.05,
+            "other": 0.0,
+        },
+        "objects": [
+            {"path": "path.to.object1", "total": 0.3, "phases": {...}},
+            {"path": "path.to.object2", "total": 0.2, "phases": {...}},
+        ],
     }
     ```
 
@@ -91,27 +138,459 @@ def process_config(config: dict) -> dict:
     Returns:
         The collected documentation along with the errors that occurred.
     """
-    collected = []
-    loading_errors = []
-    parsing_errors = {}
+    paths = [obj_config["path"] for obj_config in config["objects"]]
+    collected: list[dict] = []
+    report = _Report(config)
+
+    try:
+        for serialized_obj, obj_loading_errors, obj_parsing_errors, obj_timings in iter_until_timeout(
+            iter_results(config),
+            config.get("timeout"),
+            lambda: _current_path(paths, len(collected)),
+        ):
+            report.add(obj_loading_errors, obj_parsing_errors, obj_timings)
+            collected.append(serialized_obj)
+    except RequestTimeoutError as error:
+        report.timed_out(error)
+
+    result = report.as_dict()
+    result["objects"] = collected
+    return result
+
+
+def stream_config(config: dict, *, split_modules: bool = False) -> Iterator[dict]:
+    """Process a loading configuration, yielding results as soon as they are ready.
+
+    Instead of collecting every object before returning them all at once
+    like [`process_config`][pytkdocs.cli.process_config], this function yields
+    one record per object as soon as it is serialized, and a last record with the errors
+    (and the timings, if the configuration asks for them):
 
+    ```python
+    {"object": {"path": "path.to.object1", ...}}
+    {"object": {"path": "path.to.object2", ...}}
+    {"loading_errors": [...], "parsing_errors": {...}}
+    ```
+
+    When `split_modules` is true, each module subtree is yielded in its own record:
+    objects are yielded without their submodules, and each submodule is yielded
+    (without its own submodules) in a `submodule` record, right after its parent.
+    The `children` of its parent (found with its `parent_path`) are left for the client to complete.
+    Each object is still documented as a whole before its first record is yielded:
+    only the serialized records are built one module at a time.
+    Worker processes are not used in this case.
+
+    Arguments:
+        config: The configuration.
+        split_modules: Whether to yield each module subtree separately.
+
+    Yields:
+        Objects records, then the errors record.
+    """
+    paths = [obj_config["path"] for obj_config in config["objects"]]
+    report = _Report(config)
+    done = 0
+
+    try:
+        if split_modules:
+            for record_type, record in iter_until_timeout(
+                _iter_modules_records(config),
+                config.get("timeout"),
+                lambda: _current_path(paths, done),  # noqa: B023
+            ):
+                if record_type == "done":
+                    report.add(*record)
+                    done += 1
+                else:
+                    yield {record_type: record}
+        else:
+            for serialized_obj, obj_loading_errors, obj_parsing_errors, obj_timings in iter_until_timeout(
+                iter_results(config),
+                config.get("timeout"),
+                lambda: _current_path(paths, done),  # noqa: B023
+            ):
+                report.add(obj_loading_errors, obj_parsing_errors, obj_timings)
+                done += 1
+                yield {"object": serialized_obj}
+    except RequestTimeoutError as error:
+        report.timed_out(error)
+
+    yield report.as_dict()
+
+
+def _iter_modules_records(config: dict) -> Iterator[tuple[str, Any]]:
+    from pytkdocs.serializer import iter_serialized_modules  # noqa: PLC0415
+
+    deadline = _get_deadline(config)
     for obj_config in config["objects"]:
-        path = obj_config.pop("path")
-        members = obj_config.pop("members", set())
+        path = obj_config["path"]
+        timings = _new_timings(config)
+        obj, loading_errors = load_object(obj_config, timings, deadline)
+        parsing_errors = extract_errors(obj)
+        records = iter_serialized_modules(obj)
+        record_type = "object"
+        while True:
+            with _timed(timings, "serialize"):
+                record = next(records, None)
+            if record is None:
+                break
+            yield record_type, record
+            record_type = "submodule"
+        yield "done", (loading_errors, parsing_errors, _timings_record(path, timings) if timings else None)
+
+
+def write_config(config: dict, writer: IO[bytes]) -> None:
+    """Process a loading configuration, writing the result as JSON bytes.
+
+    The result is the same as the one of [`process_config`][pytkdocs.cli.process_config],
+    except that `objects` come first, and errors last. Objects are encoded one after the other
+    with [`write_object`][pytkdocs.serializer.write_object], as soon as they are documented,
+    without building their trees of dictionaries first.
+
+    Encoded objects are kept in memory, and only written once every object is documented:
+    if documenting one of them fails, the error is raised and nothing is written.
+
+    Arguments:
+        config: The configuration.
+        writer: A binary writer.
+    """
+    import io  # noqa: PLC0415
+
+    from pytkdocs import result_cache  # noqa: PLC0415
+    from pytkdocs.serializer import encode, write_object  # noqa: PLC0415
+
+    paths = [obj_config["path"] for obj_config in config["objects"]]
+    report = _Report(config)
+    done = 0
+    final_writer, writer = writer, io.BytesIO()
+
+    writer.write(b'{"objects": [')
+    try:
+        if (config.get("workers") or 1) > 1 or config.get("timeout") or result_cache.active:
+            for serialized_obj, obj_loading_errors, obj_parsing_errors, obj_timings in iter_until_timeout(
+                iter_results(config),
+                config.get("timeout"),
+                lambda: _current_path(paths, done),  # noqa: B023
+            ):
+                if done:
+                    writer.write(b", ")
+                writer.write(encode(serialized_obj))
+                report.add(obj_loading_errors, obj_parsing_errors, obj_timings)
+                done += 1
+        else:
+            for index, obj_config in enumerate(config["objects"]):
+                timings = _new_timings(config)
+                obj, loading_errors = load_object(obj_config, timings)
+                if index:
+                    writer.write(b", ")
+                with _timed(timings, "serialize"):
+                    write_object(obj, writer)
+                obj_timings = _timings_record(paths[index], timings) if timings else None
+                report.add(loading_errors, extract_errors(obj), obj_timings)
+    except RequestTimeoutError as error:
+        report.timed_out(error)
+    writer.write(b"]")
+    for key, value in report.as_dict().items():
+        writer.write(f', "{key}": '.encode())
+        writer.write(encode(value))
+    writer.write(b"}\n")
+    final_writer.write(writer.getbuffer())
+
+
+class RequestTimeoutError(TimeoutError):
+    """Exception raised when a request takes longer than its timeout."""
+
+    def __init__(self, path: str, timeout: float) -> None:
+        """Initialize the exception.
+
+        Arguments:
+            path: The path of the object being documented when the timeout expired.
+            timeout: The timeout, in seconds.
+        """
+        super().__init__(f"Timed out after {timeout} seconds while documenting '{path}'")
+        self.path = path
+        self.timeout = timeout
+
+    def as_dict(self) -> dict:
+        """Return a JSON-serializable description of the error.
+
+        Returns:
+            The path of the object being documented, and the timeout.
+        """
+        return {"object": self.path, "timeout": self.timeout}
+
+
+def _current_path(paths: list[str], done: int) -> str | None:
+    # The path of the object being documented, or `None` once every object was documented.
+    return paths[done] if done < len(paths) else None
+
+
+def iter_until_timeout(
+    items: Iterator[_T],
+    timeout: float | None,
+    current_path: Callable[[], str | None],
+) -> Iterator[_T]:
+    """Yield items until a timeout expires.
+
+    Items are produced in a separate thread, so that we can stop waiting for them,
+    even when producing the next one is blocked (for example by an import with side effects).
+    The producing thread is then abandoned: it stops at the next check of the loader's deadline,
+    or when the blocking operation returns. When the loader reaches its deadline first,
+    its [`DeadlineError`][pytkdocs.loader.DeadlineError] is reported as the expiration of the timeout as well.
+
+    Arguments:
+        items: The items to yield.
+        timeout: The number of seconds after which to stop. No timeout if `None`.
+        current_path: A function returning the path of the object currently being documented,
+            or `None` when every object was already yielded: the timeout is then ignored,
+            since only the producer's cleanup (for example the shutdown of worker processes) remains.
+
+    Raises:
+        RequestTimeoutError: When the timeout expires.
+
+    Yields:
+        The produced items.
+    """
+    if timeout is None:
+        yield from items
+        return
+
+    import queue  # noqa: PLC0415
+    import time  # noqa: PLC0415
+
+    from pytkdocs.loader import DeadlineError  # noqa: PLC0415
+
+    produced: queue.Queue = queue.Queue()
+
+    def produce() -> None:
+        try:
+            for item in items:
+                produced.put((True, item))
+        except BaseException as error:  # noqa: BLE001
+            produced.put((False, error))
+        else:
+            produced.put((False, None))
+
+    deadline = time.monotonic() + timeout
+    threading.Thread(target=produce, daemon=True).start()
+    while True:
+        try:
+            is_item, item = produced.get(timeout=max(0, deadline - time.monotonic()))
+        except queue.Empty:
+            path = current_path()
+            if path is None:
+                return
+            raise RequestTimeoutError(path, timeout) from None
+        if is_item:
+            yield item
+        elif item is None:
+            return
+        elif isinstance(item, DeadlineError):
+            # The loader reached the same deadline before we stopped waiting.
+            path = current_path()
+            if path is None:
+                return
+            raise RequestTimeoutError(path, timeout) from item
+        else:
+            raise item
+
+
+class _Report:
+    # Errors, timings and timeout collected while processing a configuration.
+    def __init__(self, config: dict) -> None:
+        self.config = config
+        self.loading_errors: list[str] = []
+        self.parsing_errors: dict[str, list[str]] = {}
+        self.objects_timings: list[dict] = []
+        self.timeout_error: RequestTimeoutError | None = None
+
+    def add(self, loading_errors: list[str], parsing_errors: dict[str, list[str]], timings: dict | None) -> None:
+        self.loading_errors.extend(loading_errors)
+        self.parsing_errors.update(parsing_errors)
+        if timings:
+            self.objects_timings.append(timings)
+
+    def timed_out(self, error: RequestTimeoutError) -> None:
+        self.loading_errors.append(str(error))
+        self.timeout_error = error
+
+    def as_dict(self) -> dict:
+        report = {"loading_errors": self.loading_errors, "parsing_errors": self.parsing_errors}
+        if self.config.get("timings"):
+            report["timings"] = _summarize_timings(self.objects_timings)
+        if self.timeout_error:
+            report["timeout_error"] = self.timeout_error.as_dict()
+        return report
+
+
+def iter_results(config: dict) -> Iterator[tuple[dict, list[str], dict[str, list[str]], dict | None]]:
+    """Document each object of a loading configuration, in order.
+
+    Objects are documented in worker processes if the configuration asks for it,
+    and are taken from the [result cache][pytkdocs.result_cache] when it is enabled.
+
+    Arguments:
+        config: The configuration.
+
+    Yields:
+        The serialized object, the loading errors, the docstring parsing errors,
+        and the timings (if the configuration asks for them), for each object.
+    """
+    from functools import partial  # noqa: PLC0415
+
+    from pytkdocs import result_cache  # noqa: PLC0415
+
+    objects_configs = config["objects"]
+    workers = min(config.get("workers") or 1, len(objects_configs))
+    process = partial(
+        process_object_config,
+        timings=bool(config.get("timings")),
+        deadline=_get_deadline(config),
+        cache=result_cache.active,
+    )
+
+    if workers > 1:
+        import multiprocessing  # noqa: PLC0415
+        from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+        # Spawn fresh processes: forking a process that runs threads (see `process_lines`) is not safe.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_discard_worker_stdout,
+        ) as executor:
+            yield from executor.map(process, objects_configs)
+    else:
+        yield from map(process, objects_configs)
+
+
+def load_object(
+    obj_config: dict,
+    timings: Timings | None = None,
+    deadline: float | None = None,
+) -> tuple[Object, list[str]]:
+    """Load the documentation of a single object of a loading configuration.
 
-        if isinstance(members, list):
-            members = set(members)
-        loader = Loader(**obj_config)
+    The loader is taken from the [shared pool][pytkdocs.loader.loader_pool],
+    so that objects loaded with the same options reuse the same loaders.
 
+    Arguments:
+        obj_config: The object configuration: its path, its members, and the options of the loader.
+        timings: An optional accumulator measuring the time spent in each loading phase.
+        deadline: An optional deadline (in the clock of `time.monotonic`) after which the loader gives up.
+
+    Returns:
+        The documented object, and the loading errors.
+    """
+    from pytkdocs.loader import loader_pool  # noqa: PLC0415
+
+    path = obj_config.pop("path")
+    members = obj_config.pop("members", set())
+
+    if isinstance(members, list):
+        members = set(members)
+
+    with loader_pool.loader(**obj_config) as loader:
+        loader.timings = timings
+        loader.deadline = deadline
         obj = loader.get_object_documentation(path, members)
+        # Once back in the pool, the loader can be reset by another thread.
+        errors = loader.errors
+
+    return obj, errors
+
+
+def process_object_config(
+    obj_config: dict,
+    *,
+    timings: bool = False,
+    deadline: float | None = None,
+    cache: ResultCache | None = None,
+) -> tuple[dict, list[str], dict[str, list[str]], dict | None]:
+    """Document a single object of a loading configuration.
+
+    Arguments:
+        obj_config: The object configuration: its path, its members, and the options of the loader.
+        timings: Whether to measure the time spent in each phase.
+        deadline: An optional deadline (in the clock of `time.monotonic`) after which the loader gives up.
+        cache: An optional cache to get the result from, or to store it into.
+            Results with loading errors are not stored.
+
+    Returns:
+        The serialized object, the loading errors, the docstring parsing errors,
+        and the timings (if asked).
+    """
+    path = obj_config["path"]
+    obj_timings = _new_timings({"timings": timings})
+
+    key = None
+    claimed = False
+    if cache is not None:
+        from pytkdocs.result_cache import fingerprint  # noqa: PLC0415
+
+        key = fingerprint(obj_config)
+        cached = None
+        if key:
+            cached = cache.get(key)
+            if cached is None:
+                claimed = cache.claim(key)
+                if not claimed:
+                    cached = cache.wait(key, deadline)
+        if cached is not None:
+            timings_record = _timings_record(path, obj_timings) if obj_timings else None
+            return cached["object"], cached["loading_errors"], cached["parsing_errors"], timings_record
 
-        loading_errors.extend(loader.errors)
-        parsing_errors.update(extract_errors(obj))
+    from pytkdocs.serializer import serialize_object  # noqa: PLC0415
 
-        serialized_obj = serialize_object(obj)
-        collected.append(serialized_obj)
+    try:
+        obj, loading_errors = load_object(obj_config, obj_timings, deadline)
+        with _timed(obj_timings, "serialize"):
+            serialized_obj = serialize_object(obj)
+        parsing_errors = extract_errors(obj)
+        if cache is not None and key and not loading_errors:
+            cache.set(key, {"object": serialized_obj, "loading_errors": [], "parsing_errors": parsing_errors})
+    finally:
+        if cache is not None and key and claimed:
+            cache.release(key)
+    timings_record = _timings_record(path, obj_timings) if obj_timings else None
+    return serialized_obj, loading_errors, parsing_errors, timings_record
 
-    return {"loading_errors": loading_errors, "parsing_errors": parsing_errors, "objects": collected}
+
+def _new_timings(config: dict) -> Timings | None:
+    if not config.get("timings"):
+        return None
+    from pytkdocs.timings import Timings  # noqa: PLC0415
+
+    return Timings()
+
+
+def _get_deadline(config: dict) -> float | None:
+    if config.get("timeout") is None:
+        return None
+    import time  # noqa: PLC0415
+
+    return time.monotonic() + config["timeout"]
+
+
+def _timed(timings: Timings | None, phase: str) -> AbstractContextManager:
+    return nullcontext() if timings is None else timings.phase(phase)
+
+
+def _timings_record(path: str, timings: Timings) -> dict:
+    timings.stop()
+    return {"path": path, **timings.as_dict()}
+
+
+def _summarize_timings(objects_timings: list[dict]) -> dict:
+    from pytkdocs.timings import summarize  # noqa: PLC0415
+
+    return summarize(objects_timings)
+
+
+def _discard_worker_stdout() -> None:
+    # Worker processes write their results back to the main process:
+    # anything they print would end up in our JSON output.
+    sys.stdout = open(os.devnull, "w")  # noqa: SIM115
 
 
 def process_json(json_input: str) -> dict:
@@ -128,6 +607,135 @@ def process_json(json_input: str) -> dict:
     return process_config(json.loads(json_input))
 
 
+def get_request_id(line: str) -> Any:
+    """Return the identifier of a request, if any.
+
+    Arguments:
+        line: The JSON request.
+
+    Returns:
+        The value of the request's `id` key, or `None`.
+    """
+    try:
+        request = json.loads(line)
+    except ValueError:
+        return None
+    if isinstance(request, dict):
+        return request.get("id")
+    return None
+
+
+def process_line(line: str) -> str:
+    """Process one line of JSON input and return one line of JSON output.
+
+    Errors are not raised: they are returned as a JSON object with `error` and `traceback` keys,
+    so that the caller can keep on handling the next inputs.
+    If the request has an `id`, it is echoed in the output.
+
+    Arguments:
+        line: The JSON to load.
+
+    Returns:
+        The JSON-serialized result of the call to [`process_json`][pytkdocs.cli.process_json], or the error.
+    """
+    request_id = get_request_id(line)
+    try:
+        output = process_json(line)
+    except Exception as error:  # noqa: BLE001
+        # Don't fail on error. We must handle the next inputs.
+        # Instead, print error as JSON.
+        output = {"error": str(error), "traceback": traceback.format_exc()}
+    if request_id is not None:
+        output["id"] = request_id
+    return json.dumps(output)
+
+
+def stream_line(line: str, *, split_modules: bool = False) -> Iterator[str]:
+    """Process one line of JSON input and return lines of JSON output, as soon as they are ready.
+
+    See [`stream_config`][pytkdocs.cli.stream_config] for the format of the output records.
+    Errors are not raised: they are returned as a last record with `error` and `traceback` keys.
+    If the request has an `id`, it is echoed in each record.
+
+    Arguments:
+        line: The JSON to load.
+        split_modules: Whether to yield each module subtree separately.
+
+    Yields:
+        JSON-serialized records.
+    """
+    request_id = get_request_id(line)
+    try:
+        for record in stream_config(json.loads(line), split_modules=split_modules):
+            if request_id is not None:
+                record["id"] = request_id
+            yield json.dumps(record)
+    except Exception as error:  # noqa: BLE001
+        record = {"error": str(error), "traceback": traceback.format_exc()}
+        if request_id is not None:
+            record["id"] = request_id
+        yield json.dumps(record)
+
+
+def process_lines(
+    lines: Iterable[str],
+    output: IO[str],
+    jobs: int = 1,
+    stream: str | None = None,
+    recycler: Recycler | None = None,
+    *,
+    tracker: ModuleTracker | None = None,
+) -> None:
+    """Process lines of JSON input, writing one line of JSON output for each.
+
+    Requests without an `id` are processed one after the other, in order.
+    Requests with an `id` are processed concurrently by a pool of `jobs` workers,
+    and their results are written as soon as they are ready, possibly out of order:
+    clients match results to requests thanks to the `id` echoed in each result.
+
+    Arguments:
+        lines: The lines of JSON to process.
+        output: Where to write the results.
+        jobs: The maximum number of requests processed concurrently.
+        stream: Whether to stream results, and how: `"objects"` or `"modules"`.
+            See [`stream_config`][pytkdocs.cli.stream_config].
+        recycler: A recycler, to check limits after each request, and recycle the process
+            once the requests being processed are done.
+        tracker: A module tracker, to drop the modules that changed before each request,
+            for them to be documented again.
+    """
+    from concurrent.futures import Future, ThreadPoolExecutor, wait  # noqa: PLC0415
+
+    lock = threading.Lock()
+
+    def write(line: str) -> None:
+        with lock:
+            print(line, file=output, flush=True)
+
+    def process_and_write(line: str) -> None:
+        with nullcontext() if tracker is None else tracker.request():
+            if stream:
+                for output_line in stream_line(line, split_modules=stream == "modules"):
+                    write(output_line)
+            else:
+                write(process_line(line))
+
+    pending: set[Future] = set()
+    with discarded_stdout(), ThreadPoolExecutor(max_workers=jobs) as executor:
+        for line in lines:
+            if get_request_id(line) is None:
+                process_and_write(line)
+            else:
+                future = executor.submit(process_and_write, line)
+                pending.add(future)
+                future.add_done_callback(pending.discard)
+            if recycler is not None:
+                reason = recycler.count_request()
+                if reason:
+                    wait(pending.copy())
+                    recycler.recycle(reason)
+
+
 def extract_docstring_parsing_errors(errors: dict, obj: Object) -> None:
     """Recursion helper.
 
@@ -171,8 +779,97 @@ def get_parser() -> argparse.ArgumentParser:
         dest="line_by_line",
         help="Process each line read on stdin, one by one.",
     )
-    parser.add_argument("-V", "--version", action="version", version=f"%(prog)s {debug.get_version()}")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=4,
+        help="In line-by-line mode, the number of requests with an 'id' processed concurrently. Default: 4.",
+    )
+    parser.add_argument(
+        "--stream",
+        nargs="?",
+        const="objects",
+        choices=["objects", "modules"],
+        help="Write each object as soon as it is ready, as a line of JSON, followed by a line with the errors. "
+        "With '--stream=modules', each module subtree is written separately.",
+    )
+    parser.add_argument(
+        "--max-requests",
+        type=int,
+        metavar="N",
+        help="In line-by-line mode, replace the process with a fresh one after N requests.",
+    )
+    parser.add_argument(
+        "--max-rss",
+        type=int,
+        metavar="MB",
+        help="In line-by-line mode, replace the process with a fresh one when it uses more than MB megabytes.",
+    )
+    parser.add_argument(
+        "--max-cache-entries",
+        type=int,
+        metavar="N",
+        help="In line-by-line mode, clear the caches when they contain more than N entries.",
+    )
+    parser.add_argument(
+        "--fork",
+        action="store_true",
+        help="In line-by-line mode, process each request in a forked child process, one after the other. "
+        "Memory used by a request is given back when its child exits. Only available on POSIX systems.",
+    )
+    parser.add_argument(
+        "--preload",
+        action="append",
+        default=[],
+        metavar="MODULE",
+        help="Import a module before processing requests. Can be used multiple times. "
+        "Most useful with '--fork' or the 'serve' command, to share warm imports between requests.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        metavar="DIR",
+        help="Store results in this directory, and reuse them as long as the source files "
+        "of the documented packages and the options do not change.",
+    )
+    parser.add_argument(
+        "--cache-db",
+        metavar="FILE",
+        help="Like '--cache-dir', but store results in an SQLite database, "
+        "which concurrent processes can share, computing each result once.",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        metavar="MB",
+        help="With '--cache-dir' or '--cache-db', remove the least recently used results "
+        "when they use more than MB megabytes.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="In line-by-line mode or with the 'serve' command, import again the modules whose source files changed, "
+        "and document again only them, reusing the documentation of unchanged modules.",
+    )
+    parser.add_argument("-V", "--version", action=_Version, help="Show program's version number and exit.")
     parser.add_argument("--debug-info", action=_DebugInfo, help="Print debug information.")
+
+    subparsers = parser.add_subparsers(dest="command", title="commands", metavar="")
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Serve requests on a Unix socket.",
+        description="Accept concurrent connections on a Unix socket, "
+        "each connection sending and receiving lines of JSON like in line-by-line mode. "
+        "Imported modules and caches are shared between all clients.",
+    )
+    serve_parser.add_argument(
+        "-s",
+        "--socket",
+        required=True,
+        dest="socket_path",
+        metavar="PATH",
+        help="The path of the Unix socket to listen on.",
+    )
     return parser
 
 
@@ -186,13 +883,14 @@ def discarded_stdout() -> Iterator[None]:
     # Discard things printed at import time to avoid corrupting our JSON output
     # See https://github.com/pawamoy/pytkdocs/issues/24
     old_stdout = sys.stdout
-    sys.stdout = StringIO()
-
-    yield
-
-    # Flush imported modules' output, and restore true sys.stdout
-    sys.stdout.flush()
-    sys.stdout = old_stdout
+    with open(os.devnull, "w") as devnull:
+        sys.stdout = devnull
+        try:
+            yield
+        finally:
+            # Flush imported modules' output, and restore true sys.stdout
+            sys.stdout.flush()
+            sys.stdout = old_stdout
 
 
 def main(args: list[str] | None = None) -> int:
@@ -209,19 +907,73 @@ def main(args: list[str] | None = None) -> int:
     parser = get_parser()
     parsed_args: argparse.Namespace = parser.parse_args(args)
 
-    if parsed_args.line_by_line:
-        for line in sys.stdin:
-            with discarded_stdout():
-                try:
-                    output = json.dumps(process_json(line))
-                except Exception as error:  # noqa: BLE001
-                    # Don't fail on error. We must handle the next inputs.
-                    # Instead, print error as JSON.
-                    output = json.dumps({"error": str(error), "traceback": traceback.format_exc()})
-            print(output)
+    if parsed_args.cache_dir and parsed_args.cache_db:
+        parser.error("--cache-dir and --cache-db cannot be used together")
+    if parsed_args.cache_dir or parsed_args.cache_db:
+        from pytkdocs import result_cache  # noqa: PLC0415
+
+        max_cache_size = parsed_args.cache_size and parsed_args.cache_size * 1024 * 1024
+        if parsed_args.cache_db:
+            result_cache.active = result_cache.SQLiteCache(parsed_args.cache_db, max_size=max_cache_size)
+        else:
+            result_cache.active = result_cache.DirectoryCache(parsed_args.cache_dir, max_size=max_cache_size)
+
+    if parsed_args.fork or parsed_args.preload:
+        from pytkdocs import forkserver  # noqa: PLC0415
+
+        if parsed_args.fork and not forkserver.fork_available():
+            parser.error("--fork is not available on this platform")
+        if parsed_args.fork and parsed_args.stream:
+            parser.error("--fork cannot be used with --stream")
+        for error in forkserver.preload(parsed_args.preload):
+            print(error, file=sys.stderr)
+
+    tracker = None
+    if parsed_args.incremental:
+        if parsed_args.fork:
+            parser.error("--incremental cannot be used with --fork")
+        from pytkdocs.incremental import ModuleTracker  # noqa: PLC0415
+        from pytkdocs.loader import loader_pool  # noqa: PLC0415
+
+        tracker = ModuleTracker()
+        loader_pool.reuse_submodules = True
+
+    if parsed_args.command == "serve":
+        from pytkdocs.server import serve  # noqa: PLC0415
+
+        serve(parsed_args.socket_path, tracker)
+    elif parsed_args.line_by_line and parsed_args.fork:
+        forkserver.process_lines_in_children(sys.stdin, sys.stdout)
+    elif parsed_args.line_by_line:
+        lines: Iterable[str] = sys.stdin
+        recycler = None
+        if parsed_args.max_requests or parsed_args.max_rss or parsed_args.max_cache_entries:
+            from pytkdocs.recycling import Limits, Recycler, read_lines  # noqa: PLC0415
+
+            limits = Limits(
+                max_requests=parsed_args.max_requests,
+                max_rss=parsed_args.max_rss and parsed_args.max_rss * 1024 * 1024,
+                max_cache_entries=parsed_args.max_cache_entries,
+            )
+            # Replacing the process is only safe if we don't read ahead of the current request.
+            lines = read_lines(sys.stdin)
+            argv = sys.argv[1:] if args is None else args
+            recycler = Recycler(limits, argv=argv if hasattr(sys.stdin, "buffer") else None)
+        process_lines(lines, sys.stdout, parsed_args.jobs, parsed_args.stream, recycler, tracker=tracker)
+    elif parsed_args.stream:
+        output = sys.stdout
+        with discarded_stdout():
+            for line in stream_line(sys.stdin.read(), split_modules=parsed_args.stream == "modules"):
+                print(line, file=output, flush=True)
     else:
+        output = sys.stdout
         with discarded_stdout():
-            output = json.dumps(process_json(sys.stdin.read()))
-        print(output)
+            json_input = sys.stdin.read()
+            if hasattr(output, "buffer"):
+                output.flush()
+                write_config(json.loads(json_input), output.buffer)
+                output.buffer.flush()
+            else:
+                print(json.dumps(process_json(json_input)), file=output)
 
     return 0
@@ -0,0 +1,103 @@
+"""This module contains the fork-server mode.
+
+In this mode, the main process imports a list of packages once,
+then forks a child process to handle each request.
+Children start with the packages already imported (pages are shared copy-on-write),
+so requests stay fast, while everything a request imports or allocates
+is given back to the system when its child exits.
+A request crashing or corrupting its process cannot affect the next ones either.
+
+Forking is only available on POSIX systems.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import traceback
+from typing import IO, TYPE_CHECKING
+
+from pytkdocs.cli import discarded_stdout, get_request_id, process_line
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+def preload(modules: Iterable[str]) -> list[str]:
+    """Import modules so that forked children don't have to.
+
+    Arguments:
+        modules: The dotted paths of the modules to import.
+
+    Returns:
+        The errors that occurred while importing.
+    """
+    errors = []
+    with discarded_stdout():
+        for module in modules:
+            try:
+                importlib.import_module(module)
+            except Exception as error:  # noqa: BLE001
+                errors.append(f"Could not preload '{module}': {error}")
+    return errors
+
+
+def process_line_in_child(line: str) -> str:
+    """Process one line of JSON input in a forked child process.
+
+    Arguments:
+        line: The JSON to load.
+
+    Returns:
+        The result returned by the child, or an error if the child died unexpectedly.
+    """
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+
+    if pid == 0:  # pragma: no cover (child process)
+        os.close(read_fd)
+        exit_code = 0
+        try:
+            with os.fdopen(write_fd, "wb") as pipe:
+                pipe.write(process_line(line).encode("utf8"))
+        except BaseException:  # noqa: BLE001
+            traceback.print_exc()
+            exit_code = 1
+        os._exit(exit_code)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as pipe:
+        output = pipe.read()
+    _, status = os.waitpid(pid, 0)
+    exit_code = os.waitstatus_to_exitcode(status)
+
+    if exit_code == 0 and output:
+        return output.decode("utf8")
+
+    error = {"error": f"Worker process exited with code {exit_code}", "traceback": ""}
+    request_id = get_request_id(line)
+    if request_id is not None:
+        error["id"] = request_id
+    return json.dumps(error)
+
+
+def process_lines_in_children(lines: Iterable[str], output: IO[str]) -> None:
+    """Process lines of JSON input, each in its own child process.
+
+    Arguments:
+        lines: The lines of JSON to process.
+        output: Where to write the results.
+    """
+    with discarded_stdout():
+        for line in lines:
+            print(process_line_in_child(line), file=output, flush=True)
+
+
+def fork_available() -> bool:
+    """Tell whether the fork-server mode is available on this platform.
+
+    Returns:
+        True if processes can be forked.
+    """
+    return hasattr(os, "fork")
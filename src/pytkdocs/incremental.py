@@ -0,0 +1,226 @@
+"""This module contains utilities to document packages again, incrementally, in long-running processes.
+
+A long-running process (see the `--line-by-line` option and the `serve` command) imports modules once,
+and keeps them for as long as it runs: when their source files change, their documentation goes stale.
+With the `--incremental` option:
+
+- a [`ModuleTracker`][pytkdocs.incremental.ModuleTracker] checks the source files of the imported modules
+  before each request, and drops the modules whose contents changed (and the modules using them)
+  from `sys.modules`, so that they are imported again;
+- loaders keep the documentation of each submodule in a [`SubtreeCache`][pytkdocs.incremental.SubtreeCache],
+  and reuse it as long as its modules were not dropped nor changed.
+
+Documenting a package again then only imports and documents the modules that changed.
+Caches keyed by objects (like the ones of [`pytkdocs.parsers.attributes`][pytkdocs.parsers.attributes])
+are not hit anymore for the objects of dropped modules, since importing them again creates new objects.
+"""
+
+from __future__ import annotations
+
+import linecache
+import os
+import sys
+import sysconfig
+import threading
+from contextlib import contextmanager
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+from pytkdocs.result_cache import file_digest
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pytkdocs.objects import Module
+
+
+def _signature(filename: str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _source_file(module: ModuleType) -> str | None:
+    filename = getattr(module, "__file__", None)
+    if isinstance(filename, str) and filename.endswith(".py"):
+        return filename
+    return None
+
+
+class ModuleTracker:
+    """Track the source files of imported modules, and drop the modules whose files changed.
+
+    Modules of the standard library are not tracked.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the object, tracking the modules imported so far."""
+        self._files: dict[str, tuple[str, tuple[int, int] | None, str | None]] = {}
+        self._stdlib = tuple(
+            os.path.normcase(os.path.abspath(sysconfig.get_paths()[name])) + os.sep for name in ("stdlib", "platstdlib")
+        )
+        self._condition = threading.Condition()
+        self._active = 0
+        self.track_new_modules()
+
+    def track_new_modules(self) -> None:
+        """Start tracking the modules imported since the last call."""
+        for name, module in list(sys.modules.items()):
+            if name in self._files or not isinstance(module, ModuleType):
+                continue
+            filename = _source_file(module)
+            if filename is None or os.path.normcase(os.path.abspath(filename)).startswith(self._stdlib):
+                continue
+            self._files[name] = (filename, _signature(filename), file_digest(filename))
+
+    def find_changes(self) -> set[str]:
+        """Find the tracked modules whose source files changed.
+
+        Files are hashed again only when their modification time or size changed.
+
+        Returns:
+            The names of the changed modules.
+        """
+        changed = set()
+        for name, (filename, signature, digest) in list(self._files.items()):
+            new_signature = _signature(filename)
+            if new_signature == signature:
+                continue
+            new_digest = file_digest(filename) if new_signature else None
+            if new_digest is not None and new_digest == digest:
+                self._files[name] = (filename, new_signature, digest)
+            else:
+                changed.add(name)
+        return changed
+
+    def drop(self, names: set[str]) -> set[str]:
+        """Drop modules from `sys.modules`, with their submodules, and the modules using them.
+
+        A module uses another one when one of its global variables is this other module
+        (unless it is one of its submodules), or an object defined in this other module.
+
+        Arguments:
+            names: The names of the modules to drop.
+
+        Returns:
+            The names of all the dropped modules.
+        """
+        dropped = set(names)
+        while True:
+            new = set()
+            for name in self._files.keys() - dropped:
+                module = sys.modules.get(name)
+                if module is None or any(name.startswith(f"{parent}.") for parent in dropped):
+                    new.add(name)
+                    continue
+                for value in list(vars(module).values()):
+                    used: str | None
+                    if isinstance(value, ModuleType):
+                        # Packages reference their submodules: importing them again updates these references.
+                        if value.__name__.startswith(f"{name}."):
+                            continue
+                        used = value.__name__
+                    else:
+                        # Proxies and other exotic objects can raise anything.
+                        try:
+                            used = getattr(value, "__module__", None)
+                        except Exception:  # noqa: BLE001
+                            used = None
+                    if used in dropped:
+                        new.add(name)
+                        break
+            if not new:
+                break
+            dropped |= new
+        for name in dropped:
+            sys.modules.pop(name, None)
+            tracked = self._files.pop(name, None)
+            if tracked:
+                linecache.checkcache(tracked[0])
+        return dropped
+
+    @contextmanager
+    def request(self) -> Iterator[None]:
+        """Process a request, after dropping the modules that changed since the previous ones.
+
+        Modules are only dropped once the requests being processed are done.
+        Other requests wait for them to be dropped before starting.
+
+        Yields:
+            Nothing: We only yield to act as a context manager.
+        """
+        with self._condition:
+            changed = self.find_changes()
+            if changed:
+                self._condition.wait_for(lambda: self._active == 0)
+                self.drop(changed)
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active -= 1
+                self.track_new_modules()
+                self._condition.notify_all()
+
+
+class SubtreeCache:
+    """The documentation of modules (with their members and submodules), reused while their modules don't change.
+
+    An entry is valid as long as each module of the subtree is still the one in `sys.modules`,
+    and its source file has the same modification time and size.
+    Entries are [copies][pytkdocs.objects.Object.copy_tree] of the documented modules,
+    and each request gets its own copy, to add to its own object tree.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the object."""
+        self._entries: dict[str, tuple[Module, list[tuple[str, ModuleType, str | None, tuple[int, int] | None]]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, path: str) -> Module | None:
+        """Get the documentation of a module, if still valid.
+
+        Arguments:
+            path: The dotted path of the module.
+
+        Returns:
+            A copy of the documented module, or `None`.
+        """
+        entry = self._entries.get(path)
+        if entry is None:
+            return None
+        obj, modules = entry
+        for name, module, filename, signature in modules:
+            if sys.modules.get(name) is not module or (filename and _signature(filename) != signature):
+                self._entries.pop(path, None)
+                return None
+        return obj.copy_tree()
+
+    def set(self, path: str, obj: Module, module: ModuleType) -> None:
+        """Store the documentation of a module.
+
+        It is only stored if the documentation of its submodules is stored as well.
+        A copy is stored, so the module can still be added to the current object tree.
+
+        Arguments:
+            path: The dotted path of the module.
+            obj: The documented module.
+            module: The module.
+        """
+        filename = _source_file(module)
+        modules = [(path, module, filename, _signature(filename) if filename else None)]
+        for submodule in obj.modules:
+            entry = self._entries.get(submodule.path)
+            if entry is None:
+                return
+            modules.extend(entry[1])
+        self._entries[path] = (obj.copy_tree(), modules)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
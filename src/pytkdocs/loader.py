@@ -6,27 +6,45 @@ iterating over their members, etc.
 
 import importlib
 import inspect
+import json
 import pkgutil
 import re
-from collections.abc import Mapping, Sequence
-from contextlib import suppress
-from functools import cache
+import sys
+import threading
+import time
+import types
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import AbstractContextManager, contextmanager, nullcontext, suppress
 from itertools import chain
 from operator import attrgetter
 from pathlib import Path
-from typing import Any, Callable, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Optional, Union
 
+from pytkdocs import caches
 from pytkdocs.objects import Attribute, Class, Function, Method, Module, Object, Source
 from pytkdocs.parsers.attributes import get_class_attributes, get_instance_attributes, get_module_attributes, merge
 from pytkdocs.parsers.docstrings import PARSERS
+from pytkdocs.parsers.source_index import getsource, getsourcelines
 from pytkdocs.properties import RE_SPECIAL
 
+if TYPE_CHECKING:
+    from pytkdocs.incremental import SubtreeCache
+    from pytkdocs.timings import Timings
+
 try:
     from functools import cached_property
 except ImportError:
     from cached_property import cached_property  # type: ignore[no-redef]
 
 
+_UNWRAPPED = object()
+
+
+class DeadlineError(TimeoutError):
+    """Exception raised when a loader reaches its [deadline][pytkdocs.loader.Loader.deadline]."""
+
+
 class ObjectNode:
     """Helper class to represent an object tree.
 
@@ -34,8 +52,12 @@ class ObjectNode:
     each node has a reference to its parent, but not to its child (for simplicity purposes and to avoid bugs).
 
     Each node stores an object, its name, and a reference to its parent node.
+    Nodes are immutable: their dotted path and root are computed once, when they are created,
+    and the file path is computed once for all the nodes of a tree.
     """
 
+    __slots__ = ("_file_path", "_obj", "dotted_path", "name", "parent", "raw_obj", "root")
+
     def __init__(self, obj: Any, name: str, parent: Optional["ObjectNode"] = None) -> None:
         """Initialize the object.
 
@@ -44,17 +66,8 @@ class ObjectNode:
             name: The object's name.
             parent: The object's parent node.
         """
-        try:  # noqa: SIM105
-            obj = inspect.unwrap(obj)
-        except Exception:  # noqa: S110 , BLE001  (we purposely catch every possible exception)
-            # inspect.unwrap at some point runs hasattr(obj, "__wrapped__"),
-            # which triggers the __getattr__ method of the object, which in
-            # turn can raise various exceptions. Probably not just __getattr__.
-            # See https://github.com/pawamoy/pytkdocs/issues/45
-            pass
-
-        self.obj: Any = obj
-        """The actual Python object."""
+        self.raw_obj: Any = obj
+        """The Python object, as found in its parent (see [`obj`][pytkdocs.loader.ObjectNode.obj])."""
 
         self.name: str = name
         """The Python object's name."""
@@ -62,39 +75,94 @@ class ObjectNode:
         self.parent: Optional[ObjectNode] = parent
         """The parent node."""
 
+        self.dotted_path: str = name if parent is None else f"{parent.dotted_path}.{name}"
+        """The Python dotted path to the object."""
+
+        self.root: ObjectNode = self if parent is None else parent.root
+        """The root of the tree."""
+
+        self._obj: Any = _UNWRAPPED
+        self._file_path: Optional[str] = None
+
     @property
-    def dotted_path(self) -> str:
-        """Return the Python dotted path to the object.
+    def obj(self) -> Any:
+        """Return the actual Python object.
+
+        Callable objects are unwrapped (see [`inspect.unwrap`][inspect.unwrap]) the first time they are accessed.
+        Other objects are returned as is, without ever looking up their `__wrapped__` attribute.
 
         Returns:
-            The Python dotted path to the object.
+            The actual Python object.
         """
-        parts = [self.name]
-        current = self.parent
-        while current:
-            parts.append(current.name)
-            current = current.parent
-        return ".".join(reversed(parts))
+        if self._obj is _UNWRAPPED:
+            obj = self.raw_obj
+            if callable(obj):
+                try:  # noqa: SIM105
+                    obj = inspect.unwrap(obj)
+                except Exception:  # noqa: S110 , BLE001  (we purposely catch every possible exception)
+                    # inspect.unwrap at some point runs hasattr(obj, "__wrapped__"),
+                    # which triggers the __getattr__ method of the object, which in
+                    # turn can raise various exceptions. Probably not just __getattr__.
+                    # See https://github.com/pawamoy/pytkdocs/issues/45
+                    pass
+            self._obj = obj
+        return self._obj
 
     @property
     def file_path(self) -> str:
         """Return the object's module file path.
 
+        It is computed once, and stored on the root of the tree.
+
         Returns:
             The object's module file path.
         """
-        return inspect.getabsfile(self.root.obj)
-
-    @property
-    def root(self) -> "ObjectNode":
-        """Return the root of the tree.
+        root = self.root
+        if root._file_path is None:
+            root._file_path = inspect.getabsfile(root.obj)
+        return root._file_path
+
+    def kind(self) -> str:
+        """Tell what kind of object this node's object is, in a single pass.
+
+        The kind is decided from the type of the object, and for members of classes,
+        from their entry in the class `__dict__` (to detect class-methods and static-methods).
+        The first matching kind is returned, in this order:
+
+        - `module`
+        - `class`
+        - `staticmethod` or `classmethod`, if the parent is a class
+        - `method` if the parent is a class, `function` otherwise, for Python functions
+        - `property`
+        - `cached_property`
+        - `method_descriptor`, see [`is_method_descriptor`][pytkdocs.loader.ObjectNode.is_method_descriptor]
+        - `attribute`, for anything else
 
         Returns:
-            The root of the tree.
+            The kind of this node's object.
         """
-        if self.parent is not None:
-            return self.parent.root
-        return self
+        obj = self.obj
+        if isinstance(obj, types.ModuleType):
+            return "module"
+        if isinstance(obj, type):
+            return "class"
+        parent = self.parent
+        in_class = parent is not None and isinstance(parent.obj, type)
+        if in_class:
+            entry = parent.obj.__dict__.get(self.name)  # type: ignore[union-attr]
+            if isinstance(entry, staticmethod):
+                return "staticmethod"
+            if isinstance(entry, classmethod):
+                return "classmethod"
+        if isinstance(obj, types.FunctionType):
+            return "method" if in_class else "function"
+        if isinstance(obj, property):
+            return "property"
+        if isinstance(obj, cached_property):
+            return "cached_property"
+        if inspect.ismethoddescriptor(obj):
+            return "method_descriptor"
+        return "attribute"
 
     def is_module(self) -> bool:
         """Tell if this node's object is a module.
@@ -158,8 +226,7 @@ class ObjectNode:
         Returns:
             If this node's object is a method.
         """
-        function_type = type(lambda: None)
-        return self.parent_is_class() and isinstance(self.obj, function_type)
+        return self.parent_is_class() and isinstance(self.obj, types.FunctionType)
 
     def is_method_descriptor(self) -> bool:
         """Tell if this node's object is a method descriptor.
@@ -260,29 +327,125 @@ def get_object_tree(path: str, new_path_syntax: bool = False) -> ObjectNode:  #
     # We now have the module containing the desired object.
     # We will build the object tree by iterating over the previously stored objects names
     # and trying to get them as attributes.
-    current_node = ObjectNode(parent_module, parent_module.__name__)
+    nodes = [ObjectNode(parent_module, parent_module.__name__)]
     for obj_name in objects:
-        obj = getattr(current_node.obj, obj_name)
-        child = ObjectNode(obj, obj_name, parent=current_node)
-        current_node = child
-
-    leaf = current_node
+        obj = getattr(nodes[-1].obj, obj_name)
+        nodes.append(ObjectNode(obj, obj_name, parent=nodes[-1]))
 
     # We now try to get the "real" parent module, not the one the object was imported into.
     # This is important if we want to be able to retrieve the docstring of an attribute for example.
     # Once we find an object for which we could get the module, we stop trying to get the module.
     # Once we reach the node before the root, we apply the module if found, and break.
+    # Nodes are immutable, so the nodes below the real module are created again.
     real_module = None
-    while current_node.parent is not None:
+    for index in range(len(nodes) - 1, 0, -1):
         if real_module is None:
-            real_module = inspect.getmodule(current_node.obj)
-        if inspect.ismodule(current_node.parent.obj):
-            if real_module is not None and real_module is not current_node.parent.obj:
-                current_node.parent = ObjectNode(real_module, real_module.__name__)
+            real_module = inspect.getmodule(nodes[index].obj)
+        if inspect.ismodule(nodes[index - 1].obj):
+            if real_module is not None and real_module is not nodes[index - 1].obj:
+                current_node = ObjectNode(real_module, real_module.__name__)
+                for node in nodes[index:]:
+                    current_node = ObjectNode(node.raw_obj, node.name, parent=current_node)
+                return current_node
             break
-        current_node = current_node.parent
 
-    return leaf
+    return nodes[-1]
+
+
+class Members(Mapping):
+    """The members of an object, resolved lazily.
+
+    Names are listed like [`inspect.getmembers`][inspect.getmembers] lists them,
+    but their values are only resolved (with `getattr`, or in the `__dict__` of the classes of the MRO)
+    when they are accessed. This way, members that are not selected never trigger
+    descriptors or `__getattr__` hooks.
+    """
+
+    def __init__(self, obj: Any) -> None:
+        """Initialize the object.
+
+        Arguments:
+            obj: A module or a class.
+        """
+        self.obj = obj
+        names = dir(obj)
+        self._mro: tuple[type, ...] = ()
+        self._duplicates: set[str] = set()
+        if inspect.isclass(obj):
+            self._mro = (obj, *inspect.getmro(obj))
+            # Like inspect.getmembers, add the dynamic class attributes (for example the ones of enumerations).
+            # When they are already listed, their value is taken from the classes' `__dict__`.
+            listed = set(names)
+            with suppress(AttributeError):
+                for base in obj.__bases__:
+                    for name, value in base.__dict__.items():
+                        if isinstance(value, types.DynamicClassAttribute):
+                            if name in listed:
+                                self._duplicates.add(name)
+                            names.append(name)
+        self._names = sorted(set(names))
+        self._names_set = set(self._names)
+        self._values: dict[str, Any] = {}
+
+    def _resolve(self, name: str) -> Any:
+        if name in self._values:
+            return self._values[name]
+        if name not in self._duplicates:
+            try:
+                value = getattr(self.obj, name)
+            except AttributeError:
+                pass
+            else:
+                self._values[name] = value
+                return value
+        # Some descriptors don't like having their `__get__` method called.
+        for base in self._mro:
+            if name in base.__dict__:
+                value = self._values[name] = base.__dict__[name]
+                return value
+        if name in self._duplicates:
+            value = self._values[name] = getattr(self.obj, name)
+            return value
+        raise AttributeError(name)
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._names_set:
+            raise KeyError(name)
+        try:
+            return self._resolve(name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def __contains__(self, name: object) -> bool:
+        try:
+            self[name]  # type: ignore[index]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name in self._names if name in self)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def select(self, predicate: Callable[[str], bool]) -> Iterator[tuple[str, Any]]:
+        """Iterate on the members whose name is selected, sorted by name.
+
+        Arguments:
+            predicate: A function telling whether to select a name.
+                The values of the members that are not selected are not resolved.
+
+        Yields:
+            The name and value of each selected member.
+        """
+        for name in self._names:
+            if predicate(name):
+                try:
+                    value = self._resolve(name)
+                except AttributeError:
+                    continue
+                yield name, value
 
 
 class Loader:
@@ -291,6 +454,30 @@ class Loader:
     Any error that occurred during collection of the objects and their documentation is stored in the `errors` list.
     """
 
+    # The names of the methods documenting each kind of object (see `ObjectNode.kind`),
+    # when it is the object to document, and when it is a member of a class.
+    # Cached properties are method descriptors, so they are documented as methods when they are the object.
+    _object_handlers: ClassVar[dict[str, str]] = {
+        "module": "get_module_documentation",
+        "class": "get_class_documentation",
+        "staticmethod": "get_staticmethod_documentation",
+        "classmethod": "get_classmethod_documentation",
+        "method": "get_regular_method_documentation",
+        "method_descriptor": "get_regular_method_documentation",
+        "cached_property": "get_regular_method_documentation",
+        "function": "get_function_documentation",
+        "property": "get_property_documentation",
+        "attribute": "get_attribute_documentation",
+    }
+    _class_member_handlers: ClassVar[dict[str, str]] = {
+        "class": "get_class_documentation",
+        "classmethod": "get_classmethod_documentation",
+        "staticmethod": "get_staticmethod_documentation",
+        "method": "get_regular_method_documentation",
+        "property": "get_property_documentation",
+        "cached_property": "get_property_documentation",
+    }
+
     def __init__(
         self,
         filters: Optional[list[str]] = None,
@@ -298,6 +485,10 @@ class Loader:
         docstring_options: Optional[dict] = None,
         inherited_members: bool = False,  # noqa: FBT001, FBT002
         new_path_syntax: bool = False,  # noqa: FBT001, FBT002
+        *,
+        static: bool = False,
+        static_fallback: bool = True,
+        members_from_all: bool = False,
     ) -> None:
         """Initialize the object.
 
@@ -307,6 +498,11 @@ class Loader:
             docstring_options: The options to pass to the docstrings parser.
             inherited_members: Whether to select inherited members for classes.
             new_path_syntax: Whether to use the "colon" syntax for the path.
+            static: Whether to document objects from their source files only, without importing them
+                (see [`StaticLoader`][pytkdocs.static.StaticLoader]).
+            static_fallback: Whether to document modules from their source files when importing them fails.
+            members_from_all: Whether to only select the members of modules listed in their `__all__` attribute,
+                when they define it. Other members are never looked up. Submodules are still selected.
         """
         if not filters:
             filters = []
@@ -316,6 +512,50 @@ class Loader:
         self.errors: list[str] = []
         self.select_inherited_members = inherited_members
         self.new_path_syntax = new_path_syntax
+        self.static = static
+        self.static_fallback = static_fallback
+        self.members_from_all = members_from_all
+        self.timings: Optional[Timings] = None
+        """Set it to measure the time spent in each phase of the loading process."""
+        self.deadline: Optional[float] = None
+        """Set it to stop loading (raising `DeadlineError`) once this time (see `time.monotonic`) is reached."""
+        self.subtrees: Optional[SubtreeCache] = None
+        """Set it to reuse the documentation of submodules that did not change since they were documented."""
+        self._filtered_names: dict[str, bool] = {}
+        self._modules: dict[str, types.ModuleType] = {}
+
+    def reset(self) -> None:
+        """Reset the errors, timings, deadline and modules lookups, to load other objects with the same options."""
+        self.errors = []
+        self.timings = None
+        self.deadline = None
+        self._modules.clear()
+
+    def _is_defined_in(self, obj: Any, module: types.ModuleType) -> bool:
+        # Same as `inspect.getmodule(obj) is module`. For objects with a `__module__` string,
+        # `getmodule` returns the module registered under this name in `sys.modules`:
+        # we do the same, caching the lookups until the loader is reset,
+        # and only call `getmodule` (which can scan every module) for other objects.
+        try:
+            module_name = obj.__module__
+        except AttributeError:
+            return inspect.getmodule(obj) is module
+        if not isinstance(module_name, str):
+            return inspect.getmodule(obj) is module
+        owner = self._modules.get(module_name)
+        if owner is None:
+            owner = sys.modules.get(module_name)
+            if owner is None:
+                return False
+            self._modules[module_name] = owner
+        return owner is module
+
+    def _timed(self, phase: str) -> AbstractContextManager:
+        return nullcontext() if self.timings is None else self.timings.phase(phase)
+
+    def _check_deadline(self, path: str) -> None:
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise DeadlineError(f"Deadline exceeded while documenting '{path}'")
 
     def get_object_documentation(self, dotted_path: str, members: Optional[Union[set[str], bool]] = None) -> Object:
         """Get the documentation for an object and its children.
@@ -333,27 +573,53 @@ class Loader:
             members = set()
 
         root_object: Object
-        leaf = get_object_tree(dotted_path, self.new_path_syntax)
-
-        if leaf.is_module():
-            root_object = self.get_module_documentation(leaf, members)
-        elif leaf.is_class():
-            root_object = self.get_class_documentation(leaf, members)
-        elif leaf.is_staticmethod():
-            root_object = self.get_staticmethod_documentation(leaf)
-        elif leaf.is_classmethod():
-            root_object = self.get_classmethod_documentation(leaf)
-        elif leaf.is_method_descriptor() or leaf.is_method():
-            root_object = self.get_regular_method_documentation(leaf)
-        elif leaf.is_function():
-            root_object = self.get_function_documentation(leaf)
-        elif leaf.is_property():
-            root_object = self.get_property_documentation(leaf)
-        else:
-            root_object = self.get_attribute_documentation(leaf)
+        self._check_deadline(dotted_path)
+        if self.static:
+            from pytkdocs.static import StaticLoader  # noqa: PLC0415
 
-        root_object.parse_all_docstrings(self.docstring_parser)
+            root_object = StaticLoader(self).get_object_documentation(dotted_path, members=members)
+            with self._timed("docstrings"):
+                root_object.parse_all_docstrings(self.docstring_parser)
+            return root_object
+
+        try:
+            with self._timed("import"):
+                leaf = get_object_tree(dotted_path, self.new_path_syntax)
+        except Exception as error:  # noqa: BLE001
+            root_object = self._get_static_documentation(dotted_path, error, members=members)
+            with self._timed("docstrings"):
+                root_object.parse_all_docstrings(self.docstring_parser)
+            return root_object
+
+        kind = leaf.kind()
+        handler = getattr(self, self._object_handlers[kind])
+        root_object = handler(leaf, members) if kind in {"module", "class"} else handler(leaf)
+
+        with self._timed("docstrings"):
+            root_object.parse_all_docstrings(self.docstring_parser)
+
+        return root_object
+
+    def _get_static_documentation(
+        self,
+        dotted_path: str,
+        import_error: Exception,
+        *,
+        members: Optional[Union[set[str], bool]] = None,
+    ) -> Object:
+        # Document an object from its source file, because importing it failed.
+        # The import error is re-raised when the static fallback is disabled or fails as well.
+        if not self.static_fallback:
+            raise import_error
+        from pytkdocs.static import StaticLoader  # noqa: PLC0415
 
+        try:
+            root_object = StaticLoader(self).get_object_documentation(dotted_path, members=members)
+        except TimeoutError:
+            raise
+        except Exception:  # noqa: BLE001
+            raise import_error from None
+        self.errors.append(f"{dotted_path}: importing failed ({import_error!r}), documented from source instead")
         return root_object
 
     def get_module_documentation(
@@ -375,15 +641,16 @@ class Loader:
         name = path.split(".")[-1]
         source: Optional[Source]
 
-        try:
-            source = Source(inspect.getsource(module), 1)
-        except OSError:
+        with self._timed("source"):
             try:
-                code = Path(node.file_path).read_text()
-            except (OSError, UnicodeDecodeError):
-                source = None
-            else:
-                source = Source(code, 1) if code else None
+                source = Source(getsource(module), 1)
+            except OSError:
+                try:
+                    code = Path(node.file_path).read_text()
+                except (OSError, UnicodeDecodeError):
+                    source = None
+                else:
+                    source = Source(code, 1) if code else None
 
         root_object = Module(
             name=name,
@@ -398,24 +665,56 @@ class Loader:
 
         select_members = select_members or set()
 
-        attributes_data = get_module_attributes(module)
-        root_object.parse_docstring(self.docstring_parser, attributes=attributes_data)
+        with self._timed("attributes"):
+            attributes_data = get_module_attributes(module)
+        with self._timed("docstrings"):
+            root_object.parse_docstring(self.docstring_parser, attributes=attributes_data)
+
+        all_names = get_all_names(module) if self.members_from_all and not select_members else None
 
-        for member_name, member in inspect.getmembers(module):
-            if self.select(member_name, select_members):  # type: ignore[arg-type]
-                child_node = ObjectNode(member, member_name, parent=node)
-                if child_node.is_class() and node.root.obj is inspect.getmodule(child_node.obj):
-                    root_object.add_child(self.get_class_documentation(child_node))
-                elif child_node.is_function() and node.root.obj is inspect.getmodule(child_node.obj):
-                    root_object.add_child(self.get_function_documentation(child_node))
-                elif member_name in attributes_data:
-                    root_object.add_child(self.get_attribute_documentation(child_node, attributes_data[member_name]))
+        def is_selected(name: str) -> bool:
+            if all_names is not None and name not in all_names:
+                return False
+            return self.select(name, select_members)  # type: ignore[arg-type]
+
+        for member_name, member in Members(module).select(is_selected):
+            self._check_deadline(path)
+            child_node = ObjectNode(member, member_name, parent=node)
+            kind = child_node.kind()
+            if kind == "class" and self._is_defined_in(child_node.obj, node.root.obj):
+                root_object.add_child(self.get_class_documentation(child_node))
+            elif kind == "function" and self._is_defined_in(child_node.obj, node.root.obj):
+                root_object.add_child(self.get_function_documentation(child_node))
+            elif member_name in attributes_data:
+                root_object.add_child(self.get_attribute_documentation(child_node, attributes_data[member_name]))
 
         if hasattr(module, "__path__"):
             for _, modname, _ in pkgutil.iter_modules(module.__path__):
                 if self.select(modname, select_members):  # type: ignore[arg-type]
-                    leaf = get_object_tree(f"{path}.{modname}")
-                    root_object.add_child(self.get_module_documentation(leaf))
+                    self._check_deadline(f"{path}.{modname}")
+                    cached = self.subtrees.get(f"{path}.{modname}") if self.subtrees is not None else None
+                    if cached is not None:
+                        root_object.add_child(cached)
+                        continue
+                    errors = len(self.errors)
+                    try:
+                        with self._timed("import"):
+                            leaf = get_object_tree(f"{path}.{modname}")
+                    except Exception as error:
+                        if not self.static_fallback:
+                            raise
+                        # Keep documenting the other submodules, even if this one cannot be documented at all.
+                        try:
+                            root_object.add_child(self._get_static_documentation(f"{path}.{modname}", error))
+                        except TimeoutError:
+                            raise
+                        except Exception:  # noqa: BLE001
+                            self.errors.append(f"{path}.{modname}: {error!r}")
+                    else:
+                        submodule = self.get_module_documentation(leaf)
+                        root_object.add_child(submodule)
+                        if self.subtrees is not None and len(self.errors) == errors:
+                            self.subtrees.set(submodule.path, submodule, leaf.obj)
 
         return root_object
 
@@ -447,10 +746,11 @@ class Loader:
 
         source: Optional[Source]
 
-        try:
-            source = Source(*inspect.getsourcelines(node.obj))
-        except (OSError, TypeError):
-            source = None
+        with self._timed("source"):
+            try:
+                source = Source(*getsourcelines(node.obj))
+            except (OSError, TypeError):
+                source = None
 
         root_object = Class(
             name=node.name,
@@ -463,52 +763,51 @@ class Loader:
 
         # Even if we don't select members, we want to correctly parse the docstring
         attributes_data: dict[str, dict[str, Any]] = {}
-        for parent_class in reversed(class_.__mro__[:-1]):
-            merge(attributes_data, get_class_attributes(parent_class))
+        with self._timed("attributes"):
+            for parent_class in reversed(class_.__mro__[:-1]):
+                merge(attributes_data, get_class_attributes(parent_class))
         context: dict[str, Any] = {"attributes": attributes_data}
         if "__init__" in class_.__dict__:
             try:
-                attributes_data.update(get_instance_attributes(class_.__init__))
+                with self._timed("attributes"):
+                    attributes_data.update(get_instance_attributes(class_.__init__))
                 context["signature"] = inspect.signature(class_.__init__)
             except (TypeError, ValueError):
                 pass
-        root_object.parse_docstring(self.docstring_parser, **context)
+        with self._timed("docstrings"):
+            root_object.parse_docstring(self.docstring_parser, **context)
 
         if select_members is False:
             return root_object
 
         select_members = select_members or set()
 
-        # Build the list of members
+        # Build the list of members, only resolving the selected ones
         members = {}
         inherited = set()
         direct_members = class_.__dict__
-        all_members = dict(inspect.getmembers(class_))
-        for member_name, member in all_members.items():
-            if member is class_:
+        all_members = Members(class_)
+
+        def is_selected(name: str) -> bool:
+            if name not in direct_members and not self.select_inherited_members:
+                return False
+            return self.select(name, select_members)  # type: ignore[arg-type]
+
+        for member_name, member in all_members.select(is_selected):
+            if member is class_ or member is type or member is object:
                 continue
-            if not (member is type or member is object) and self.select(member_name, select_members):  # type: ignore[arg-type]
-                if member_name not in direct_members:
-                    if self.select_inherited_members:
-                        members[member_name] = member
-                        inherited.add(member_name)
-                else:
-                    members[member_name] = member
+            members[member_name] = member
+            if member_name not in direct_members:
+                inherited.add(member_name)
 
         # Iterate on the selected members
         child: Object
         for member_name, member in members.items():
+            self._check_deadline(node.dotted_path)
             child_node = ObjectNode(member, member_name, parent=node)
-            if child_node.is_class():
-                child = self.get_class_documentation(child_node)
-            elif child_node.is_classmethod():
-                child = self.get_classmethod_documentation(child_node)
-            elif child_node.is_staticmethod():
-                child = self.get_staticmethod_documentation(child_node)
-            elif child_node.is_method():
-                child = self.get_regular_method_documentation(child_node)
-            elif child_node.is_property():
-                child = self.get_property_documentation(child_node)
+            handler = self._class_member_handlers.get(child_node.kind())
+            if handler is not None:
+                child = getattr(self, handler)(child_node)
             elif member_name in attributes_data:
                 child = self.get_attribute_documentation(child_node, attributes_data[member_name])
             else:
@@ -538,7 +837,7 @@ class Loader:
 
         return root_object
 
-    def detect_field_model(self, attr_name: str, direct_members: Sequence[str], all_members: dict) -> bool:
+    def detect_field_model(self, attr_name: str, direct_members: Sequence[str], all_members: Mapping) -> bool:
         """Detect if an attribute is present in members.
 
         Arguments:
@@ -610,10 +909,11 @@ class Loader:
         except TypeError:
             signature = None
 
-        try:
-            source = Source(*inspect.getsourcelines(function))
-        except OSError:
-            source = None
+        with self._timed("source"):
+            try:
+                source = Source(*getsourcelines(function))
+            except OSError:
+                source = None
 
         properties: list[str] = []
         if node.is_coroutine_function():
@@ -658,10 +958,11 @@ class Loader:
         else:
             attr_type = signature.return_annotation
 
-        try:
-            source = Source(*inspect.getsourcelines(sig_source_func))
-        except (OSError, TypeError):
-            source = None
+        with self._timed("source"):
+            try:
+                source = Source(*getsourcelines(sig_source_func))
+            except (OSError, TypeError):
+                source = None
 
         return Attribute(
             name=node.name,
@@ -848,12 +1149,13 @@ class Loader:
         signature: Optional[inspect.Signature]
         source: Optional[Source]
 
-        try:
-            source = Source(*inspect.getsourcelines(method))
-        except OSError:
-            source = None
-        except TypeError:
-            source = None
+        with self._timed("source"):
+            try:
+                source = Source(*getsourcelines(method))
+            except OSError:
+                source = None
+            except TypeError:
+                source = None
 
         if node.is_coroutine_function():
             if properties is None:
@@ -921,10 +1223,11 @@ class Loader:
             return name in names
         return not self.filter_name_out(name)
 
-    @cache  # noqa: B019
     def filter_name_out(self, name: str) -> bool:
         """Filter a name based on the loader's filters.
 
+        Results are cached by the loader.
+
         Arguments:
             name: The name to filter.
 
@@ -933,6 +1236,8 @@ class Loader:
         """
         if not self.filters:
             return False
+        if name in self._filtered_names:
+            return self._filtered_names[name]
         keep = True
         for fltr, regex in self.filters:
             is_matching = bool(regex.search(name))
@@ -940,9 +1245,92 @@ class Loader:
                 if str(fltr).startswith("!"):
                     is_matching = not is_matching
                 keep = is_matching
+        self._filtered_names[name] = not keep
         return not keep
 
 
+class LoaderPool:
+    """A pool of loaders, reused to load objects with the same options.
+
+    Reusing loaders saves instantiating docstring parsers, and keeps the results of filters cached.
+    A loader is only used by one thread at a time: it is taken from the pool,
+    and put back in it once the object is loaded.
+    """
+
+    def __init__(self, max_options: int = 16) -> None:
+        """Initialize the object.
+
+        Arguments:
+            max_options: The maximum number of different sets of options to keep loaders for.
+                Loaders for the least recently used set of options are discarded first.
+        """
+        self.max_options = max_options
+        self.reuse_submodules = False
+        """Whether loaders reuse the documentation of submodules, see [`SubtreeCache`][pytkdocs.incremental.SubtreeCache].
+
+        Only enable it when modules that change are dropped from `sys.modules`,
+        see [`ModuleTracker`][pytkdocs.incremental.ModuleTracker].
+        """
+        self._idle: OrderedDict[str, list[Loader]] = OrderedDict()
+        self._subtrees: dict[str, SubtreeCache] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def loader(self, **options: Any) -> Iterator[Loader]:
+        """Take a loader with the given options from the pool, or create one.
+
+        Arguments:
+            **options: The loader options, see [`Loader`][pytkdocs.loader.Loader].
+
+        Yields:
+            A loader, with no errors.
+        """
+        key = json.dumps(options, sort_keys=True, default=repr)
+        with self._lock:
+            idle = self._idle.get(key)
+            loader = idle.pop() if idle else None
+        if loader is None:
+            loader = Loader(**options)
+            if self.reuse_submodules:
+                from pytkdocs.incremental import SubtreeCache  # noqa: PLC0415
+
+                with self._lock:
+                    loader.subtrees = self._subtrees.setdefault(key, SubtreeCache())
+        else:
+            loader.reset()
+        try:
+            yield loader
+        finally:
+            with self._lock:
+                self._idle.setdefault(key, []).append(loader)
+                self._idle.move_to_end(key)
+                while len(self._idle) > self.max_options:
+                    evicted_key, _ = self._idle.popitem(last=False)
+                    self._subtrees.pop(evicted_key, None)
+
+    def size(self) -> int:
+        """Return the number of entries cached by the idle loaders.
+
+        Returns:
+            The number of entries.
+        """
+        with self._lock:
+            filtered_names = sum(len(loader._filtered_names) for loaders in self._idle.values() for loader in loaders)
+            return filtered_names + sum(len(subtrees) for subtrees in self._subtrees.values())
+
+    def clear(self) -> None:
+        """Discard the idle loaders, and the documentation of submodules they reuse."""
+        with self._lock:
+            self._idle.clear()
+            for subtrees in self._subtrees.values():
+                subtrees.clear()
+
+
+loader_pool = LoaderPool()
+"""The loaders shared by every request processed in this process."""
+caches.register(loader_pool.size, loader_pool.clear)
+
+
 def field_is_inherited(field_name: str, fields_name: str, base_class: type) -> bool:
     """Check if a field with a certain name was inherited from parent classes.
 
@@ -980,6 +1368,21 @@ def split_attr_name(attr_name: str) -> tuple[str, Optional[str]]:
     return first_order_attr_name, remainder
 
 
+def get_all_names(module: types.ModuleType) -> Optional[set[str]]:
+    """Get the names listed in the `__all__` attribute of a module.
+
+    Arguments:
+        module: The module.
+
+    Returns:
+        The names, or `None` if the module does not define `__all__` as a list or tuple of strings.
+    """
+    names = vars(module).get("__all__")
+    if isinstance(names, (list, tuple)) and all(isinstance(name, str) for name in names):
+        return set(names)
+    return None
+
+
 def get_fields(  # noqa: D103
     attr_name: str,
     *,
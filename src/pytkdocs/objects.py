@@ -12,6 +12,7 @@ Note that properties are considered attributes, because they are used like such.
 It also defines a convenient [`Source`][pytkdocs.objects.Source] class to represent source code.
 """
 
+import copy
 import importlib
 import inspect
 import os
@@ -19,8 +20,9 @@ import sys
 from abc import ABCMeta
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Optional, TypeVar, Union
 
+from pytkdocs.caches import register_lru_cache
 from pytkdocs.parsers.docstrings.base import Parser, Section
 from pytkdocs.properties import NAME_CLASS_PRIVATE, NAME_PRIVATE, NAME_SPECIAL, ApplicableNameProperty
 
@@ -46,6 +48,9 @@ class Source:
         """The first line number."""
 
 
+_ObjectT = TypeVar("_ObjectT", bound="Object")
+
+
 class Object(metaclass=ABCMeta):  # noqa: B024
     """A base class to store information about a Python object.
 
@@ -99,6 +104,7 @@ class Object(metaclass=ABCMeta):  # noqa: B024
 
         self._path_map = {self.path: self}
         self._parsed = False
+        self._relative_file_path: Optional[str] = None
 
         self.attributes: list[Attribute] = []
         """The list of all the object's attributes."""
@@ -153,10 +159,26 @@ class Object(metaclass=ABCMeta):  # noqa: B024
         - relative file path is `a/b/c.py`
 
         If the relative file path cannot be determined, the value returned is `""` (empty string).
+        It can also be set, when it is known in advance.
+
+        It is computed once, and shared with the children defined in the same file:
+        each module of a tree only computes it once.
 
         Returns:
             The path relative to the object's package.
         """
+        if self._relative_file_path is None:
+            if self.parent is not None and self.parent.file_path == self.file_path:
+                self._relative_file_path = self.parent.relative_file_path
+            else:
+                self._relative_file_path = self._compute_relative_file_path()
+        return self._relative_file_path
+
+    @relative_file_path.setter
+    def relative_file_path(self, value: str) -> None:
+        self._relative_file_path = value
+
+    def _compute_relative_file_path(self) -> str:
         parts = self.path.split(".")
         namespaces = [".".join(parts[:length]) for length in range(1, len(parts) + 1)]
         # Iterate through all sub namespaces including the last in case it is a module
@@ -262,6 +284,29 @@ class Object(metaclass=ABCMeta):  # noqa: B024
         for child in children:
             self.add_child(child)
 
+    def copy_tree(self: _ObjectT) -> _ObjectT:  # noqa: PYI019
+        """Copy this object and its children, recursively, without a parent.
+
+        The copies have their own lists of children and parent links, so they can be added to another tree.
+        Their signatures, sources and parsed docstrings are shared with the original objects:
+        they are not modified once the objects are loaded.
+
+        Returns:
+            A copy of this object.
+        """
+        copied = copy.copy(self)
+        copied.parent = None
+        copied._path_map = {copied.path: copied}
+        copied.attributes = []
+        copied.methods = []
+        copied.functions = []
+        copied.modules = []
+        copied.classes = []
+        copied.children = []
+        for child in self.children:
+            copied.add_child(child.copy_tree())
+        return copied
+
     def parse_docstring(self, parser: Parser, **context: Any) -> None:
         """Parse the docstring of this object.
 
@@ -285,6 +330,7 @@ class Object(metaclass=ABCMeta):  # noqa: B024
         for child in self.children:
             child.parse_all_docstrings(parser)
 
+    @register_lru_cache
     @lru_cache  # noqa: B019
     def has_contents(self) -> bool:
         """Tells if the object has "contents".
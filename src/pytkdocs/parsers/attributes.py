@@ -8,6 +8,9 @@ from textwrap import dedent
 from types import ModuleType
 from typing import Any, Callable, get_type_hints
 
+from pytkdocs.caches import register_lru_cache
+from pytkdocs.parsers.source_index import get_definition, getsource
+
 try:
     from ast import unparse  # type: ignore[attr-defined]
 except ImportError:
@@ -17,8 +20,14 @@ RECURSIVE_NODES = (ast.If, ast.IfExp, ast.Try, ast.With)
 
 
 def get_nodes(obj: Any) -> list[ast.stmt]:  # noqa: D103
+    # Use the nodes of the indexed source file when possible, to avoid parsing the source of each object.
+    definition = get_definition(obj)
+    if isinstance(definition, ast.Module):
+        return definition.body
+    if definition is not None:
+        return [definition]
     try:
-        source = inspect.getsource(obj)
+        source = getsource(obj)
     except (OSError, TypeError):
         source = ""
     return ast.parse(dedent(source)).body
@@ -100,11 +109,13 @@ def merge(base: dict, extra: dict) -> None:  # noqa: D103
             base[attr_name] = data
 
 
+@register_lru_cache
 @lru_cache
 def get_module_attributes(module: ModuleType) -> dict:  # noqa: D103
     return combine(get_module_or_class_attributes(get_nodes(module)), get_type_hints(module))
 
 
+@register_lru_cache
 @lru_cache
 def get_class_attributes(cls: type) -> dict:  # noqa: D103
     nodes = get_nodes(cls)
@@ -128,15 +139,19 @@ def unparse_annotation(node: ast.AST) -> str:  # noqa: D103
     return code.replace("(", "").replace(")", "")
 
 
+@register_lru_cache
 @lru_cache
 def get_instance_attributes(func: Callable) -> dict:  # noqa: D103
     nodes = get_nodes(func)
     if not nodes:
         return {}
+    return get_instance_attributes_from_nodes(nodes[0].body)  # type: ignore[attr-defined]
+
 
+def get_instance_attributes_from_nodes(nodes: list) -> dict:  # noqa: D103
     result = {}
 
-    for assignment, string in get_pairs(nodes[0].body):  # type: ignore[attr-defined]
+    for assignment, string in get_pairs(nodes):
         annotation = names = None
         if isinstance(assignment, ast.AnnAssign):
             if pick_target(assignment.target):
@@ -1,21 +1,69 @@
-"""The parsers' package."""
+"""The parsers' package.
+
+Parsers are imported lazily, the first time they are used,
+either through [`PARSERS`][pytkdocs.parsers.docstrings.PARSERS] or as attributes of this package.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Iterator, Mapping
+from typing import Any
 
 from pytkdocs.parsers.docstrings.base import Parser, UnavailableParser
-from pytkdocs.parsers.docstrings.google import Google
-from pytkdocs.parsers.docstrings.markdown import Markdown
-from pytkdocs.parsers.docstrings.restructured_text import RestructuredText
-
-try:
-    from pytkdocs.parsers.docstrings.numpy import Numpy
-except ImportError:
-    Numpy = UnavailableParser(  # type: ignore[misc,assignment]
+
+_PARSERS_LOCATIONS: dict[str, tuple[str, str, str]] = {
+    "google": ("pytkdocs.parsers.docstrings.google", "Google", ""),
+    "restructured-text": ("pytkdocs.parsers.docstrings.restructured_text", "RestructuredText", ""),
+    "numpy": (
+        "pytkdocs.parsers.docstrings.numpy",
+        "Numpy",
         "pytkdocs must be installed with 'numpy-style' extra to parse Numpy docstrings",
-    )
+    ),
+    "markdown": ("pytkdocs.parsers.docstrings.markdown", "Markdown", ""),
+}
 
 
-PARSERS: dict[str, type[Parser]] = {
-    "google": Google,
-    "restructured-text": RestructuredText,
-    "numpy": Numpy,
-    "markdown": Markdown,
-}
+class LazyParsers(Mapping):
+    """A mapping of docstring styles to parsers classes, importing each parser on first access."""
+
+    def __init__(self, locations: dict[str, tuple[str, str, str]]) -> None:
+        """Initialize the object.
+
+        Arguments:
+            locations: For each docstring style, the module and the name of the parser class,
+                and the message to show if the module cannot be imported (empty to let the error bubble up).
+        """
+        self._locations = locations
+        self._parsers: dict[str, type[Parser]] = {}
+
+    def __getitem__(self, style: str) -> type[Parser]:
+        if style not in self._parsers:
+            module_path, class_name, unavailable_message = self._locations[style]
+            try:
+                module = importlib.import_module(module_path)
+            except ImportError:
+                if not unavailable_message:
+                    raise
+                self._parsers[style] = UnavailableParser(unavailable_message)  # type: ignore[assignment]
+            else:
+                self._parsers[style] = getattr(module, class_name)
+        return self._parsers[style]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._locations)
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+
+PARSERS: Mapping[str, type[Parser]] = LazyParsers(_PARSERS_LOCATIONS)
+"""The available parsers, by docstring style."""
+
+_STYLES_BY_CLASS_NAME = {class_name: style for style, (_, class_name, _) in _PARSERS_LOCATIONS.items()}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _STYLES_BY_CLASS_NAME:
+        return PARSERS[_STYLES_BY_CLASS_NAME[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
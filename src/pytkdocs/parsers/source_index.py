@@ -0,0 +1,266 @@
+"""Module containing an index of the source files, to get the source code of objects quickly.
+
+[`inspect.getsourcelines`][inspect.getsourcelines] finds the module of an object
+by scanning `sys.modules`, and parses the whole module file each time it looks for a class.
+Instead, the lines of each file are read once, and the definitions of its classes and functions
+are found with a single walk of its syntax tree, the first time one of them is looked for.
+The syntax tree nodes of these definitions are also used to find attributes
+(see [`get_definition`][pytkdocs.parsers.source_index.get_definition]).
+Indexes are rebuilt when their file changes.
+"""
+
+import ast
+import inspect
+import linecache
+import os
+import re
+import sys
+from typing import Any, Optional, Union
+
+from pytkdocs import caches
+
+_DEFINITION_START = re.compile(r"^(\s*def\s)|(\s*async\s+def\s)|(.*(?<!\w)lambda(:|\s))|^(\s*@)")
+
+
+_Definition = Union[ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef]
+
+
+class SourceIndex:
+    """An index of a source file: its lines, and the definitions of its classes and functions."""
+
+    def __init__(self, filename: str, signature: tuple[int, int]) -> None:
+        """Initialize the object.
+
+        Arguments:
+            filename: The path of the source file.
+            signature: The modification time and size of the file, to detect changes.
+        """
+        self.filename = filename
+        self.signature = signature
+        linecache.checkcache(filename)
+        self.lines: list[str] = linecache.getlines(filename)
+        self._tree: Optional[ast.Module] = None
+        self._classes: Optional[dict[str, ast.ClassDef]] = None
+        self._functions: Optional[dict[int, _Definition]] = None
+
+    @property
+    def tree(self) -> ast.Module:
+        """The syntax tree of the file, parsed on first access."""
+        if self._tree is None:
+            self._tree = ast.parse("".join(self.lines))
+        return self._tree
+
+    @property
+    def classes(self) -> dict[str, ast.ClassDef]:
+        """The definition of each class, by qualified name.
+
+        Like [`inspect.findsource`][inspect.findsource], when several classes have the same qualified name,
+        the first one found is used.
+        """
+        if self._classes is None:
+            self._index_definitions()
+        return self._classes  # type: ignore[return-value]
+
+    @property
+    def functions(self) -> dict[int, _Definition]:
+        """The definition of each function, by (zero-based) first line."""
+        if self._functions is None:
+            self._index_definitions()
+        return self._functions  # type: ignore[return-value]
+
+    def _index_definitions(self) -> None:
+        classes: dict[str, ast.ClassDef] = {}
+        functions: dict[int, _Definition] = {}
+        _index_definitions(self.tree.body, [], classes, functions)
+        self._classes = classes
+        self._functions = functions
+
+    def find_code(self, code: Any) -> int:
+        """Find the (zero-based) first line of the definition of a code object.
+
+        Arguments:
+            code: The code object.
+
+        Raises:
+            OSError: When the line is out of bounds.
+
+        Returns:
+            The line number.
+        """
+        # Same search as `inspect.findsource`: go up until a definition (or a decorator) is found.
+        lnum = code.co_firstlineno - 1
+        while lnum > 0:
+            try:
+                line = self.lines[lnum]
+            except IndexError as error:
+                raise OSError("lineno is out of bounds") from error
+            if _DEFINITION_START.match(line):
+                break
+            lnum -= 1
+        return lnum
+
+
+def first_line(node: _Definition) -> int:
+    """Return the (zero-based) first line of a definition: the one of its first decorator, if any.
+
+    Arguments:
+        node: A class or function definition.
+
+    Returns:
+        The line number.
+    """
+    return (node.decorator_list[0] if node.decorator_list else node).lineno - 1
+
+
+def _index_definitions(
+    nodes: list,
+    stack: list[str],
+    classes: dict[str, ast.ClassDef],
+    functions: dict[int, _Definition],
+) -> None:
+    for node in nodes:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions.setdefault(first_line(node), node)
+            _index_definitions(_children(node), [*stack, node.name, "<locals>"], classes, functions)
+        elif isinstance(node, ast.ClassDef):
+            classes.setdefault(".".join([*stack, node.name]), node)
+            _index_definitions(_children(node), [*stack, node.name], classes, functions)
+        else:
+            _index_definitions(_children(node), stack, classes, functions)
+
+
+def _children(node: ast.AST) -> list[ast.AST]:
+    # Classes cannot be defined in expressions: only walk statements and their containers (handlers, cases).
+    return [child for child in ast.iter_child_nodes(node) if not isinstance(child, ast.expr)]
+
+
+_indexes: dict[str, SourceIndex] = {}
+caches.register(lambda: len(_indexes), _indexes.clear)
+
+
+def get_index(filename: str) -> Optional[SourceIndex]:
+    """Get the index of a source file, building it if needed.
+
+    Arguments:
+        filename: The path of the source file.
+
+    Returns:
+        The index, or `None` if the file cannot be read.
+    """
+    try:
+        stat = os.stat(filename)
+    except (OSError, ValueError):
+        return None
+    signature = (stat.st_mtime_ns, stat.st_size)
+    index = _indexes.get(filename)
+    if index is None or index.signature != signature:
+        index = SourceIndex(filename, signature)
+        if not index.lines:
+            return None
+        _indexes[filename] = index
+    return index
+
+
+def _get_filename(obj: Any) -> Optional[str]:
+    if inspect.ismodule(obj):
+        filename = getattr(obj, "__file__", None)
+    elif inspect.isclass(obj):
+        module = sys.modules.get(obj.__module__)
+        filename = getattr(module, "__file__", None)
+    else:
+        filename = obj.__code__.co_filename
+    if filename and filename.endswith(".py"):
+        return filename
+    return None
+
+
+def _resolve(obj: Any) -> tuple[Any, Optional[SourceIndex]]:
+    # Unwrap the object like `inspect.getsourcelines` does, and get the index of its source file.
+    obj = inspect.unwrap(obj)
+    if inspect.ismethod(obj):
+        obj = obj.__func__
+    if not (inspect.ismodule(obj) or inspect.isclass(obj) or inspect.isfunction(obj)):
+        return obj, None
+    filename = _get_filename(obj)
+    return obj, get_index(filename) if filename else None
+
+
+def getsourcelines(obj: Any) -> tuple[list[str], int]:
+    """Return the source lines of an object, and the number of its first line.
+
+    This is a drop-in replacement for [`inspect.getsourcelines`][inspect.getsourcelines],
+    using the [source indexes][pytkdocs.parsers.source_index.get_index].
+    It falls back to `inspect.getsourcelines` for objects not defined in Python source files.
+
+    Arguments:
+        obj: A module, class, method or function.
+
+    Raises:
+        OSError: When the source code cannot be retrieved.
+        TypeError: When the object is a built-in module, class or function.
+
+    Returns:
+        The source lines, and the number of the first line (zero for modules).
+    """
+    obj, index = _resolve(obj)
+    if index is None:
+        return inspect.getsourcelines(obj)
+
+    if inspect.ismodule(obj):
+        return index.lines, 0
+
+    if inspect.isclass(obj):
+        firstlineno = vars(obj).get("__firstlineno__")
+        if firstlineno is not None:
+            lnum = firstlineno - 1
+        elif obj.__qualname__ in index.classes:
+            lnum = first_line(index.classes[obj.__qualname__])
+        else:
+            return inspect.getsourcelines(obj)
+    else:
+        lnum = index.find_code(obj.__code__)
+
+    return inspect.getblock(index.lines[lnum:]), lnum + 1
+
+
+def getsource(obj: Any) -> str:
+    """Return the source code of an object.
+
+    This is a drop-in replacement for [`inspect.getsource`][inspect.getsource],
+    see [`getsourcelines`][pytkdocs.parsers.source_index.getsourcelines].
+
+    Arguments:
+        obj: A module, class, method or function.
+
+    Returns:
+        The source code.
+    """
+    return "".join(getsourcelines(obj)[0])
+
+
+def get_definition(obj: Any) -> Optional[Union[ast.Module, _Definition]]:
+    """Return the syntax tree node defining an object, from the source indexes.
+
+    Every node of a file comes from a single parse of this file,
+    instead of a parse of the source of each object.
+
+    Arguments:
+        obj: A module, class, method or function.
+
+    Returns:
+        The module, class or function node, or `None` if it cannot be found.
+    """
+    try:
+        obj, index = _resolve(obj)
+    except ValueError:
+        return None
+    if index is None:
+        return None
+    try:
+        if inspect.ismodule(obj):
+            return index.tree
+        if inspect.isclass(obj):
+            return index.classes.get(obj.__qualname__)
+        return index.functions.get(index.find_code(obj.__code__))
+    except (OSError, SyntaxError, ValueError):
+        return None
@@ -0,0 +1,143 @@
+"""This module contains utilities to recycle long-running processes.
+
+In line-by-line mode, a process keeps the modules it imported,
+and the entries of its caches, for as long as it runs.
+A [`Recycler`][pytkdocs.recycling.Recycler] checks configured [`Limits`][pytkdocs.recycling.Limits]
+after each request, and when one of them is reached, it either clears the caches,
+or replaces the process with a fresh one (on POSIX systems), reading the next requests from the same input.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import sys
+from dataclasses import dataclass
+from typing import IO, TYPE_CHECKING
+
+from pytkdocs import caches
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@dataclass
+class Limits:
+    """Dataclass describing the limits after which a process is recycled."""
+
+    max_requests: int | None = None
+    """Maximum number of requests processed."""
+    max_rss: int | None = None
+    """Maximum resident memory, in bytes."""
+    max_cache_entries: int | None = None
+    """Maximum number of entries in the caches."""
+
+
+def get_rss() -> int | None:
+    """Return the memory currently used by the process (its resident set size).
+
+    When the current value cannot be obtained, the peak value is returned instead.
+
+    Returns:
+        The resident set size in bytes, or `None` if it cannot be obtained.
+    """
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource  # noqa: PLC0415
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes everywhere else.
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def read_lines(stream: IO[str]) -> Iterator[str]:
+    """Read lines without reading ahead.
+
+    Lines are read byte by byte from the raw stream when possible,
+    so that unread lines are still available to a process replacing this one.
+
+    Arguments:
+        stream: The stream to read lines from.
+
+    Yields:
+        Lines of text.
+    """
+    raw = getattr(getattr(stream, "buffer", None), "raw", None)
+    if raw is None:
+        yield from stream
+        return
+    while True:
+        line = raw.readline()
+        if not line:
+            return
+        yield line.decode("utf8")
+
+
+class Recycler:
+    """Check limits after each request, and recycle the process when one of them is reached."""
+
+    def __init__(self, limits: Limits, argv: list[str] | None = None, status_output: IO[str] | None = None) -> None:
+        """Initialize the object.
+
+        Arguments:
+            limits: The limits to check.
+            argv: The command-line arguments to run a new process with, when replacing this one.
+                When not provided, the process is never replaced, and only its caches are cleared.
+                Only provide them if the input is read with [`read_lines`][pytkdocs.recycling.read_lines].
+            status_output: Where to write status records. Default: standard error.
+        """
+        self.limits = limits
+        self.argv = argv
+        self.status_output = status_output
+        self.requests = 0
+
+    def count_request(self) -> str | None:
+        """Count a request, and check the limits.
+
+        Returns:
+            The reason to recycle the process, if a limit was reached.
+        """
+        self.requests += 1
+        if self.limits.max_requests and self.requests >= self.limits.max_requests:
+            return "max-requests"
+        if self.limits.max_rss and (get_rss() or 0) >= self.limits.max_rss:
+            return "max-rss"
+        if self.limits.max_cache_entries and caches.size() >= self.limits.max_cache_entries:
+            return "max-cache-entries"
+        return None
+
+    def recycle(self, reason: str) -> None:
+        """Recycle the process.
+
+        Imported modules can only be released by replacing the process,
+        which is done when the number of requests or the memory limit is reached (if possible).
+        Otherwise, the caches are cleared.
+        A status record describing what is done and why is written before that.
+
+        Arguments:
+            reason: Why the process is recycled.
+        """
+        reexec = self.argv is not None and reason != "max-cache-entries" and os.name == "posix"
+        status = {
+            "status": "recycling",
+            "reason": reason,
+            "action": "re-exec" if reexec else "clear-caches",
+            "requests": self.requests,
+            "rss": get_rss(),
+            "cache_entries": caches.size(),
+        }
+        print(json.dumps(status), file=self.status_output or sys.stderr, flush=True)
+
+        if reexec:
+            sys.__stdout__.flush()  # type: ignore[union-attr]
+            os.execv(sys.executable, [sys.executable, "-m", "pytkdocs", *self.argv])  # type: ignore[misc]  # noqa: S606
+
+        caches.clear()
+        gc.collect()
+        self.requests = 0
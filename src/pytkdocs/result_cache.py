@@ -0,0 +1,412 @@
+"""This module contains a persistent cache of documentation results.
+
+Most requests document objects whose source code did not change since the last time they were documented.
+Results are stored with a key made of a [fingerprint][pytkdocs.result_cache.fingerprint]
+of the source files of the top-level package of the object, the pytkdocs and Python versions,
+and the object configuration (path, members and loader options).
+Unchanged objects are then returned from the cache without importing anything.
+
+The cache is enabled with the `--cache-dir` command-line option (see [`DirectoryCache`][pytkdocs.result_cache.DirectoryCache]),
+or the `--cache-db` one (see [`SQLiteCache`][pytkdocs.result_cache.SQLiteCache]).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+from contextlib import suppress
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+from pytkdocs import caches
+
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Iterator
+
+active: ResultCache | None = None
+"""The cache used when documenting objects, if any. It is set by the command-line options."""
+
+
+class ResultCache(metaclass=ABCMeta):
+    """Base class for caches of documentation results.
+
+    Results are JSON-serializable dictionaries.
+    Caches must be picklable, to be sent to worker processes.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> dict | None:
+        """Get a result.
+
+        Arguments:
+            key: The key of the result, see [`fingerprint`][pytkdocs.result_cache.fingerprint].
+
+        Returns:
+            The result, or `None` if it is not in the cache.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, result: dict) -> None:
+        """Store a result.
+
+        Arguments:
+            key: The key of the result, see [`fingerprint`][pytkdocs.result_cache.fingerprint].
+            result: The result.
+        """
+        raise NotImplementedError
+
+    def claim(self, key: str) -> bool:  # noqa: ARG002
+        """Claim the computation of a missing result, for other processes to wait for it instead of computing it too.
+
+        Arguments:
+            key: The key of the result.
+
+        Returns:
+            Whether the caller should compute the result (it is not being computed by another process).
+        """
+        return True
+
+    def release(self, key: str) -> None:  # noqa: ARG002
+        """Release a claim, once the result is stored, or could not be computed.
+
+        Arguments:
+            key: The key of the result.
+        """
+        # Nothing to release: results are not claimed by default.
+        return
+
+    def wait(self, key: str, deadline: float | None = None) -> dict | None:  # noqa: ARG002
+        """Wait for a result being computed by another process.
+
+        Arguments:
+            key: The key of the result.
+            deadline: An optional time (in the clock of `time.monotonic`) after which to stop waiting.
+
+        Returns:
+            The result, or `None` if the other process failed to compute it, or did not compute it in time.
+        """
+        return self.get(key)
+
+
+class DirectoryCache(ResultCache):
+    """A cache storing each result in a JSON file of a directory.
+
+    Files are written atomically, so several processes can share the same directory.
+    When the total size of the files exceeds a limit, the least recently used ones are removed.
+    """
+
+    def __init__(self, directory: str, max_size: int | None = None) -> None:
+        """Initialize the object.
+
+        Arguments:
+            directory: The directory in which to store results. It is created if needed.
+            max_size: The maximum total size of the stored results, in bytes.
+        """
+        self.directory = directory
+        self.max_size = max_size
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> dict | None:  # noqa: D102
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf8") as file:
+                result = json.load(file)
+        except (OSError, ValueError):
+            return None
+        # The modification time tells which results were used least recently.
+        # It cannot be updated in read-only caches, which are still used.
+        with suppress(OSError):
+            os.utime(path)
+        return result
+
+    def set(self, key: str, result: dict) -> None:  # noqa: D102
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            descriptor, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(descriptor, "w", encoding="utf8") as file:
+                    json.dump(result, file)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            return
+        if self.max_size is not None:
+            self.evict(self.max_size)
+
+    def _entries(self) -> Iterator[os.DirEntry]:
+        try:
+            shards = list(os.scandir(self.directory))
+        except OSError:
+            return
+        for shard in shards:
+            if shard.is_dir():
+                try:
+                    yield from (entry for entry in os.scandir(shard.path) if entry.name.endswith(".json"))
+                except OSError:
+                    continue
+
+    def evict(self, max_size: int) -> None:
+        """Remove the least recently used results until their total size is below a limit.
+
+        Arguments:
+            max_size: The maximum total size of the stored results, in bytes.
+        """
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= max_size:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total_size -= size
+
+
+class SQLiteCache(ResultCache):
+    """A cache storing results in an SQLite database.
+
+    Several processes (for example parallel builds) can use the same database at the same time.
+    When a process starts computing a missing result, it [claims][pytkdocs.result_cache.ResultCache.claim] it,
+    and the other processes needing the same result wait for it instead of computing it too.
+    When the total size of the results exceeds a limit, the least recently used ones are removed.
+    """
+
+    def __init__(self, database: str, max_size: int | None = None, claim_timeout: float = 60) -> None:
+        """Initialize the object.
+
+        Arguments:
+            database: The path of the database file. It is created if needed.
+            max_size: The maximum total size of the stored results, in bytes.
+            claim_timeout: After this number of seconds, claims are considered abandoned
+                (for example by a process that crashed), and waiting processes compute the results themselves.
+        """
+        self.database = database
+        self.max_size = max_size
+        self.claim_timeout = claim_timeout
+        self._local = threading.local()
+
+    def __getstate__(self) -> dict:
+        # Connections cannot be sent to other processes.
+        return {name: value for name, value in vars(self).items() if name != "_local"}
+
+    def __setstate__(self, state: dict) -> None:
+        vars(self).update(state)
+        self._local = threading.local()
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        # SQLite connections cannot be shared between threads: each thread has its own.
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            import sqlite3  # noqa: PLC0415
+
+            connection = sqlite3.connect(self.database, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, path TEXT NOT NULL, result TEXT NOT NULL, size INTEGER NOT NULL, used REAL NOT NULL)",
+            )
+            connection.execute("CREATE TABLE IF NOT EXISTS claims (key TEXT PRIMARY KEY, claimed REAL NOT NULL)")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> dict | None:  # noqa: D102
+        import sqlite3  # noqa: PLC0415
+
+        try:
+            row = self._connection.execute("SELECT result FROM results WHERE key = ?", (key,)).fetchone()
+            if row is not None and self.max_size is not None:
+                self._connection.execute("UPDATE results SET used = ? WHERE key = ?", (time.time(), key))
+        except sqlite3.Error:
+            return None
+        return None if row is None else json.loads(row[0])
+
+    def set(self, key: str, result: dict) -> None:  # noqa: D102
+        import sqlite3  # noqa: PLC0415
+
+        data = json.dumps(result)
+        path = result.get("object", {}).get("path", "")
+        try:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results (key, path, result, size, used) VALUES (?, ?, ?, ?, ?)",
+                (key, path, data, len(data), time.time()),
+            )
+            if self.max_size is not None:
+                self.evict(self.max_size)
+        except sqlite3.Error:
+            return
+
+    def evict(self, max_size: int) -> None:
+        """Remove the least recently used results until their total size is below a limit.
+
+        Arguments:
+            max_size: The maximum total size of the stored results, in bytes.
+        """
+        connection = self._connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            total_size = connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+            if total_size > max_size:
+                evicted = []
+                for key, size in connection.execute("SELECT key, size FROM results ORDER BY used"):
+                    if total_size <= max_size:
+                        break
+                    evicted.append((key,))
+                    total_size -= size
+                connection.executemany("DELETE FROM results WHERE key = ?", evicted)
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def claim(self, key: str) -> bool:  # noqa: D102
+        import sqlite3  # noqa: PLC0415
+
+        now = time.time()
+        try:
+            self._connection.execute(
+                "DELETE FROM claims WHERE key = ? AND claimed < ?",
+                (key, now - self.claim_timeout),
+            )
+            cursor = self._connection.execute("INSERT OR IGNORE INTO claims (key, claimed) VALUES (?, ?)", (key, now))
+        except sqlite3.Error:
+            return True
+        return cursor.rowcount == 1
+
+    def release(self, key: str) -> None:  # noqa: D102
+        import sqlite3  # noqa: PLC0415
+
+        try:
+            self._connection.execute("DELETE FROM claims WHERE key = ?", (key,))
+        except sqlite3.Error:
+            return
+
+    def wait(self, key: str, deadline: float | None = None) -> dict | None:  # noqa: D102
+        import sqlite3  # noqa: PLC0415
+
+        limit = time.monotonic() + self.claim_timeout
+        if deadline is not None:
+            limit = min(limit, deadline)
+        delay = 0.01
+        while (remaining := limit - time.monotonic()) > 0:
+            result = self.get(key)
+            if result is not None:
+                return result
+            try:
+                claim = self._connection.execute("SELECT claimed FROM claims WHERE key = ?", (key,)).fetchone()
+            except sqlite3.Error:
+                return None
+            if claim is None:
+                # Released without a result: computing it failed.
+                return self.get(key)
+            if claim[0] < time.time() - self.claim_timeout:
+                # Abandoned, for example by a process that crashed while computing the result.
+                return None
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.5)
+        return None
+
+
+_digests: dict[str, tuple[tuple[int, int], str]] = {}
+caches.register(lambda: len(_digests), _digests.clear)
+
+
+def file_digest(filename: str) -> str | None:
+    """Hash the contents of a file.
+
+    Digests are cached, and only computed again when the modification time or the size of the file changes.
+
+    Arguments:
+        filename: The path of the file.
+
+    Returns:
+        The SHA-256 digest of the file contents, or `None` if the file cannot be read.
+    """
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _digests.get(filename)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    try:
+        with open(filename, "rb") as file:
+            digest = hashlib.sha256(file.read()).hexdigest()
+    except OSError:
+        return None
+    _digests[filename] = (signature, digest)
+    return digest
+
+
+def _package_files(module_name: str) -> list[str] | None:
+    from pytkdocs.static import find_spec  # noqa: PLC0415
+
+    spec = find_spec(module_name)
+    if spec is None:
+        return None
+    if spec.submodule_search_locations is None:
+        if not (spec.has_location and spec.origin and spec.origin.endswith(".py")):
+            return None
+        return [spec.origin]
+    files: list[str] = []
+    for location in spec.submodule_search_locations:
+        for root, dirs, filenames in os.walk(location):
+            dirs[:] = sorted(dirname for dirname in dirs if dirname != "__pycache__" and not dirname.startswith("."))
+            files.extend(os.path.join(root, filename) for filename in sorted(filenames) if filename.endswith(".py"))
+    return files
+
+
+@cache
+def _versions() -> tuple[str, str]:
+    from pytkdocs.debug import get_version  # noqa: PLC0415
+
+    return get_version(), sys.version
+
+
+def fingerprint(obj_config: dict) -> str | None:
+    """Compute the cache key of an object configuration.
+
+    The key changes when any source file of the top-level package of the object changes
+    (without importing it), when the version of pytkdocs or Python changes, or when the configuration changes.
+    Changes in other packages (for example the ones defining parent classes) are not detected.
+
+    Arguments:
+        obj_config: The object configuration: its path, its members, and the options of the loader.
+
+    Returns:
+        The key, or `None` if the object cannot be cached (its source files cannot be found).
+    """
+    top_module = obj_config["path"].split(":", 1)[0].split(".", 1)[0]
+    files = _package_files(top_module)
+    if not files:
+        return None
+    digests = []
+    for filename in files:
+        digest = file_digest(filename)
+        if digest is None:
+            return None
+        digests.append((filename, digest))
+    key: dict[str, Any] = {"versions": _versions(), "config": obj_config, "files": digests}
+    return hashlib.sha256(json.dumps(key, sort_keys=True, default=repr).encode()).hexdigest()
@@ -1,12 +1,18 @@
 """This module defines function to serialize objects.
 
 These functions simply take objects as parameters and return dictionaries that can be dumped by `json.dumps`.
+
+For big object trees, [`write_object`][pytkdocs.serializer.write_object] writes JSON bytes
+directly from the objects instead, without building the whole tree of dictionaries first.
+It uses [`orjson`](https://github.com/ijl/orjson) to encode values when it is installed.
 """
 
 import inspect
+import json
 import re
+from collections.abc import Iterator
 from re import Match, Pattern
-from typing import Any, Optional
+from typing import IO, Any, Optional
 
 from pytkdocs.objects import Object, Source
 from pytkdocs.parsers.docstrings.base import AnnotatedObject, Attribute, Parameter, Section
@@ -19,6 +25,12 @@ except ImportError:
         """GenericMeta type."""
 
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
 RE_OPTIONAL: Pattern = re.compile(r"Union\[(.+), NoneType\]")
 """Regular expression to match optional annotations of the form `Union[T, NoneType]`."""
 
@@ -195,15 +207,24 @@ def serialize_source(source: Optional[Source]) -> dict:
     return {}
 
 
-def serialize_object(obj: Object) -> dict:
+def serialize_object(obj: Object, *, submodules: bool = True) -> dict:
     """Serialize an instance of a subclass of [`Object`][pytkdocs.objects.Object].
 
     Arguments:
         obj: The object to serialize.
+        submodules: Whether to serialize the submodules in the object's children.
+            When false, submodules are still listed in `modules`, but not in `children`.
 
     Returns:
         A JSON-serializable dictionary.
     """
+    serialized = _serialize_fields(obj)
+    serialized["children"] = {child.path: serialize_object(child) for child in _get_children(obj, submodules)}
+    return serialized
+
+
+def _serialize_fields(obj: Object) -> dict:
+    # Children are left empty, for the caller to serialize them.
     serialized = {
         "name": obj.name,
         "path": obj.path,
@@ -216,7 +237,7 @@ def serialize_object(obj: Object) -> dict:
         "docstring": obj.docstring,
         "docstring_sections": [serialize_docstring_section(sec) for sec in obj.docstring_sections],
         "source": serialize_source(obj.source),
-        "children": {child.path: serialize_object(child) for child in obj.children},
+        "children": {},
         "attributes": [attr.path for attr in obj.attributes],
         "methods": [meth.path for meth in obj.methods],
         "functions": [func.path for func in obj.functions],
@@ -230,3 +251,80 @@ def serialize_object(obj: Object) -> dict:
     if hasattr(obj, "bases"):
         serialized["bases"] = obj.bases
     return serialized
+
+
+def _get_children(obj: Object, submodules: bool) -> list[Object]:  # noqa: FBT001
+    if submodules:
+        return obj.children
+    return [child for child in obj.children if child.category != "module"]
+
+
+def encode(value: Any) -> bytes:
+    """Encode a JSON-serializable value as JSON bytes.
+
+    [`orjson`](https://github.com/ijl/orjson) is used when it is installed,
+    otherwise the result is the same as `json.dumps(value).encode()`.
+
+    Arguments:
+        value: The value to encode.
+
+    Returns:
+        The JSON bytes.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            # orjson is stricter than json, for example with lone surrogates in strings
+            pass
+    return json.dumps(value).encode()
+
+
+def write_object(obj: Object, writer: IO[bytes]) -> None:
+    """Write an instance of a subclass of [`Object`][pytkdocs.objects.Object] as JSON bytes.
+
+    The result is equivalent to `json.dumps(serialize_object(obj))`,
+    but children are written one after the other, directly into the writer,
+    instead of being collected in a tree of dictionaries and in a string first.
+
+    Arguments:
+        obj: The object to write.
+        writer: A binary writer, preferably buffered.
+    """
+    item_separator, key_separator = (b",", b":") if orjson is not None else (b", ", b": ")
+    writer.write(b"{")
+    for index, (key, value) in enumerate(_serialize_fields(obj).items()):
+        if index:
+            writer.write(item_separator)
+        writer.write(encode(key))
+        writer.write(key_separator)
+        if key == "children":
+            writer.write(b"{")
+            for child_index, child in enumerate(obj.children):
+                if child_index:
+                    writer.write(item_separator)
+                writer.write(encode(child.path))
+                writer.write(key_separator)
+                write_object(child, writer)
+            writer.write(b"}")
+        else:
+            writer.write(encode(value))
+    writer.write(b"}")
+
+
+def iter_serialized_modules(obj: Object) -> Iterator[dict]:
+    """Serialize an object and each of its submodules separately.
+
+    The object is yielded first, then its submodules, depth-first.
+    None of them contain their submodules in their `children`,
+    so that only one module is serialized at a time (the object tree itself is kept whole).
+
+    Arguments:
+        obj: The object to serialize.
+
+    Yields:
+        JSON-serializable dictionaries.
+    """
+    yield serialize_object(obj, submodules=False)
+    for module in obj.modules:
+        yield from iter_serialized_modules(module)
@@ -0,0 +1,149 @@
+"""This module contains the socket server.
+
+The server listens on a Unix socket and handles each connection in its own thread.
+Each connection speaks the same protocol as the line-by-line mode:
+one line of JSON is read, one line of JSON is written back.
+
+Since all the clients are served by the same process, imported modules and
+the various caches of `pytkdocs` are shared between them, and are kept warm
+from one client to the next.
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import signal
+import socket
+import socketserver
+import stat
+import threading
+from contextlib import contextmanager, nullcontext, suppress
+from typing import TYPE_CHECKING
+
+from pytkdocs.cli import discarded_stdout, process_line
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import FrameType
+
+    from pytkdocs.incremental import ModuleTracker
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Handle the requests sent on a single connection."""
+
+    def handle(self) -> None:
+        """Read lines of JSON until the client closes the connection, and answer each one of them."""
+        tracker = self.server.tracker  # type: ignore[attr-defined]
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            with nullcontext() if tracker is None else tracker.request():
+                output = process_line(line.decode("utf8"))
+            self.wfile.write(output.encode("utf8") + b"\n")
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+
+    class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):  # type: ignore[name-defined]
+        """A threading server listening on a Unix socket."""
+
+        daemon_threads = True
+        """Don't wait for connections to be closed when shutting down."""
+
+        def __init__(self, socket_path: str, tracker: ModuleTracker | None = None) -> None:
+            """Initialize the server.
+
+            Arguments:
+                socket_path: The path of the Unix socket to listen on.
+                tracker: A module tracker, to drop the modules that changed before each request.
+            """
+            self.tracker = tracker
+            super().__init__(socket_path, RequestHandler)
+
+else:  # pragma: no cover
+
+    class Server:  # type: ignore[no-redef]
+        """Placeholder used on platforms without Unix sockets."""
+
+        def __init__(self, socket_path: str, tracker: ModuleTracker | None = None) -> None:  # noqa: ARG002
+            """Raise an error: Unix sockets are not supported on this platform.
+
+            Arguments:
+                socket_path: The path of the Unix socket to listen on.
+                tracker: A module tracker.
+
+            Raises:
+                OSError: Always.
+            """
+            raise OSError("Unix sockets are not supported on this platform")
+
+
+def _is_listening(socket_path: str) -> bool:
+    with socket.socket(socket.AF_UNIX) as client:
+        try:
+            client.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+def remove_stale_socket(socket_path: str) -> None:
+    """Remove a socket file left behind by a previous server.
+
+    Regular files are never removed, and neither are the sockets of servers still listening on them.
+
+    Arguments:
+        socket_path: The path of the Unix socket.
+
+    Raises:
+        OSError: When a server is still listening on the socket.
+    """
+    with suppress(FileNotFoundError):
+        if stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            if _is_listening(socket_path):
+                raise OSError(errno.EADDRINUSE, "A server is already listening on this socket", socket_path)
+            os.unlink(socket_path)
+
+
+@contextmanager
+def _shutdown_on_sigterm(server: Server) -> Iterator[None]:
+    # Signal handlers can only be installed from the main thread.
+    if threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def handler(signum: int, frame: FrameType | None) -> None:  # noqa: ARG001
+        # `shutdown` waits for `serve_forever` to return, which runs in this very thread.
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    previous = signal.signal(signal.SIGTERM, handler)
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+
+
+def serve(socket_path: str, tracker: ModuleTracker | None = None) -> None:
+    """Serve requests on a Unix socket until interrupted or terminated.
+
+    Anything printed on the standard output while serving
+    (for example by imported modules) is discarded.
+    The socket file is removed when the server stops.
+
+    Arguments:
+        socket_path: The path of the Unix socket to listen on.
+        tracker: A module tracker, to drop the modules that changed before each request,
+            for them to be documented again.
+    """
+    remove_stale_socket(socket_path)
+    with discarded_stdout(), Server(socket_path, tracker) as server:
+        try:
+            with _shutdown_on_sigterm(server):
+                server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            remove_stale_socket(socket_path)
@@ -0,0 +1,779 @@
+"""This module contains a loader documenting objects from their source files, without importing them.
+
+Importing a module runs its code, which can be slow, or fail, for packages with heavy import-time side effects.
+The [`StaticLoader`][pytkdocs.static.StaticLoader] finds modules like the import system would,
+but without running any code, parses their source files, and builds the same objects
+as the [`Loader`][pytkdocs.loader.Loader] from their syntax trees. Some differences remain:
+
+- annotations are the source code of the annotations, as strings;
+- default values of parameters are represented by their source code;
+- only members defined in the source code are found (not inherited nor dynamically created ones);
+- models of third-party libraries (Pydantic, Django, Marshmallow) are documented as regular classes,
+  but dataclasses are supported.
+
+Every object documented this way has the `static` property.
+"""
+
+import ast
+import inspect
+import os
+import pkgutil
+import sys
+from contextlib import suppress
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from pytkdocs.objects import Attribute, Class, Function, Method, Module, Object, Source
+from pytkdocs.parsers.attributes import (
+    RECURSIVE_NODES,
+    combine,
+    get_instance_attributes_from_nodes,
+    get_module_or_class_attributes,
+    unparse,
+)
+from pytkdocs.parsers.source_index import SourceIndex, first_line, get_index
+from pytkdocs.properties import RE_SPECIAL
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pytkdocs.loader import Loader
+
+_Definition = Union[ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef]
+_Function = Union[ast.FunctionDef, ast.AsyncFunctionDef]
+
+STATIC_PROPERTY = "static"
+"""The property of objects documented from their source files only."""
+
+
+class SourceValue:
+    """A value represented by its source code, like the default value of a parameter."""
+
+    def __init__(self, code: str) -> None:
+        """Initialize the object.
+
+        Arguments:
+            code: The source code of the value.
+        """
+        self.code = code
+
+    def __repr__(self) -> str:
+        return self.code
+
+
+def find_spec(module_path: str) -> Optional[ModuleSpec]:
+    """Find a module without importing it, nor its parent packages.
+
+    Arguments:
+        module_path: The dotted path of the module.
+
+    Returns:
+        The module specification, or `None` if the module cannot be found.
+    """
+    parts = module_path.split(".")
+    spec = None
+    search_locations = None
+    for length in range(1, len(parts) + 1):
+        if length > 1 and search_locations is None:
+            return None
+        spec = _find_spec(".".join(parts[:length]), search_locations)
+        if spec is None:
+            return None
+        search_locations = spec.submodule_search_locations
+        if search_locations is not None:
+            search_locations = list(search_locations)
+    return spec
+
+
+def _find_spec(name: str, search_locations: Optional[list[str]]) -> Optional[ModuleSpec]:
+    for finder in sys.meta_path:
+        finder_find_spec = getattr(finder, "find_spec", None)
+        if finder_find_spec is None:
+            continue
+        try:
+            spec = finder_find_spec(name, search_locations)
+        except Exception:  # noqa: BLE001, S112
+            continue
+        if spec is not None:
+            return spec
+    return None
+
+
+class StaticModule:
+    """A module found by [`find_spec`][pytkdocs.static.find_spec], and its parsed source file."""
+
+    def __init__(self, path: str, spec: ModuleSpec) -> None:
+        """Initialize the object.
+
+        Arguments:
+            path: The dotted path of the module.
+            spec: The module specification.
+        """
+        self.path = path
+        self.spec = spec
+        self.is_package = spec.submodule_search_locations is not None
+        origin = spec.origin if spec.has_location else None
+        self.index: Optional[SourceIndex] = None
+        self.file_path = ""
+        if origin:
+            if not origin.endswith(".py"):
+                raise ImportError(f"Cannot load '{path}' statically: '{origin}' is not a Python source file")
+            self.index = get_index(origin)
+            self.file_path = os.path.normcase(os.path.abspath(origin))
+        self.body: list[ast.stmt] = self.index.tree.body if self.index else []
+        self.definitions = _get_definitions(self.body)
+        self.imports = self._get_imports()
+
+    def _get_imports(self) -> dict[str, str]:
+        imports = {}
+        for node in _iter_statements(self.body):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.asname:
+                        imports[alias.asname] = alias.name
+                    else:
+                        top_name = alias.name.split(".", 1)[0]
+                        imports[top_name] = top_name
+            elif isinstance(node, ast.ImportFrom):
+                base = self._resolve_relative(node.module, node.level)
+                for alias in node.names:
+                    if alias.name != "*":
+                        imports[alias.asname or alias.name] = f"{base}.{alias.name}"
+        return imports
+
+    def _resolve_relative(self, module: Optional[str], level: int) -> str:
+        if not level:
+            return module or ""
+        parts = self.path.split(".")
+        if not self.is_package:
+            parts = parts[:-1]
+        if level > 1:
+            parts = parts[: -(level - 1)]
+        if module:
+            parts.append(module)
+        return ".".join(parts)
+
+    def resolve_name(self, name: str) -> str:
+        """Return the full dotted path of a name used in the module.
+
+        Arguments:
+            name: A name, or a dotted name (the first part is resolved).
+
+        Returns:
+            The resolved dotted path, or the name itself if it cannot be resolved.
+        """
+        first, _, rest = name.partition(".")
+        if first in self.imports:
+            resolved = self.imports[first]
+        elif first in self.definitions:
+            resolved = f"{self.path}.{first}"
+        else:
+            return name
+        return f"{resolved}.{rest}" if rest else resolved
+
+    def get_source(self, node: _Definition) -> Optional[Source]:
+        """Get the source of a class or function defined in the module.
+
+        Arguments:
+            node: The definition node.
+
+        Returns:
+            The source, like the one [`Loader`][pytkdocs.loader.Loader] gets with `inspect.getsourcelines`.
+        """
+        if self.index is None:
+            return None
+        lnum = first_line(node)
+        return Source(inspect.getblock(self.index.lines[lnum:]), lnum + 1)
+
+
+def _iter_statements(nodes: list[ast.stmt]) -> "Iterator[ast.stmt]":
+    # Iterate on statements, also yielding the statements in conditional blocks.
+    for node in nodes:
+        if isinstance(node, ast.Try):
+            yield from _iter_statements(node.body)
+            for handler in node.handlers:
+                yield from _iter_statements(handler.body)
+            yield from _iter_statements(node.orelse)
+            yield from _iter_statements(node.finalbody)
+        elif isinstance(node, ast.If):
+            yield from _iter_statements(node.body)
+            yield from _iter_statements(node.orelse)
+        elif isinstance(node, RECURSIVE_NODES):
+            yield from _iter_statements(node.body)  # type: ignore[attr-defined,arg-type]
+        else:
+            yield node
+
+
+def _get_definitions(nodes: list[ast.stmt]) -> dict[str, _Definition]:
+    # The last definition wins, as it would at runtime,
+    # except for properties setters and deleters, which do not replace their getter.
+    # Aliases of definitions (`alias = function`) are definitions as well.
+    definitions: dict[str, _Definition] = {}
+    for node in _iter_statements(nodes):
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            if node.name in definitions and _is_property_accessor(node):
+                continue
+            definitions[node.name] = node
+        elif isinstance(node, ast.Assign) and isinstance(node.value, ast.Name) and node.value.id in definitions:
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    definitions[target.id] = definitions[node.value.id]
+    return definitions
+
+
+def _get_assigned_names(nodes: list[ast.stmt]) -> set[str]:
+    # Names that have a value at runtime: annotations without values do not create attributes.
+    names = set()
+    for node in _iter_statements(nodes):
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    names.add(target.id)
+                elif isinstance(target, ast.Tuple):
+                    names.update(name.id for name in target.elts if isinstance(name, ast.Name))
+        elif isinstance(node, ast.AnnAssign) and node.value is not None and isinstance(node.target, ast.Name):
+            names.add(node.target.id)
+    return names
+
+
+def _get_all_names(nodes: list[ast.stmt]) -> Optional[set[str]]:
+    # Names listed in `__all__`, when it is a literal list or tuple of strings, possibly extended with `+=`.
+    names: Optional[set[str]] = None
+    for node in _iter_statements(nodes):
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "__all__" for target in node.targets
+        ):
+            value: Optional[ast.expr] = node.value
+        elif isinstance(node, (ast.AnnAssign, ast.AugAssign)) and isinstance(node.target, ast.Name):
+            if node.target.id != "__all__":
+                continue
+            value = node.value
+        else:
+            continue
+        try:
+            literal = ast.literal_eval(value) if value is not None else None
+        except ValueError:
+            return None
+        if not (isinstance(literal, (list, tuple)) and all(isinstance(name, str) for name in literal)):
+            return None
+        if isinstance(node, ast.AugAssign):
+            if names is None or not isinstance(node.op, ast.Add):
+                return None
+            names.update(literal)
+        else:
+            names = set(literal)
+    return names
+
+
+def _get_annotations(nodes: list[ast.stmt]) -> dict[str, str]:
+    return {
+        node.target.id: _annotation_to_string(node.annotation)
+        for node in _iter_statements(nodes)
+        if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name)
+    }
+
+
+def _get_attributes_data(nodes: list[ast.stmt]) -> dict:
+    return combine(get_module_or_class_attributes(nodes), _get_annotations(nodes))
+
+
+def _unparse(node: ast.AST) -> str:
+    return unparse(node).strip()
+
+
+def _annotation_to_string(node: ast.expr) -> str:
+    # String annotations (forward references) are evaluated by `typing.get_type_hints` at runtime.
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return _unparse(node)
+
+
+def _decorators(node: _Definition) -> list[str]:
+    return [
+        _unparse(decorator.func if isinstance(decorator, ast.Call) else decorator) for decorator in node.decorator_list
+    ]
+
+
+def _has_decorator(node: _Definition, *names: str) -> bool:
+    return any(decorator.rsplit(".", 1)[-1] in names for decorator in _decorators(node))
+
+
+def _is_property_accessor(node: _Definition) -> bool:
+    accessors = {f"{node.name}.setter", f"{node.name}.deleter", f"{node.name}.getter"}
+    return any(decorator in accessors for decorator in _decorators(node))
+
+
+def _has_setter(name: str, nodes: list[ast.stmt]) -> bool:
+    return any(
+        isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and f"{name}.setter" in _decorators(node)
+        for node in _iter_statements(nodes)
+    )
+
+
+def _parameter(arg: ast.arg, kind: Any, default: Optional[ast.expr] = None) -> inspect.Parameter:
+    return inspect.Parameter(
+        arg.arg,
+        kind,
+        default=inspect.Parameter.empty if default is None else SourceValue(_unparse(default)),
+        annotation=inspect.Parameter.empty if arg.annotation is None else _annotation_to_string(arg.annotation),
+    )
+
+
+def get_signature(node: _Function, *, bound: bool = False) -> inspect.Signature:
+    """Build the signature of a function from its definition.
+
+    Arguments:
+        node: The function definition.
+        bound: Whether to drop the first parameter, as in the signature of a bound method.
+
+    Returns:
+        The signature. Annotations are strings, and default values are [`SourceValue`][pytkdocs.static.SourceValue].
+    """
+    args = node.args
+    positional = [*args.posonlyargs, *args.args]
+    defaults: list[Optional[ast.expr]] = [None] * (len(positional) - len(args.defaults))
+    defaults.extend(args.defaults)
+    parameters = []
+    for index, (arg, default) in enumerate(zip(positional, defaults)):
+        kind = (
+            inspect.Parameter.POSITIONAL_ONLY
+            if index < len(args.posonlyargs)
+            else inspect.Parameter.POSITIONAL_OR_KEYWORD
+        )
+        parameters.append(_parameter(arg, kind, default))
+    if args.vararg:
+        parameters.append(_parameter(args.vararg, inspect.Parameter.VAR_POSITIONAL))
+    for arg, kw_default in zip(args.kwonlyargs, args.kw_defaults):
+        parameters.append(_parameter(arg, inspect.Parameter.KEYWORD_ONLY, kw_default))
+    if args.kwarg:
+        parameters.append(_parameter(args.kwarg, inspect.Parameter.VAR_KEYWORD))
+    if (
+        bound
+        and parameters
+        and parameters[0].kind
+        in {
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        }
+    ):
+        parameters = parameters[1:]
+    return_annotation = inspect.Signature.empty if node.returns is None else _annotation_to_string(node.returns)
+    return inspect.Signature(parameters, return_annotation=return_annotation)
+
+
+class StaticLoader:
+    """This class documents objects from their source files, with the options of a [`Loader`][pytkdocs.loader.Loader].
+
+    Errors are stored in the `errors` list of the loader.
+    """
+
+    def __init__(self, loader: "Loader") -> None:
+        """Initialize the object.
+
+        Arguments:
+            loader: The loader providing the options (filters, etc.).
+        """
+        self.loader = loader
+        self._modules: dict[str, StaticModule] = {}
+        self._relative_file_paths: dict[str, str] = {}
+
+    def get_module(self, module_path: str) -> StaticModule:
+        """Find and parse a module.
+
+        Arguments:
+            module_path: The dotted path of the module.
+
+        Raises:
+            ImportError: When the module cannot be found.
+
+        Returns:
+            The module.
+        """
+        if module_path not in self._modules:
+            with self.loader._timed("import"):
+                spec = find_spec(module_path)
+            if spec is None:
+                raise ModuleNotFoundError(f"No module named '{module_path}'", name=module_path)
+            with self.loader._timed("source"):
+                self._modules[module_path] = StaticModule(module_path, spec)
+        return self._modules[module_path]
+
+    def _find_module(self, path: str) -> tuple[StaticModule, list[str]]:
+        if ":" in path or self.loader.new_path_syntax:
+            module_path, _, object_path = path.partition(":")
+            return self.get_module(module_path), object_path.split(".") if object_path else []
+        # Like `get_object_tree`, find the deepest module first.
+        parts = path.split(".")
+        for length in range(len(parts), 0, -1):
+            try:
+                return self.get_module(".".join(parts[:length])), parts[length:]
+            except ImportError:
+                if length == 1:
+                    raise
+        raise ValueError(f"path must be a valid Python path, not {path}")
+
+    def get_object_documentation(
+        self,
+        dotted_path: str,
+        *,
+        members: Optional[Union[set[str], bool]] = None,
+    ) -> Object:
+        """Get the documentation for an object and its children.
+
+        Arguments:
+            dotted_path: The Python dotted path to the desired object.
+            members: `True` to select members and filter them, `False` to select no members,
+                or a list of names to explicitly select the members with these names.
+                It is applied only on the root object.
+
+        Raises:
+            AttributeError: When an element of the path does not exist.
+
+        Returns:
+            The documented object.
+        """
+        if not dotted_path:
+            raise ValueError(f"path must be a valid Python path, not {dotted_path}")
+        if members is True:
+            members = set()
+
+        module, names = self._find_module(dotted_path)
+        parents: list[ast.ClassDef] = []
+        for index, name in enumerate(names):
+            scope = _get_definitions(parents[-1].body) if parents else module.definitions
+            node = scope.get(name)
+            if isinstance(node, ast.ClassDef):
+                parents.append(node)
+                continue
+            path = ".".join([module.path, *(parent.name for parent in parents), name])
+            is_leaf = index == len(names) - 1
+            if not parents and node is None and name in module.imports:
+                # The object was imported: document it where it is defined.
+                return self.get_object_documentation(
+                    ".".join([module.imports[name], *names[index + 1 :]]),
+                    members=members,
+                )
+            if is_leaf and node is not None:
+                if parents:
+                    return self._get_class_member_documentation(module, path, node, parents[-1])
+                return self.get_function_documentation(module, path, node)
+            if is_leaf:
+                body = parents[-1].body if parents else module.body
+                if name in _get_assigned_names(body):
+                    return self.get_attribute_documentation(module, path, _get_attributes_data(body).get(name, {}))
+            owner = parents[-1].name if parents else module.path
+            raise AttributeError(f"'{owner}' has no attribute '{name}'")
+
+        if parents:
+            path = ".".join([module.path, *(parent.name for parent in parents)])
+            return self.get_class_documentation(module, path, parents[-1], select_members=members)
+        return self.get_module_documentation(module, select_members=members)
+
+    def _finalize(self, obj: Object, module: StaticModule) -> Object:
+        obj.properties.append(STATIC_PROPERTY)
+        obj.relative_file_path = self._get_relative_file_path(module)
+        return obj
+
+    def _get_relative_file_path(self, module: StaticModule) -> str:
+        # Same result as `Object.relative_file_path`, without importing the packages.
+        if module.path not in self._relative_file_paths:
+            relative_file_path = ""
+            parts = module.path.split(".")
+            for length in range(1, len(parts) + 1):
+                spec = find_spec(".".join(parts[:length]))
+                if spec is None:
+                    break
+                if spec.has_location and spec.origin:
+                    top_package_path = Path(os.path.normcase(os.path.abspath(spec.origin))).parent
+                    with suppress(ValueError):
+                        relative_file_path = str(Path(module.file_path).relative_to(top_package_path.parent))
+                    break
+            self._relative_file_paths[module.path] = relative_file_path
+        return self._relative_file_paths[module.path]
+
+    def get_module_documentation(
+        self,
+        module: StaticModule,
+        *,
+        select_members: Optional[Union[set[str], bool]] = None,
+    ) -> Module:
+        """Get the documentation for a module and its children.
+
+        Arguments:
+            module: The module.
+            select_members: Explicit members to select.
+
+        Returns:
+            The documented module object.
+        """
+        code = "".join(module.index.lines) if module.index else ""
+        root_object = Module(
+            name=module.path.split(".")[-1],
+            path=module.path,
+            file_path=module.file_path,
+            docstring=ast.get_docstring(module.index.tree) if module.index else None,
+            source=Source(code, 1) if code else None,
+        )
+        self._finalize(root_object, module)
+
+        if select_members is False:
+            return root_object
+
+        select_members = select_members or set()
+
+        with self.loader._timed("attributes"):
+            attributes_data = _get_attributes_data(module.body)
+            assigned_names = _get_assigned_names(module.body)
+        root_object.parse_docstring(self.loader.docstring_parser, attributes=attributes_data)
+
+        all_names = _get_all_names(module.body) if self.loader.members_from_all and not select_members else None
+
+        for member_name in sorted(set(module.definitions) | (assigned_names & set(attributes_data))):
+            self.loader._check_deadline(module.path)
+            if all_names is not None and member_name not in all_names:
+                continue
+            if not self.loader.select(member_name, select_members):  # type: ignore[arg-type]
+                continue
+            path = f"{module.path}.{member_name}"
+            node = module.definitions.get(member_name)
+            if isinstance(node, ast.ClassDef):
+                root_object.add_child(self.get_class_documentation(module, path, node))
+            elif node is not None:
+                root_object.add_child(self.get_function_documentation(module, path, node))
+            else:
+                root_object.add_child(self.get_attribute_documentation(module, path, attributes_data[member_name]))
+
+        if module.is_package:
+            for _, modname, _ in pkgutil.iter_modules(module.spec.submodule_search_locations):
+                if self.loader.select(modname, select_members):  # type: ignore[arg-type]
+                    submodule_path = f"{module.path}.{modname}"
+                    self.loader._check_deadline(submodule_path)
+                    try:
+                        submodule = self.get_module(submodule_path)
+                    except (ImportError, SyntaxError, ValueError) as error:
+                        self.loader.errors.append(f"{submodule_path}: {error}")
+                        continue
+                    root_object.add_child(self.get_module_documentation(submodule))
+
+        return root_object
+
+    def get_class_documentation(
+        self,
+        module: StaticModule,
+        path: str,
+        node: ast.ClassDef,
+        *,
+        select_members: Optional[Union[set[str], bool]] = None,
+    ) -> Class:
+        """Get the documentation for a class and its children.
+
+        Arguments:
+            module: The module in which the class is defined.
+            path: The dotted path of the class.
+            node: The class definition.
+            select_members: Explicit members to select.
+
+        Returns:
+            The documented class object.
+        """
+        bases = [
+            module.resolve_name(_unparse(base.value if isinstance(base, ast.Subscript) else base))
+            for base in node.bases
+        ]
+        root_object = Class(
+            name=path.rsplit(".", 1)[-1],
+            path=path,
+            file_path=module.file_path,
+            docstring=ast.get_docstring(node) or "",
+            bases=bases or None,
+            source=module.get_source(node),
+        )
+        self._finalize(root_object, module)
+
+        with self.loader._timed("attributes"):
+            attributes_data = _get_attributes_data(node.body)
+            assigned_names = _get_assigned_names(node.body)
+        definitions = _get_definitions(node.body)
+        context: dict[str, Any] = {"attributes": attributes_data}
+        init = definitions.get("__init__")
+        if isinstance(init, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            attributes_data.update(get_instance_attributes_from_nodes(init.body))
+            context["signature"] = get_signature(init)
+        root_object.parse_docstring(self.loader.docstring_parser, **context)
+
+        if select_members is False:
+            return root_object
+
+        select_members = select_members or set()
+
+        for member_name in sorted(set(definitions) | (assigned_names & set(attributes_data))):
+            self.loader._check_deadline(path)
+            if not self.loader.select(member_name, select_members):  # type: ignore[arg-type]
+                continue
+            member_path = f"{path}.{member_name}"
+            member = definitions.get(member_name)
+            if isinstance(member, ast.ClassDef):
+                root_object.add_child(self.get_class_documentation(module, member_path, member))
+            elif member is not None:
+                root_object.add_child(self._get_class_member_documentation(module, member_path, member, node))
+            else:
+                root_object.add_child(
+                    self.get_attribute_documentation(module, member_path, attributes_data[member_name]),
+                )
+
+        if _has_decorator(node, "dataclass"):
+            root_object.properties.append("dataclass")
+            for field in _iter_statements(node.body):
+                if (
+                    isinstance(field, ast.AnnAssign)
+                    and isinstance(field.target, ast.Name)
+                    and "ClassVar" not in _unparse(field.annotation)
+                    and self.loader.select(field.target.id, select_members)  # type: ignore[arg-type]
+                ):
+                    field_object = self.get_attribute_documentation(
+                        module,
+                        f"{path}.{field.target.id}",
+                        attributes_data[field.target.id],
+                    )
+                    field_object.properties.insert(0, "dataclass-field")
+                    root_object.add_child(field_object)
+
+        return root_object
+
+    def _get_class_member_documentation(
+        self,
+        module: StaticModule,
+        path: str,
+        node: _Definition,
+        class_node: ast.ClassDef,
+    ) -> Object:
+        if isinstance(node, ast.ClassDef):
+            return self.get_class_documentation(module, path, node)
+        if _has_decorator(node, "property", "cached_property"):
+            return self.get_property_documentation(module, path, node, class_node)
+        if _has_decorator(node, "classmethod"):
+            return self.get_method_documentation(module, path, node, ["classmethod"])
+        if _has_decorator(node, "staticmethod"):
+            return self.get_method_documentation(module, path, node, ["staticmethod"])
+        return self.get_method_documentation(module, path, node)
+
+    def get_function_documentation(self, module: StaticModule, path: str, node: _Definition) -> Object:
+        """Get the documentation for a function.
+
+        Arguments:
+            module: The module in which the function is defined.
+            path: The dotted path of the function.
+            node: The function definition.
+
+        Returns:
+            The documented function object.
+        """
+        if isinstance(node, ast.ClassDef):
+            return self.get_class_documentation(module, path, node)
+        return self._finalize(
+            Function(
+                name=path.rsplit(".", 1)[-1],
+                path=path,
+                file_path=module.file_path,
+                docstring=ast.get_docstring(node),
+                signature=get_signature(node),
+                source=module.get_source(node),
+                properties=["async"] if isinstance(node, ast.AsyncFunctionDef) else [],
+            ),
+            module,
+        )
+
+    def get_method_documentation(
+        self,
+        module: StaticModule,
+        path: str,
+        node: _Function,
+        properties: Optional[list[str]] = None,
+    ) -> Method:
+        """Get the documentation for a method.
+
+        Arguments:
+            module: The module in which the method is defined.
+            path: The dotted path of the method.
+            node: The method definition.
+            properties: A list of properties to apply to the method.
+
+        Returns:
+            The documented method object.
+        """
+        name = path.rsplit(".", 1)[-1]
+        docstring = ast.get_docstring(node)
+        if docstring is None and not properties and RE_SPECIAL.match(name) and hasattr(object, name):
+            # Undocumented special methods inherit the docstring of `object`, that the loader discards.
+            docstring = ""
+        properties = list(properties or [])
+        if isinstance(node, ast.AsyncFunctionDef):
+            properties.append("async")
+        method = Method(
+            name=name,
+            path=path,
+            file_path=module.file_path,
+            docstring=docstring,
+            signature=get_signature(node, bound="classmethod" in properties),
+            properties=properties,
+            source=module.get_source(node),
+        )
+        self._finalize(method, module)
+        return method
+
+    def get_property_documentation(
+        self,
+        module: StaticModule,
+        path: str,
+        node: _Function,
+        class_node: ast.ClassDef,
+    ) -> Attribute:
+        """Get the documentation for a property.
+
+        Arguments:
+            module: The module in which the property is defined.
+            path: The dotted path of the property.
+            node: The definition of the property getter.
+            class_node: The definition of the class of the property.
+
+        Returns:
+            The documented attribute object (properties are considered attributes for now).
+        """
+        properties = ["property"]
+        if _has_decorator(node, "cached_property"):
+            properties.extend(["writable", "cached"])
+        else:
+            properties.append("writable" if _has_setter(node.name, class_node.body) else "readonly")
+        attribute = Attribute(
+            name=path.rsplit(".", 1)[-1],
+            path=path,
+            file_path=module.file_path,
+            docstring=ast.get_docstring(node),
+            attr_type=inspect.Signature.empty if node.returns is None else _annotation_to_string(node.returns),
+            properties=properties,
+            source=module.get_source(node),
+        )
+        self._finalize(attribute, module)
+        return attribute
+
+    def get_attribute_documentation(self, module: StaticModule, path: str, attribute_data: dict) -> Attribute:
+        """Get the documentation for an attribute.
+
+        Arguments:
+            module: The module in which the attribute is defined.
+            path: The dotted path of the attribute.
+            attribute_data: Docstring and annotation for this attribute.
+
+        Returns:
+            The documented attribute object.
+        """
+        attribute = Attribute(
+            name=path.rsplit(".", 1)[-1],
+            path=path,
+            file_path=module.file_path,
+            docstring=attribute_data.get("docstring", ""),
+            attr_type=attribute_data.get("annotation"),
+        )
+        self._finalize(attribute, module)
+        return attribute
@@ -0,0 +1,96 @@
+"""This module contains a helper to measure the time spent in each phase of the loading process.
+
+Phases can be nested: the time spent in a nested phase is not counted in the enclosing one.
+The phases measured by the loader and the command line are:
+
+- `import`: importing modules and getting objects from them
+- `source`: getting the source code of objects
+- `attributes`: parsing the source code to find attributes, their docstrings and annotations
+- `docstrings`: parsing docstrings
+- `serialize`: serializing objects
+- `other`: everything else (inspecting signatures, iterating on members, etc.)
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class Timings:
+    """Accumulate the time spent in each phase."""
+
+    def __init__(self) -> None:
+        """Initialize the object, starting the total time measure."""
+        self.phases: dict[str, float] = {}
+        """The time spent in each phase, in seconds."""
+        self._stack: list[list] = []
+        self._start = perf_counter()
+        self._end: float | None = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Measure the time spent in a phase.
+
+        Arguments:
+            name: The name of the phase.
+
+        Yields:
+            Nothing: We only yield to act as a context manager.
+        """
+        now = perf_counter()
+        if self._stack:
+            # Pause the enclosing phase.
+            parent_name, parent_start = self._stack[-1]
+            self.phases[parent_name] = self.phases.get(parent_name, 0.0) + now - parent_start
+        self._stack.append([name, now])
+        try:
+            yield
+        finally:
+            end = perf_counter()
+            _, start = self._stack.pop()
+            self.phases[name] = self.phases.get(name, 0.0) + end - start
+            if self._stack:
+                # Resume the enclosing phase.
+                self._stack[-1][1] = end
+
+    def stop(self) -> None:
+        """Stop the total time measure."""
+        self._end = perf_counter()
+
+    def as_dict(self) -> dict:
+        """Return the total time and the time spent in each phase.
+
+        Returns:
+            A JSON-serializable dictionary.
+        """
+        total = (self._end or perf_counter()) - self._start
+        phases = dict(self.phases)
+        phases["other"] = max(0.0, total - sum(phases.values()))
+        return {"total": total, "phases": phases}
+
+
+def summarize(objects_timings: list[dict]) -> dict:
+    """Sum the timings of several objects.
+
+    Arguments:
+        objects_timings: The timings of each object, as returned by [`Timings.as_dict`][pytkdocs.timings.Timings.as_dict],
+            with an additional `path` key.
+
+    Returns:
+        A JSON-serializable dictionary with the total time, the time spent in each phase,
+        and the timings of each object.
+    """
+    phases: dict[str, float] = {}
+    for object_timings in objects_timings:
+        for name, duration in object_timings["phases"].items():
+            phases[name] = phases.get(name, 0.0) + duration
+    return {
+        "total": sum(object_timings["total"] for object_timings in objects_timings),
+        "phases": phases,
+        "objects": objects_timings,
+    }
@@ -0,0 +1,26 @@
+"""A module listing its public members in `__all__`."""
+
+__all__ = ["PublicClass", "public_function"]
+__all__ += ["PUBLIC_ATTRIBUTE"]
+
+PUBLIC_ATTRIBUTE = 0
+"""Public attribute."""
+
+OTHER_ATTRIBUTE = 1
+"""Other attribute."""
+
+
+def public_function():
+    """Public function."""
+
+
+def other_function():
+    """Other function."""
+
+
+class PublicClass:
+    """Public class."""
+
+
+class OtherClass:
+    """Other class."""
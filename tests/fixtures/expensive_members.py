@@ -0,0 +1,32 @@
+RESOLVED = []
+
+
+class Expensive:
+    def __get__(self, instance, owner):
+        RESOLVED.append(self.name)
+        return 0
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+
+class Base:
+    inherited = Expensive()
+
+
+class Model(Base):
+    selected = Expensive()
+    not_selected = Expensive()
+
+    def method(self):
+        """Method docstring."""
+
+
+def __getattr__(name):
+    if name == "lazy":
+        RESOLVED.append(name)
+    raise AttributeError(name)
+
+
+def __dir__():
+    return [*globals(), "lazy"]
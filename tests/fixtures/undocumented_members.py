@@ -0,0 +1,30 @@
+VALUE = 1
+
+
+def function():
+    pass
+
+
+class Class:
+    attribute = 1
+
+    def __init__(self):
+        self.instance_attribute = 2
+
+    def __enter__(self):
+        return self
+
+    def method(self):
+        pass
+
+    @property
+    def readonly(self):
+        return self.attribute
+
+    @classmethod
+    def class_method(cls):
+        pass
+
+    @staticmethod
+    def static_method():
+        pass
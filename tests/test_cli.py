@@ -4,10 +4,22 @@ from __future__ import annotations
 
 import io
 import json
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
 from pytkdocs import cli, debug
+from pytkdocs.loader import loader_pool
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pytkdocs.loader import Loader
 
 
 def test_show_help(capsys: pytest.CaptureFixture) -> None:
@@ -117,3 +129,281 @@ def test_show_debug_info(capsys: pytest.CaptureFixture) -> None:
     assert "system" in captured
     assert "environment" in captured
     assert "packages" in captured
+
+
+def test_parse_serve_command() -> None:
+    """Parse the `serve` command and its socket path."""
+    parsed_args = cli.get_parser().parse_args(["serve", "--socket", "/tmp/pytkdocs.sock"])  # noqa: S108
+    assert parsed_args.command == "serve"
+    assert parsed_args.socket_path == "/tmp/pytkdocs.sock"  # noqa: S108
+    assert cli.get_parser().parse_args([]).command is None
+
+
+def test_echo_request_id(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture) -> None:
+    """Echo the request identifier in results and errors.
+
+    Parameters:
+        monkeypatch: Pytest fixture to patch objects.
+        capsys: Pytest fixture to capture output.
+    """
+    monkeypatch.setattr(
+        "sys.stdin",
+        io.StringIO(
+            '{"id": 1, "objects": [{"path": "pytkdocs.cli.main"}]}\n{"id": "b", "objects": [{"path": "eeeee"}]}\n',
+        ),
+    )
+    cli.main(["--line-by-line"])
+    results = {result["id"]: result for result in map(json.loads, capsys.readouterr().out.splitlines())}
+    assert results[1]["objects"][0]["path"] == "pytkdocs.cli.main"
+    assert "error" in results["b"]
+
+
+def test_answer_requests_out_of_order() -> None:
+    """Answer a quick request with an identifier before a slow one."""
+    output = io.StringIO()
+    release = threading.Event()
+
+    def process_json(json_input: str) -> dict:
+        if json.loads(json_input)["id"] == "slow":
+            release.wait(timeout=5)
+        else:
+            release.set()
+        return {}
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(cli, "process_json", process_json)
+        cli.process_lines(['{"id": "slow"}\n', '{"id": "quick"}\n'], output, jobs=2)
+    assert [json.loads(line)["id"] for line in output.getvalue().splitlines()] == ["quick", "slow"]
+
+
+def test_process_objects_in_worker_processes() -> None:
+    """Document objects in parallel processes, and merge results in order."""
+    paths = ["pytkdocs.cli.main", "tests.fixtures.parsing.docstrings", "pytkdocs.cli.get_parser"]
+
+    def make_config() -> dict:
+        return {"objects": [{"path": path} for path in paths]}
+
+    serial = cli.process_config(make_config())
+    parallel = cli.process_config({**make_config(), "workers": 2})
+    assert [obj["path"] for obj in parallel["objects"]] == paths
+    assert parallel == serial
+
+
+def test_timings_are_opt_in() -> None:
+    """Add timings to the output only when asked, by phase and by object."""
+    paths = ["tests.fixtures.pkg1", "tests.fixtures.parsing.docstrings"]
+    assert "timings" not in cli.process_config({"objects": [{"path": path} for path in paths]})
+    timings = cli.process_config({"objects": [{"path": path} for path in paths], "timings": True})["timings"]
+    assert [obj["path"] for obj in timings["objects"]] == paths
+    assert {"import", "source", "attributes", "docstrings", "serialize", "other"} <= set(timings["phases"])
+    assert sum(timings["phases"].values()) == pytest.approx(timings["total"])
+
+
+def test_keep_loading_errors_of_loaders_used_again(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Return the loading errors of an object, even if another thread uses the same loader right after.
+
+    Parameters:
+        monkeypatch: Pytest fixture to patch objects.
+    """
+    get_loader = loader_pool.loader
+
+    @contextmanager
+    def reused_loader(**options: Any) -> Iterator[Loader]:
+        with get_loader(**options) as loader:
+            loader.errors.append("error")
+            yield loader
+        # Another thread checks the loader out (and resets it) as soon as it is returned to the pool.
+        with get_loader(**options):
+            pass
+
+    monkeypatch.setattr(loader_pool, "loader", reused_loader)
+    _, loading_errors = cli.load_object({"path": "tests.fixtures.pkg1"})
+    assert loading_errors == ["error"]
+
+
+def test_return_partial_results_on_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Abandon a request when its timeout expires, returning the objects documented so far.
+
+    Parameters:
+        monkeypatch: Pytest fixture to patch objects.
+    """
+    load_object = cli.load_object
+    release = threading.Event()
+
+    def blocking_load_object(obj_config: dict, *args: Any) -> Any:
+        if obj_config["path"] == "blocking":
+            release.wait()
+        return load_object(obj_config, *args)
+
+    monkeypatch.setattr(cli, "load_object", blocking_load_object)
+    paths = ["tests.fixtures.pkg1", "blocking", "tests.fixtures.parsing.docstrings"]
+    try:
+        result = cli.process_config({"objects": [{"path": path} for path in paths], "timeout": 0.2})
+    finally:
+        release.set()
+    assert [obj["path"] for obj in result["objects"]] == ["tests.fixtures.pkg1"]
+    assert result["timeout_error"] == {"object": "blocking", "timeout": 0.2}
+    assert "blocking" in result["loading_errors"][-1]
+
+
+def test_return_partial_results_when_loader_reaches_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Report a timeout, and keep the objects documented so far, when the loader reaches the deadline first.
+
+    Parameters:
+        monkeypatch: Pytest fixture to patch objects.
+    """
+    load_object = cli.load_object
+
+    def late_load_object(obj_config: dict, timings: Any, deadline: float | None) -> Any:
+        if obj_config["path"] == "tests.fixtures.parsing.docstrings":
+            # The loader's deadline expires while the request is still waiting for the object.
+            deadline = time.monotonic() - 1
+        return load_object(obj_config, timings, deadline)
+
+    monkeypatch.setattr(cli, "load_object", late_load_object)
+    paths = ["tests.fixtures.pkg1", "tests.fixtures.parsing.docstrings"]
+    result = cli.process_config({"objects": [{"path": path} for path in paths], "timeout": 60})
+    assert [obj["path"] for obj in result["objects"]] == ["tests.fixtures.pkg1"]
+    assert result["timeout_error"] == {"object": "tests.fixtures.parsing.docstrings", "timeout": 60}
+
+    records = list(cli.stream_config({"objects": [{"path": path} for path in paths], "timeout": 60}))
+    assert records[0]["object"]["path"] == "tests.fixtures.pkg1"
+    assert records[-1]["timeout_error"] == result["timeout_error"]
+
+
+def test_no_timeout_error_when_deadline_expires_after_last_object(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Return every object when the timeout expires while the producer is only finishing.
+
+    Parameters:
+        monkeypatch: Pytest fixture to patch objects.
+    """
+    iter_results = cli.iter_results
+    release = threading.Event()
+
+    def slow_tail_iter_results(config: dict) -> Any:
+        yield from iter_results(config)
+        # For example, worker processes shutting down.
+        release.wait()
+
+    monkeypatch.setattr(cli, "iter_results", slow_tail_iter_results)
+    config = {"objects": [{"path": "tests.fixtures.pkg1"}], "timeout": 0.2}
+    try:
+        result = cli.process_config(dict(config, objects=[{"path": "tests.fixtures.pkg1"}]))
+        records = list(cli.stream_config(dict(config, objects=[{"path": "tests.fixtures.pkg1"}])))
+        output = io.BytesIO()
+        cli.write_config(dict(config, objects=[{"path": "tests.fixtures.pkg1"}]), output)
+    finally:
+        release.set()
+    assert [obj["path"] for obj in result["objects"]] == ["tests.fixtures.pkg1"]
+    assert "timeout_error" not in result
+    assert records[0]["object"]["path"] == "tests.fixtures.pkg1"
+    assert "timeout_error" not in records[-1]
+    written = json.loads(output.getvalue())
+    assert [obj["path"] for obj in written["objects"]] == ["tests.fixtures.pkg1"]
+    assert "timeout_error" not in written
+
+
+def test_no_timeout_error_when_in_time() -> None:
+    """Return every object and no timeout error when the request is fast enough."""
+    result = cli.process_config({"objects": [{"path": "tests.fixtures.pkg1"}], "timeout": 60})
+    assert result == cli.process_config({"objects": [{"path": "tests.fixtures.pkg1"}]})
+
+
+def test_write_nothing_when_an_object_fails(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture) -> None:
+    """Write nothing, and fail, when an object after the first one cannot be documented.
+
+    Parameters:
+        monkeypatch: Pytest fixture to patch objects.
+        capsys: Pytest fixture to capture output.
+    """
+    config = '{"objects": [{"path": "tests.fixtures.pkg1"}, {"path": "unknown_module_xyz"}]}'
+    monkeypatch.setattr("sys.stdin", io.StringIO(config))
+    with pytest.raises(ImportError):
+        cli.main([])
+    assert capsys.readouterr().out == ""
+
+
+def test_write_timings_as_bytes(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture) -> None:
+    """Write timings at the end of the output.
+
+    Parameters:
+        monkeypatch: Pytest fixture to patch objects.
+        capsys: Pytest fixture to capture output.
+    """
+    monkeypatch.setattr("sys.stdin", io.StringIO('{"objects": [{"path": "tests.fixtures.pkg1"}], "timings": true}'))
+    cli.main([])
+    assert json.loads(capsys.readouterr().out)["timings"]["objects"][0]["path"] == "tests.fixtures.pkg1"
+
+
+@pytest.mark.parametrize("stream", ["objects", "modules"])
+def test_stream_objects(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture, stream: str) -> None:
+    """Write each object as soon as it is ready, then the errors.
+
+    Parameters:
+        monkeypatch: Pytest fixture to patch objects.
+        capsys: Pytest fixture to capture output.
+        stream: The streaming mode.
+    """
+    monkeypatch.setattr(
+        "sys.stdin",
+        io.StringIO('{"objects": [{"path": "tests.fixtures.pkg1"}, {"path": "pytkdocs.cli.main"}]}'),
+    )
+    cli.main([f"--stream={stream}"])
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    objects = [record["object"]["path"] for record in records if "object" in record]
+    assert objects == ["tests.fixtures.pkg1", "pytkdocs.cli.main"]
+    assert "loading_errors" in records[-1]
+    submodules = [record for record in records if "submodule" in record]
+    assert bool(submodules) is (stream == "modules")
+
+
+def test_stream_line_by_line_with_errors(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture) -> None:
+    """Stream results of each line, ending with an error record if processing fails.
+
+    Parameters:
+        monkeypatch: Pytest fixture to patch objects.
+        capsys: Pytest fixture to capture output.
+    """
+    monkeypatch.setattr(
+        "sys.stdin",
+        io.StringIO('{"objects": [{"path": "pytkdocs.cli.main"}, {"path": "eeeee"}]}\n'),
+    )
+    cli.main(["--line-by-line", "--stream"])
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert records[0]["object"]["path"] == "pytkdocs.cli.main"
+    assert "error" in records[1]
+
+
+def test_write_whole_output_as_bytes(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture) -> None:
+    """Write the same result as `process_config`, directly as bytes.
+
+    Parameters:
+        monkeypatch: Pytest fixture to patch objects.
+        capsys: Pytest fixture to capture output.
+    """
+    config = '{"objects": [{"path": "tests.fixtures.pkg1"}, {"path": "tests.fixtures.parsing.docstrings"}]}'
+    monkeypatch.setattr("sys.stdin", io.StringIO(config))
+    cli.main([])
+    assert json.loads(capsys.readouterr().out) == cli.process_json(config)
+
+
+def _imported_modules(code: str) -> set[str]:
+    output = subprocess.check_output([sys.executable, "-c", f"{code}\nimport sys\nprint(*sys.modules)"], text=True)  # noqa: S603
+    return set(output.split())
+
+
+def test_startup_imports() -> None:
+    """Keep the startup fast: don't import the loading machinery before it's needed."""
+    modules = _imported_modules("import pytkdocs.cli")
+    for module in ("pytkdocs.loader", "pytkdocs.serializer", "pytkdocs.debug", "inspect", "concurrent.futures"):
+        assert module not in modules
+
+
+def test_trivial_request_imports() -> None:
+    """Only import the docstring parser that is used."""
+    modules = _imported_modules(
+        "from pytkdocs.cli import process_config\nprocess_config({'objects': [{'path': 'pytkdocs.properties'}]})",
+    )
+    assert "pytkdocs.parsers.docstrings.google" in modules
+    assert "pytkdocs.parsers.docstrings.numpy" not in modules
+    assert "docstring_parser" not in modules
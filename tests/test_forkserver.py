@@ -0,0 +1,61 @@
+"""Tests for [the `forkserver` module][pytkdocs.forkserver]."""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import sys
+
+import pytest
+
+from pytkdocs import cli, forkserver
+
+pytestmark = pytest.mark.skipif(not forkserver.fork_available(), reason="fork not available")
+
+
+def test_process_line_in_child(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Process a request in a child process, without importing anything in the parent.
+
+    Parameters:
+        monkeypatch: Pytest fixture to patch objects.
+    """
+    monkeypatch.delitem(sys.modules, "tests.fixtures.nested_class", raising=False)
+    result = json.loads(forkserver.process_line_in_child('{"objects": [{"path": "tests.fixtures.nested_class"}]}'))
+    assert result["objects"][0]["path"] == "tests.fixtures.nested_class"
+    assert "tests.fixtures.nested_class" not in sys.modules
+
+
+def test_report_dead_child(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Return an error when the child process dies.
+
+    Parameters:
+        monkeypatch: Pytest fixture to patch objects.
+    """
+    monkeypatch.setattr(forkserver, "process_line", lambda _: os._exit(3))
+    result = json.loads(forkserver.process_line_in_child('{"id": 1, "objects": []}'))
+    assert result["id"] == 1
+    assert "code 3" in result["error"]
+
+
+def test_preload_modules() -> None:
+    """Preload modules, reporting those that cannot be imported."""
+    errors = forkserver.preload(["pytkdocs.loader", "eeeeeeeeeeeeeeeeeee"])
+    assert len(errors) == 1
+    assert "eeeeeeeeeeeeeeeeeee" in errors[0]
+
+
+def test_fork_line_by_line(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture) -> None:
+    """Read standard input line by line, forking a child for each line.
+
+    Parameters:
+        monkeypatch: Pytest fixture to patch objects.
+        capsys: Pytest fixture to capture output.
+    """
+    monkeypatch.setattr(
+        "sys.stdin",
+        io.StringIO('{"objects": [{"path": "pytkdocs.cli.main"}]}\n{"objects": [{"path": "pytkdocs.cli.get_parser"}]}\n'),
+    )
+    cli.main(["--line-by-line", "--fork", "--preload", "pytkdocs.loader"])
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [result["objects"][0]["name"] for result in results] == ["main", "get_parser"]
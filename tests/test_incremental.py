@@ -0,0 +1,114 @@
+"""Tests for [the `incremental` module][pytkdocs.incremental]."""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytkdocs.incremental import ModuleTracker
+from pytkdocs.loader import Loader, LoaderPool
+from pytkdocs.serializer import serialize_object
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from pytkdocs.loader import ObjectNode
+    from pytkdocs.objects import Module
+
+
+@pytest.fixture
+def package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Write a package with two independent submodules, and a third one using the first one.
+
+    Arguments:
+        tmp_path: A temporary directory.
+        monkeypatch: The pytest monkeypatch fixture.
+
+    Yields:
+        The directory of the package.
+    """
+    package_dir = tmp_path / "incremental_package"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text('"""Package docstring."""\n')
+    (package_dir / "first.py").write_text('def function():\n    """First docstring."""\n')
+    (package_dir / "second.py").write_text('def function():\n    """Second docstring."""\n')
+    (package_dir / "user.py").write_text("from incremental_package.first import function\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield package_dir
+    for name in list(sys.modules):
+        if name.split(".", 1)[0] == "incremental_package":
+            del sys.modules[name]
+
+
+def _modify(path: Path, contents: str) -> None:
+    stat = path.stat()
+    path.write_text(contents)
+    # Make sure the modification time changes, even on file systems with a coarse resolution.
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_detect_changed_contents(package: Path) -> None:
+    """Report modules whose contents changed, not the ones that were only touched."""
+    __import__("incremental_package.first")
+    __import__("incremental_package.second")
+    tracker = ModuleTracker()
+    assert not tracker.find_changes()
+
+    _modify(package / "second.py", (package / "second.py").read_text())
+    assert not tracker.find_changes()
+
+    _modify(package / "first.py", 'def function():\n    """Changed docstring."""\n')
+    assert tracker.find_changes() == {"incremental_package.first"}
+
+
+def test_drop_dependent_modules(package: Path) -> None:  # noqa: ARG001
+    """Drop changed modules, their submodules, and the modules using them."""
+    for name in ("first", "second", "user"):
+        __import__(f"incremental_package.{name}")
+    tracker = ModuleTracker()
+    assert tracker.drop({"incremental_package.first"}) == {"incremental_package.first", "incremental_package.user"}
+    assert "incremental_package.second" in sys.modules
+
+    assert tracker.drop({"incremental_package"}) == {"incremental_package", "incremental_package.second"}
+    assert not [name for name in sys.modules if name.startswith("incremental_package")]
+
+
+def test_document_again_only_changed_modules(package: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Reuse the documentation of unchanged submodules, in a tree of their own."""
+    pool = LoaderPool()
+    pool.reuse_submodules = True
+    tracker = ModuleTracker()
+    documented = []
+    get_module_documentation = Loader.get_module_documentation
+
+    def spy(loader: Loader, node: ObjectNode, select_members: set[str] | bool | None = None) -> Module:
+        documented.append(node.dotted_path)
+        return get_module_documentation(loader, node, select_members)
+
+    monkeypatch.setattr(Loader, "get_module_documentation", spy)
+
+    def document() -> Module:
+        with tracker.request(), pool.loader() as loader:
+            return loader.get_object_documentation("incremental_package")
+
+    before = document()
+    assert pool.size() == 3
+
+    _modify(package / "first.py", 'def function():\n    """Changed docstring."""\n')
+    documented.clear()
+    after = document()
+    assert sorted(documented) == ["incremental_package", "incremental_package.first", "incremental_package.user"]
+    modules = {module.name: module for module in after.modules}
+    assert modules["first"].functions[0].docstring == "Changed docstring."
+
+    # Reused modules are not shared between object trees.
+    second = modules["second"]
+    assert second is not before.modules[1]
+    assert second.parent is after
+    assert second.functions[0].parent is second
+    assert before.modules[1].parent is before
+    assert serialize_object(second) == serialize_object(before.modules[1])
@@ -1,5 +1,7 @@
 """Tests for [the `loader` module][pytkdocs.loader]."""
 
+import functools
+import inspect
 import os
 import sys
 from pathlib import Path
@@ -8,7 +10,7 @@ import pytest
 from django.db.models.fields import CharField
 from marshmallow import fields
 
-from pytkdocs.loader import Loader, get_object_tree
+from pytkdocs.loader import Loader, LoaderPool, ObjectNode, get_object_tree
 from tests import FIXTURES_DIR
 
 
@@ -42,6 +44,27 @@ def test_can_find_class_attribute_real_path() -> None:
     assert leaf.dotted_path == "tests.fixtures.real_path.module_b.DefinedInModuleB.ATTRIBUTE"
 
 
+def test_real_path_nodes_share_root_and_file_path() -> None:
+    """Compute the root and the file path of the real module once for the whole tree."""
+    leaf = get_object_tree("tests.fixtures.real_path.module_a.DefinedInModuleB.method")
+    assert leaf.root is leaf.parent.root  # type: ignore[union-attr]
+    assert leaf.root.dotted_path == "tests.fixtures.real_path.module_b"
+    assert leaf.file_path.endswith("module_b.py")
+    assert leaf.parent.file_path is leaf.file_path  # type: ignore[union-attr]
+
+
+def test_classify_objects_in_one_pass() -> None:
+    """Tell the kind of objects from their type and their entry in the class `__dict__`."""
+    module = get_object_tree("tests.fixtures.cached_properties")
+    assert module.kind() == "module"
+    class_ = get_object_tree("tests.fixtures.cached_properties.C")
+    assert class_.kind() == "class"
+    assert get_object_tree("tests.fixtures.cached_properties.C.aaa").kind() == "cached_property"
+    assert get_object_tree("tests.fixtures.the_package.the_module.the_function").kind() == "function"
+    assert get_object_tree("tests.fixtures.the_package.the_module.TheClass.the_method").kind() == "method"
+    assert get_object_tree("tests.fixtures.inheriting_enum_Enum.MyEnum.A").kind() == "attribute"
+
+
 def test_cannot_find_module_attribute_real_path() -> None:
     """Find real path of a module attribute."""
     leaf = get_object_tree("tests.fixtures.real_path.module_a.ATTRIBUTE")
@@ -412,6 +435,50 @@ def test_loading_members_set_at_import_time() -> None:
     assert class_.methods
 
 
+def test_only_resolve_selected_members() -> None:
+    """Never get the values of members that are not selected."""
+    from tests.fixtures import expensive_members  # noqa: PLC0415
+
+    expensive_members.RESOLVED.clear()
+    loader = Loader()
+    obj = loader.get_object_documentation("tests.fixtures.expensive_members.Model", members={"selected", "method"})
+    assert [child.name for child in obj.children] == ["method", "selected"]
+    assert expensive_members.RESOLVED == ["selected"]
+
+    expensive_members.RESOLVED.clear()
+    loader.get_object_documentation("tests.fixtures.expensive_members", members={"Model"})
+    assert "lazy" not in expensive_members.RESOLVED
+
+
+def test_find_members_module_without_getmodule(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tell if classes and functions are defined in a module from their `__module__` attribute."""
+
+    def fail(obj: object) -> None:
+        raise AssertionError(f"getmodule called for {obj}")
+
+    get_object_tree("tests.fixtures.real_path.module_a")
+    monkeypatch.setattr(inspect, "getmodule", fail)
+    assert not Loader().get_object_documentation("tests.fixtures.real_path.module_a").classes
+    module_b = Loader().get_object_documentation("tests.fixtures.real_path.module_b")
+    assert [class_.name for class_ in module_b.classes] == ["DefinedInModuleB"]
+
+
+@pytest.mark.parametrize("static", [False, True])
+def test_select_module_members_from_dunder_all(static: bool) -> None:
+    """Only select the members listed in `__all__`."""
+    obj = Loader(members_from_all=True, static=static).get_object_documentation("tests.fixtures.dunder_all")
+    assert [child.name for child in obj.children] == ["PUBLIC_ATTRIBUTE", "PublicClass", "public_function"]
+
+    obj = Loader(members_from_all=True, static=static).get_object_documentation(
+        "tests.fixtures.dunder_all",
+        members={"other_function"},
+    )
+    assert [child.name for child in obj.children] == ["other_function"]
+
+    obj = Loader(static=static).get_object_documentation("tests.fixtures.dunder_all")
+    assert {"OTHER_ATTRIBUTE", "OtherClass", "other_function"} < {child.name for child in obj.children}
+
+
 def test_loading_inherited_members() -> None:
     """Select inherited members."""
     loader = Loader(inherited_members=True)
@@ -478,6 +545,30 @@ def test_unwrap_object_with_getattr_method_raising_exception() -> None:
     loader.get_object_documentation("tests.fixtures.unwrap_getattr_raises")
 
 
+def test_only_unwrap_callable_objects() -> None:
+    """Unwrap callable objects lazily, and never look up the `__wrapped__` attribute of other objects."""
+    looked_up = []
+
+    class Proxy:
+        def __getattr__(self, name: str) -> None:
+            looked_up.append(name)
+            raise AttributeError(name)
+
+    def function() -> None: ...
+
+    @functools.wraps(function)
+    def wrapper() -> None: ...
+
+    proxy_node = ObjectNode(Proxy(), "proxy")
+    assert proxy_node.kind() == "attribute"
+    assert proxy_node.obj is proxy_node.raw_obj
+    assert not looked_up
+
+    wrapper_node = ObjectNode(wrapper, "wrapper")
+    assert wrapper_node.raw_obj is wrapper
+    assert wrapper_node.obj is function
+
+
 def test_loading_coroutine() -> None:
     """Load documentation for a coroutine."""
     loader = Loader()
@@ -544,3 +635,68 @@ def test_load_decorated_function() -> None:
         assert child.category == "function"
         assert child.parent is child.root
         assert child.parent.name == "decorated_function"
+
+
+def test_stop_loading_after_deadline() -> None:
+    """Raise a timeout error when the deadline is reached."""
+    loader = Loader()
+    loader.deadline = 0
+    with pytest.raises(TimeoutError, match=r"tests\.fixtures\.pkg1"):
+        loader.get_object_documentation("tests.fixtures.pkg1")
+
+
+def test_reuse_pooled_loaders_with_same_options() -> None:
+    """Reuse idle loaders with the same options, resetting their errors."""
+    pool = LoaderPool()
+    with pool.loader(filters=["!^_"]) as loader:
+        loader.errors.append("error")
+        assert loader.filter_name_out("_private")
+    with pool.loader(filters=["!^_"]) as same_loader, pool.loader(filters=["!^_"]) as other_loader:
+        assert same_loader is loader
+        assert other_loader is not loader
+        assert not loader.errors
+    with pool.loader(filters=["!^__"]) as different_loader:
+        assert different_loader is not loader
+    assert pool.size() == 1
+    pool.clear()
+    assert pool.size() == 0
+
+
+def test_discard_least_recently_used_loaders() -> None:
+    """Keep loaders for a bounded number of option sets."""
+    pool = LoaderPool(max_options=1)
+    with pool.loader(docstring_style="google") as loader:
+        pass
+    with pool.loader(docstring_style="markdown"):
+        pass
+    with pool.loader(docstring_style="google") as new_loader:
+        assert new_loader is not loader
+
+
+def test_fall_back_to_static_loading_when_importing_fails(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Document modules that cannot be imported from their source files."""
+    package = tmp_path / "fallback_package"
+    package.mkdir()
+    (package / "__init__.py").write_text('"""Package docstring."""\n')
+    (package / "importable.py").write_text("def function():\n    pass\n")
+    (package / "failing.py").write_text('raise RuntimeError("boom")\n\ndef function():\n    """Docstring."""\n')
+    (package / "broken.py").write_text("def (:\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    loader = Loader()
+    obj = loader.get_object_documentation("fallback_package")
+    modules = {module.name: module for module in obj.modules}
+    assert set(modules) == {"importable", "failing"}
+    assert "static" not in modules["importable"].properties
+    assert "static" in modules["failing"].properties
+    assert modules["failing"].functions[0].docstring == "Docstring."
+    assert len(loader.errors) == 2
+    assert loader.errors[0].startswith("fallback_package.broken: SyntaxError")
+    assert loader.errors[1].startswith("fallback_package.failing: importing failed (RuntimeError('boom'))")
+
+    obj = loader.get_object_documentation("fallback_package.failing.function")
+    assert obj.docstring == "Docstring."
+    assert "static" in obj.properties
+
+    with pytest.raises(RuntimeError, match="boom"):
+        Loader(static_fallback=False).get_object_documentation("fallback_package.failing")
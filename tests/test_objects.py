@@ -2,6 +2,8 @@
 
 import os
 
+import pytest
+
 from pytkdocs.loader import Loader
 from pytkdocs.objects import Attribute, Class, Function, Method, Module, Object
 from tests import FIXTURES_DIR
@@ -92,6 +94,21 @@ def test_relative_file_path_for_leaf() -> None:
     )
 
 
+def test_relative_file_path_computed_once_per_file(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Share the relative file path with the children defined in the same file."""
+    obj = Loader().get_object_documentation("tests.fixtures.nested_class")
+    assert obj.relative_file_path == os.path.join("tests", "fixtures", "nested_class.py")
+
+    def fail(name: str) -> None:
+        raise AssertionError(f"{name} should not be imported again")
+
+    monkeypatch.setattr("importlib.import_module", fail)
+    for child in obj.children:
+        assert child.relative_file_path == obj.relative_file_path
+        for grandchild in child.children:
+            assert grandchild.relative_file_path == obj.relative_file_path
+
+
 def test_no_relative_file_path_for_non_existent_package() -> None:
     """Cannot find relative file path."""
     obj = Object(name="o", path="a.b.o", file_path="/some/non_existent/path/a/b/o.py")
@@ -0,0 +1,172 @@
+"""Tests for [the `parsers.source_index` module][pytkdocs.parsers.source_index]."""
+
+from __future__ import annotations
+
+import ast
+import importlib.util
+import inspect
+import os
+import sys
+from textwrap import dedent
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytkdocs.parsers.source_index import get_definition, get_index, getsource, getsourcelines
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+    from types import ModuleType
+
+SOURCE = '''
+import functools
+
+try:
+    import missing
+except ImportError:
+    class Fallback:
+        """Defined in an exception handler."""
+
+if True:
+    class Duplicate:
+        first = True
+else:
+    class Duplicate:
+        first = False
+
+
+def decorator(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+    return wrapper
+
+
+@decorator
+def decorated(a,
+              b):
+    return a + b
+
+
+def factory():
+    class Local:
+        def method(self):
+            pass
+    return Local
+
+
+@functools.total_ordering
+class Outer:
+    class Inner:
+        async def coroutine(self):
+            pass
+
+    @property
+    def value(self):
+        return 1
+
+    @value.setter
+    def value(self, value):
+        pass
+
+    def __lt__(self, other):
+        return False
+'''
+
+
+@pytest.fixture(name="module")
+def fixture_module(tmp_path: Path) -> Iterator[ModuleType]:
+    """Import a module written in a temporary directory.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+
+    Yields:
+        The imported module.
+    """
+    path = tmp_path / "indexed_module.py"
+    path.write_text(SOURCE)
+    spec = importlib.util.spec_from_file_location("indexed_module", path)
+    module = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+    sys.modules["indexed_module"] = module
+    spec.loader.exec_module(module)  # type: ignore[union-attr]
+    yield module
+    del sys.modules["indexed_module"]
+
+
+def test_same_source_lines_as_inspect(module: ModuleType) -> None:
+    """Return the same lines and line numbers as `inspect.getsourcelines`.
+
+    Parameters:
+        module: A module written in a temporary directory.
+    """
+    objects = [
+        module,
+        module.Fallback,
+        module.Duplicate,
+        module.decorated,
+        module.factory,
+        module.factory(),
+        module.factory().method,
+        module.Outer,
+        module.Outer.Inner,
+        module.Outer.Inner.coroutine,
+        module.Outer.value.fget,
+        module.Outer.value.fset,
+        module.Outer().__lt__,
+    ]
+    for obj in objects:
+        assert getsourcelines(obj) == inspect.getsourcelines(obj)
+
+
+def test_get_definitions_from_a_single_parse(module: ModuleType) -> None:
+    """Get the nodes of the module, classes and functions from the same syntax tree.
+
+    Parameters:
+        module: A module written in a temporary directory.
+    """
+    tree = get_definition(module)
+    assert isinstance(tree, ast.Module)
+    nodes = list(ast.walk(tree))
+    outer = get_definition(module.Outer)
+    assert isinstance(outer, ast.ClassDef)
+    assert outer.name == "Outer"
+    assert get_definition(module.Outer.Inner) in nodes
+    assert get_definition(module.Duplicate).body[0].value.value is True  # type: ignore[union-attr]
+    setter = get_definition(module.Outer.value.fset)
+    assert isinstance(setter, ast.FunctionDef)
+    assert setter in nodes
+    assert setter.decorator_list
+    assert get_definition(module.decorated).name == "decorated"  # type: ignore[union-attr]
+    assert get_definition(len) is None
+
+
+def test_fall_back_to_inspect_for_builtins() -> None:
+    """Raise the same errors as `inspect` for objects without Python source."""
+    with pytest.raises(TypeError):
+        getsourcelines(len)
+    with pytest.raises(TypeError):
+        getsource(sys)
+
+
+def test_rebuild_index_when_file_changes(module: ModuleType) -> None:
+    """Rebuild the index of a file when it is modified.
+
+    Parameters:
+        module: A module written in a temporary directory.
+    """
+    index = get_index(module.__file__)  # type: ignore[arg-type]
+    assert get_index(module.__file__) is index  # type: ignore[arg-type]
+    with open(module.__file__, "a") as file:  # type: ignore[arg-type]
+        file.write(
+            dedent("""
+            def added():
+                pass
+        """),
+        )
+    stat = os.stat(module.__file__)  # type: ignore[arg-type]
+    os.utime(module.__file__, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))  # type: ignore[arg-type]
+    new_index = get_index(module.__file__)  # type: ignore[arg-type]
+    assert new_index is not index
+    assert "def added():\n" in new_index.lines  # type: ignore[union-attr]
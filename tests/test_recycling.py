@@ -0,0 +1,78 @@
+"""Tests for [the `recycling` module][pytkdocs.recycling]."""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from pytkdocs import cli
+from pytkdocs.parsers.attributes import get_module_attributes
+from pytkdocs.recycling import Limits, Recycler, get_rss, read_lines
+from tests.fixtures.parsing import attributes
+
+
+def test_clear_caches_when_limit_is_reached() -> None:
+    """Clear caches when they contain too many entries, and report it."""
+    status_output = io.StringIO()
+    get_module_attributes(attributes)
+    recycler = Recycler(Limits(max_cache_entries=1), argv=[], status_output=status_output)
+    assert recycler.count_request() == "max-cache-entries"
+    recycler.recycle("max-cache-entries")
+    assert get_module_attributes.cache_info().currsize == 0
+    status = json.loads(status_output.getvalue())
+    assert status["reason"] == "max-cache-entries"
+    assert status["action"] == "clear-caches"
+
+
+def test_count_requests() -> None:
+    """Recycle after the configured number of requests."""
+    recycler = Recycler(Limits(max_requests=2), status_output=io.StringIO())
+    assert recycler.count_request() is None
+    assert recycler.count_request() == "max-requests"
+    recycler.recycle("max-requests")
+    assert recycler.requests == 0
+
+
+def test_check_memory_limit() -> None:
+    """Recycle when the process uses too much memory."""
+    if get_rss() is None:
+        pytest.skip("cannot measure memory on this platform")
+    assert Recycler(Limits(max_rss=1)).count_request() == "max-rss"
+
+
+def test_recycle_while_processing_lines() -> None:
+    """Recycle between requests, once the pending ones are done."""
+    output = io.StringIO()
+    status_output = io.StringIO()
+    recycler = Recycler(Limits(max_requests=1), status_output=status_output)
+    lines = ['{"id": 1, "objects": [{"path": "pytkdocs.cli.main"}]}\n', '{"objects": [{"path": "pytkdocs.cli"}]}\n']
+    cli.process_lines(lines, output, jobs=2, recycler=recycler)
+    assert len(output.getvalue().splitlines()) == 2
+    assert len(status_output.getvalue().splitlines()) == 2
+
+
+def test_read_lines_without_raw_stream() -> None:
+    """Read lines from streams that are not backed by a file."""
+    assert list(read_lines(io.StringIO("a\nb\n"))) == ["a\n", "b\n"]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="processes are only replaced on POSIX systems")
+def test_replace_process() -> None:
+    """Replace the process with a fresh one, without losing requests."""
+    lines = [json.dumps({"objects": [{"path": path}]}) for path in ("pytkdocs.cli.main", "pytkdocs.cli.get_parser")]
+    process = subprocess.run(
+        [sys.executable, "-m", "pytkdocs", "--line-by-line", "--max-requests", "1"],
+        input="\n".join(lines) + "\n",
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    results = [json.loads(line) for line in process.stdout.splitlines()]
+    assert [result["objects"][0]["name"] for result in results] == ["main", "get_parser"]
+    statuses = [json.loads(line) for line in process.stderr.splitlines()]
+    assert [status["action"] for status in statuses] == ["re-exec", "re-exec"]
@@ -0,0 +1,179 @@
+"""Tests for [the `result_cache` module][pytkdocs.result_cache]."""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import pickle
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from pytkdocs import cli, result_cache
+from pytkdocs.result_cache import DirectoryCache, SQLiteCache, fingerprint
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def test_store_and_get_results(tmp_path: Path) -> None:
+    """Get stored results back, from another cache instance."""
+    DirectoryCache(str(tmp_path)).set("abcdef", {"object": {"path": "a"}})
+    assert DirectoryCache(str(tmp_path)).get("abcdef") == {"object": {"path": "a"}}
+    assert DirectoryCache(str(tmp_path)).get("fedcba") is None
+    assert not [path for path in tmp_path.rglob("*") if path.suffix == ".tmp"]
+
+
+def test_get_results_from_read_only_directories(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Get stored results even when their modification time cannot be updated."""
+    DirectoryCache(str(tmp_path)).set("abcdef", {"object": {"path": "a"}})
+
+    def utime(path: str) -> None:
+        raise PermissionError(path)
+
+    monkeypatch.setattr(os, "utime", utime)
+    assert DirectoryCache(str(tmp_path)).get("abcdef") == {"object": {"path": "a"}}
+
+
+def test_evict_least_recently_used_results(tmp_path: Path) -> None:
+    """Remove the least recently used results when the size limit is reached."""
+    cache = DirectoryCache(str(tmp_path))
+    cache.set("aa1", {"value": "x" * 100})
+    cache.set("bb2", {"value": "y" * 100})
+    for index, key in enumerate(("bb2", "aa1")):
+        path = tmp_path / key[:2] / f"{key}.json"
+        os.utime(path, ns=(index, index))
+    cache.get("bb2")
+    cache.max_size = 150
+    cache.set("cc3", {"value": "z"})
+    assert cache.get("aa1") is None
+    assert cache.get("bb2") is not None
+    assert cache.get("cc3") is not None
+
+
+def test_fingerprint_changes_with_sources_and_options(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Compute new keys when source files or options change."""
+    package = tmp_path / "fingerprinted_package"
+    (package / "sub").mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    module = package / "sub" / "module.py"
+    module.write_text("A = 0\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    key = fingerprint({"path": "fingerprinted_package.sub"})
+    assert key is not None
+    assert fingerprint({"path": "fingerprinted_package.sub"}) == key
+    assert fingerprint({"path": "fingerprinted_package:sub", "filters": ["!^_"]}) != key
+    module.write_text("A = 1\n")
+    assert fingerprint({"path": "fingerprinted_package.sub"}) != key
+    assert fingerprint({"path": "sys"}) is None
+
+
+def test_return_cached_results_without_loading(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Reuse results as long as nothing changes."""
+    cache = DirectoryCache(str(tmp_path))
+    result = cli.process_object_config({"path": "tests.fixtures.the_package"}, cache=cache)
+
+    def fail(*args: Any, **kwargs: Any) -> None:  # noqa: ARG001
+        raise AssertionError("The object should not be loaded")
+
+    monkeypatch.setattr(cli, "load_object", fail)
+    assert cli.process_object_config({"path": "tests.fixtures.the_package"}, cache=cache) == result
+
+
+def test_cache_directory_option(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+) -> None:
+    """Enable the cache from the command line."""
+    monkeypatch.setattr(result_cache, "active", None)
+    config = '{"objects": [{"path": "tests.fixtures.the_package"}]}'
+    monkeypatch.setattr("sys.stdin", io.StringIO(config))
+    cli.main(["--cache-dir", str(tmp_path), "--cache-size", "10"])
+    assert isinstance(result_cache.active, DirectoryCache)
+    assert result_cache.active.max_size == 10 * 1024 * 1024
+    assert list(tmp_path.rglob("*.json"))
+    assert json.loads(capsys.readouterr().out) == cli.process_json(config)
+
+
+def test_share_sqlite_cache_between_processes(tmp_path: Path) -> None:
+    """Store results in a database usable from other processes."""
+    cache = SQLiteCache(str(tmp_path / "cache.db"))
+    cache.set("abcdef", {"object": {"path": "a"}})
+    copy = pickle.loads(pickle.dumps(cache))  # noqa: S301
+    assert copy.get("abcdef") == {"object": {"path": "a"}}
+    assert copy.get("fedcba") is None
+
+
+def test_evict_least_recently_used_results_from_database(tmp_path: Path) -> None:
+    """Remove the least recently used results when the size limit is reached."""
+    cache = SQLiteCache(str(tmp_path / "cache.db"), max_size=250)
+    cache.set("aa1", {"value": "x" * 100})
+    cache.set("bb2", {"value": "y" * 100})
+    cache.get("aa1")
+    cache.set("cc3", {"value": "z" * 100})
+    assert cache.get("aa1") is not None
+    assert cache.get("bb2") is None
+    assert cache.get("cc3") is not None
+
+
+def test_wait_for_claimed_results(tmp_path: Path) -> None:
+    """Wait for results being computed elsewhere instead of computing them again."""
+    cache = SQLiteCache(str(tmp_path / "cache.db"))
+    assert cache.claim("abcdef")
+    assert not cache.claim("abcdef")
+
+    def compute() -> None:
+        time.sleep(0.1)
+        cache.set("abcdef", {"object": {"path": "a"}})
+        cache.release("abcdef")
+
+    thread = threading.Thread(target=compute)
+    thread.start()
+    assert cache.wait("abcdef") == {"object": {"path": "a"}}
+    thread.join()
+
+    assert cache.claim("fedcba")
+    cache.release("fedcba")
+    assert cache.wait("fedcba") is None
+
+
+def test_reclaim_abandoned_claims(tmp_path: Path) -> None:
+    """Consider claims abandoned after some time."""
+    cache = SQLiteCache(str(tmp_path / "cache.db"), claim_timeout=0)
+    assert cache.claim("abcdef")
+    time.sleep(0.01)
+    assert cache.claim("abcdef")
+
+
+def test_compute_results_claimed_by_crashed_processes(tmp_path: Path) -> None:
+    """Stop waiting for abandoned claims, and for claims outliving the request deadline."""
+    cache = SQLiteCache(str(tmp_path / "cache.db"))
+    # A claim left by a process that crashed long ago.
+    cache._connection.execute("INSERT INTO claims (key, claimed) VALUES (?, ?)", ("abcdef", time.time() - 3600))
+    start = time.monotonic()
+    assert cache.wait("abcdef") is None
+    assert time.monotonic() - start < 1
+
+    assert cache.claim("fedcba")
+    start = time.monotonic()
+    assert cache.wait("fedcba", deadline=start + 0.2) is None
+    assert time.monotonic() - start < 1
+
+
+def test_compute_results_instead_of_waiting_for_crashed_processes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Document objects locally when their results were claimed by a process that crashed."""
+    cache = SQLiteCache(str(tmp_path / "cache.db"))
+    monkeypatch.setattr(result_cache, "fingerprint", lambda obj_config: "abcdef")
+    cache._connection.execute("INSERT INTO claims (key, claimed) VALUES (?, ?)", ("abcdef", time.time() - 3600))
+    start = time.monotonic()
+    result = cli.process_object_config({"path": "tests.fixtures.the_package"}, cache=cache)
+    assert time.monotonic() - start < 5
+    assert result[0]["path"] == "tests.fixtures.the_package"
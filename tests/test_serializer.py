@@ -1 +1,53 @@
 """Tests for [the `serializer` module][pytkdocs.serializer]."""
+
+import io
+import json
+
+import pytest
+
+from pytkdocs import serializer
+from pytkdocs.loader import Loader
+from pytkdocs.serializer import iter_serialized_modules, serialize_object, write_object
+
+
+def test_serialize_modules_separately() -> None:
+    """Serialize each module subtree separately, parents first."""
+    package = Loader().get_object_documentation("tests.fixtures.pkg1")
+    records = list(iter_serialized_modules(package))
+    assert [record["path"] for record in records] == [
+        "tests.fixtures.pkg1",
+        "tests.fixtures.pkg1.pkg2",
+        "tests.fixtures.pkg1.pkg2.pkg3",
+        "tests.fixtures.pkg1.pkg2.pkg3.pkg4",
+        "tests.fixtures.pkg1.pkg2.pkg3.pkg4.pkg5",
+    ]
+    for parent, child in zip(records, records[1:]):
+        assert child["path"] in parent["modules"]
+        assert child["path"] not in parent["children"]
+
+    # Putting the pieces back together gives the whole tree.
+    for parent, child in reversed(list(zip(records, records[1:]))):
+        parent["children"][child["path"]] = child
+    assert records[0] == serialize_object(package)
+
+
+def test_write_object_as_bytes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Write the same JSON as the standard library would.
+
+    Parameters:
+        monkeypatch: Pytest fixture to patch objects.
+    """
+    monkeypatch.setattr(serializer, "orjson", None)
+    package = Loader().get_object_documentation("tests.fixtures.pkg1")
+    writer = io.BytesIO()
+    write_object(package, writer)
+    assert writer.getvalue() == json.dumps(serialize_object(package)).encode()
+
+
+def test_write_object_with_orjson() -> None:
+    """Write equivalent JSON with orjson."""
+    pytest.importorskip("orjson")
+    package = Loader().get_object_documentation("tests.fixtures.pkg1")
+    writer = io.BytesIO()
+    write_object(package, writer)
+    assert json.loads(writer.getvalue()) == serialize_object(package)
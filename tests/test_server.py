@@ -0,0 +1,133 @@
+"""Tests for [the `server` module][pytkdocs.server]."""
+
+from __future__ import annotations
+
+import json
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytkdocs.server import Server, remove_stale_socket
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets not supported")
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> Iterator[str]:
+    """Run a server in a thread, and yield the path of its socket.
+
+    Parameters:
+        tmp_path: Pytest fixture to get a temporary directory.
+
+    Yields:
+        The socket path.
+    """
+    path = str(tmp_path / "pytkdocs.sock")
+    with Server(path) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield path
+        server.shutdown()
+        thread.join()
+
+
+def _request(client: socket.socket, reader: socket.SocketIO, path: str) -> dict:
+    client.sendall(json.dumps({"objects": [{"path": path}]}).encode() + b"\n")
+    return json.loads(reader.readline())
+
+
+def test_serve_several_clients(socket_path: str) -> None:
+    """Answer requests of several concurrent clients, each on its own connection.
+
+    Parameters:
+        socket_path: The path of the server socket.
+    """
+    with socket.socket(socket.AF_UNIX) as client1, socket.socket(socket.AF_UNIX) as client2:
+        client1.connect(socket_path)
+        client2.connect(socket_path)
+        reader1 = client1.makefile("rb")
+        reader2 = client2.makefile("rb")
+        assert _request(client1, reader1, "pytkdocs.cli.main")["objects"][0]["path"] == "pytkdocs.cli.main"
+        assert _request(client2, reader2, "pytkdocs.cli.get_parser")["objects"][0]["name"] == "get_parser"
+        assert _request(client1, reader1, "pytkdocs.server.serve")["objects"][0]["category"] == "function"
+
+
+def test_serve_errors_as_json(socket_path: str) -> None:
+    """Return errors as JSON and keep the connection open.
+
+    Parameters:
+        socket_path: The path of the server socket.
+    """
+    with socket.socket(socket.AF_UNIX) as client:
+        client.connect(socket_path)
+        reader = client.makefile("rb")
+        assert "error" in _request(client, reader, "eeeeeeeeeeeeeeeeeee")
+        assert _request(client, reader, "pytkdocs.cli.main")["objects"]
+
+
+def test_remove_stale_socket_only(tmp_path: Path) -> None:
+    """Never remove regular files when cleaning up sockets.
+
+    Parameters:
+        tmp_path: Pytest fixture to get a temporary directory.
+    """
+    regular_file = tmp_path / "file"
+    regular_file.write_text("contents")
+    remove_stale_socket(str(regular_file))
+    assert regular_file.exists()
+    remove_stale_socket(str(tmp_path / "missing"))
+
+
+def test_never_remove_socket_of_running_server(socket_path: str, tmp_path: Path) -> None:
+    """Remove sockets left behind by stopped servers, but refuse to take the socket of a running one.
+
+    Parameters:
+        socket_path: The path of the server socket.
+        tmp_path: Pytest fixture to get a temporary directory.
+    """
+    with pytest.raises(OSError, match="already listening"):
+        remove_stale_socket(socket_path)
+    with socket.socket(socket.AF_UNIX) as client:
+        client.connect(socket_path)
+        assert _request(client, client.makefile("rb"), "pytkdocs.cli.main")["objects"]
+
+    stale_path = tmp_path / "stale.sock"
+    with socket.socket(socket.AF_UNIX) as stopped_server:
+        stopped_server.bind(str(stale_path))
+    remove_stale_socket(str(stale_path))
+    assert not stale_path.exists()
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGTERM") or sys.platform == "win32", reason="POSIX signals only")
+def test_remove_socket_when_terminated(tmp_path: Path) -> None:
+    """Stop serving and remove the socket file when terminated.
+
+    Parameters:
+        tmp_path: Pytest fixture to get a temporary directory.
+    """
+    path = tmp_path / "pytkdocs.sock"
+    process = subprocess.Popen([sys.executable, "-m", "pytkdocs", "serve", "--socket", str(path)])  # noqa: S603
+    try:
+        deadline = time.monotonic() + 30
+        while not path.exists():
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+        # Once a request is answered, the server is serving (and handling signals).
+        with socket.socket(socket.AF_UNIX) as client:
+            client.connect(str(path))
+            assert _request(client, client.makefile("rb"), "pytkdocs.cli.main")["objects"]
+        process.terminate()
+        assert process.wait(timeout=30) == 0
+    finally:
+        process.kill()
+    assert not path.exists()
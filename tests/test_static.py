@@ -0,0 +1,168 @@
+"""Tests for [the `static` module][pytkdocs.static]."""
+
+import sys
+from pathlib import Path
+from textwrap import dedent
+
+import pytest
+
+from pytkdocs.loader import Loader
+from pytkdocs.serializer import serialize_object
+
+MODULE = '''
+    """Module docstring."""
+
+    import os
+    from .sibling import helper
+
+    VALUE: int = 1
+    """Value docstring."""
+
+    raise RuntimeError("this module must not be imported")
+
+
+    def function(a, /, b: "os.PathLike" = None, *args, c: int = 2 * 3, **kwargs) -> str:
+        """Function docstring."""
+
+
+    async def coroutine():
+        """Coroutine docstring."""
+
+
+    alias = function
+
+
+    class Base:
+        """Base docstring."""
+
+
+    class Child(Base, os.PathLike):
+        """Child docstring."""
+
+        ATTRIBUTE = 0
+        """Attribute docstring."""
+
+        def __init__(self, x):
+            self.instance_attribute = x
+            """Instance attribute docstring."""
+
+        @classmethod
+        def from_x(cls, x):
+            """Class method docstring."""
+
+        @staticmethod
+        def static(x):
+            """Static method docstring."""
+
+        @property
+        def prop(self) -> int:
+            """Property docstring."""
+
+        @prop.setter
+        def prop(self, value):
+            pass
+'''
+
+
+@pytest.fixture
+def package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Write a package that raises an error when imported.
+
+    Arguments:
+        tmp_path: A temporary directory.
+        monkeypatch: The pytest monkeypatch fixture.
+
+    Returns:
+        The name of the package.
+    """
+    package_dir = tmp_path / "static_package"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text('"""Package docstring."""\nraise RuntimeError\n')
+    (package_dir / "module.py").write_text(dedent(MODULE))
+    (package_dir / "sibling.py").write_text("def helper():\n    pass\n")
+    (package_dir / "broken.py").write_text("def (:\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return "static_package"
+
+
+def test_document_package_without_importing_it(package: str) -> None:
+    """Document a package whose modules cannot be imported."""
+    loader = Loader(static=True)
+    obj = loader.get_object_documentation(package)
+    assert package not in sys.modules
+    assert obj.docstring == "Package docstring."
+    assert obj.relative_file_path == "static_package/__init__.py"
+    assert [module.name for module in obj.modules] == ["module", "sibling"]
+    assert len(loader.errors) == 1
+    assert loader.errors[0].startswith("static_package.broken: ")
+
+    module = obj.modules[0]
+    assert module.relative_file_path == "static_package/module.py"
+    assert "static" in module.properties
+    assert {child.name for child in module.children} == {"VALUE", "function", "coroutine", "alias", "Base", "Child"}
+
+
+def test_document_functions_signatures(package: str) -> None:
+    """Build signatures from the syntax tree."""
+    function = Loader(static=True).get_object_documentation(f"{package}.module.function")
+    serialized = serialize_object(function)
+    assert serialized["signature"] == {
+        "parameters": [
+            {"name": "a", "kind": "POSITIONAL_ONLY"},
+            {"name": "b", "kind": "POSITIONAL_OR_KEYWORD", "annotation": "os.PathLike", "default": "None"},
+            {"name": "args", "kind": "VAR_POSITIONAL"},
+            {"name": "c", "kind": "KEYWORD_ONLY", "annotation": "int", "default": "2 * 3"},
+            {"name": "kwargs", "kind": "VAR_KEYWORD"},
+        ],
+        "return_annotation": "str",
+    }
+    assert function.source.line_start == 13  # type: ignore[union-attr]
+
+    coroutine = Loader(static=True).get_object_documentation(f"{package}.module.coroutine")
+    assert "async" in coroutine.properties
+
+    alias = Loader(static=True).get_object_documentation(f"{package}.module.alias")
+    assert alias.category == "function"
+    assert alias.name == "alias"
+    assert alias.docstring == "Function docstring."
+
+
+def test_document_classes(package: str) -> None:
+    """Document classes members from the syntax tree."""
+    obj = Loader(static=True).get_object_documentation(f"{package}.module.Child")
+    assert obj.bases == [f"{package}.module.Base", "os.PathLike"]  # type: ignore[attr-defined]
+    children = {child.name: child for child in obj.children}
+    assert set(children) == {"ATTRIBUTE", "__init__", "from_x", "static", "prop"}
+    assert children["ATTRIBUTE"].docstring == "Attribute docstring."
+    assert children["from_x"].properties == ["classmethod", "static"]
+    assert [param.name for param in children["from_x"].signature.parameters.values()] == ["x"]  # type: ignore[attr-defined]
+    assert children["static"].properties == ["staticmethod", "static"]
+    assert children["prop"].properties == ["property", "writable", "static"]
+    assert children["prop"].type == "int"  # type: ignore[attr-defined]
+
+
+def test_follow_imports_to_definitions(package: str) -> None:
+    """Document imported objects where they are defined."""
+    obj = Loader(static=True).get_object_documentation(f"{package}.module.helper")
+    assert obj.path == f"{package}.sibling.helper"
+
+
+def test_missing_attribute(package: str) -> None:
+    """Raise an error when an object does not exist."""
+    with pytest.raises(AttributeError):
+        Loader(static=True).get_object_documentation(f"{package}.module:Child.missing")
+
+
+@pytest.mark.parametrize("path", ["tests.fixtures.the_package", "tests.fixtures.undocumented_members"])
+def test_same_output_as_dynamic_loading(path: str) -> None:
+    """Document objects like when importing them, with the same defaults for missing docstrings."""
+    static = serialize_object(Loader(static=True).get_object_documentation(path))
+    dynamic = serialize_object(Loader().get_object_documentation(path))
+
+    def remove_static_property(serialized: dict) -> None:
+        serialized["properties"].remove("static")
+        for child in serialized["children"].values():
+            remove_static_property(child)
+
+    remove_static_property(static)
+    assert static == dynamic
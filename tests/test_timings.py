@@ -0,0 +1,35 @@
+"""Tests for [the `timings` module][pytkdocs.timings]."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from pytkdocs.timings import Timings, summarize
+
+
+def test_nested_phases_are_excluded_from_enclosing_ones() -> None:
+    """Count time spent in a nested phase only once, in the nested phase."""
+    timings = Timings()
+    with timings.phase("outer"):
+        time.sleep(0.01)
+        with timings.phase("inner"):
+            time.sleep(0.05)
+    timings.stop()
+    result = timings.as_dict()
+    assert result["phases"]["inner"] >= 0.05
+    assert 0.01 <= result["phases"]["outer"] < 0.05
+    assert sum(result["phases"].values()) == pytest.approx(result["total"])
+
+
+def test_summarize_objects_timings() -> None:
+    """Sum phases of every object."""
+    objects = [
+        {"path": "a", "total": 1.0, "phases": {"import": 0.5, "other": 0.5}},
+        {"path": "b", "total": 2.0, "phases": {"import": 1.5, "source": 0.5}},
+    ]
+    summary = summarize(objects)
+    assert summary["total"] == 3.0
+    assert summary["phases"] == {"import": 2.0, "other": 0.5, "source": 0.5}
+    assert summary["objects"] == objects